@@ -1,10 +1,24 @@
 # main.py
+import os
+import re
+import sys
 import json
+import mmap
+import time
+import pickle
+import random
+import hashlib
+import tempfile
+import threading
+import multiprocessing
 import requests
 import PyPDF2
 import asyncio
 import aiohttp
-from io import BytesIO
+import rdflib
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
 from rdflib import Graph, Namespace
 from rdflib.namespace import RDF, RDFS
@@ -14,87 +28,581 @@ CIDS = Namespace("https://ontology.commonapproach.org/cids#")
 ORG = Namespace("http://ontology.eil.utoronto.ca/tove/organization#")
 SDG = Namespace("https://codelist.commonapproach.org/SDGImpacts/")
 
-def load_cids_ontology(ontology_urls):
+# Root of this repository (local copies of shared files are read from it)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Local copies of the ontologies in this repository, used instead of downloading them
+LOCAL_ONTOLOGY_FILES = {
+    "https://ontology.commonapproach.org/cids.ttl": os.path.join(REPO_ROOT, "cids.ttl"),
+    "https://codelist.commonapproach.org/SDGImpacts/SDGImpacts.ttl": os.path.join(
+        REPO_ROOT, "validation", "shacl-validation", "cache", "codelists", "SDGImpacts.ttl"),
+}
+
+# Ontology cache: downloaded ontology files and their parsed graphs (pickled, keyed by content hash).
+# LANGTEST_ONTOLOGY_CACHE sets another directory.
+ONTOLOGY_CACHE_DIR = os.environ.get("LANGTEST_ONTOLOGY_CACHE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".ontology-cache")
+
+# Seconds before a downloaded ontology is revalidated with its server (ETag / Last-Modified)
+ONTOLOGY_MAX_AGE = 24 * 60 * 60
+ONTOLOGY_REQUEST_TIMEOUT = 30
+
+# Bumped when the layout of the pickled graphs changes
+ONTOLOGY_CACHE_VERSION = 1
+
+
+def file_sha256(file_path):
+    """Returns the SHA-256 checksum of a file."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_file_atomically(file_path, data):
+    """Writes bytes to a temporary file and renames it, so readers never see a partial file."""
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    temp_file = f"{file_path}.{os.getpid()}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+    os.replace(temp_file, file_path)
+
+
+def load_download_metadata():
+    """Loads the metadata (ETag, Last-Modified, checksum, time of last check) of the downloaded ontologies."""
+    try:
+        with open(os.path.join(ONTOLOGY_CACHE_DIR, "downloads", "metadata.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_download_metadata(metadata):
+    """Writes the metadata of the downloaded ontologies."""
+    data = json.dumps(metadata, indent=2, sort_keys=True).encode('utf-8')
+    write_file_atomically(os.path.join(ONTOLOGY_CACHE_DIR, "downloads", "metadata.json"), data)
+
+
+def resolve_ontology_source(url, metadata, refresh=False):
+    """
+    Finds the local file to parse for an ontology URL, downloading it if needed.
+
+    The repository's own copy is used when there is one. Otherwise the file is downloaded
+    into the cache; a cached download is revalidated with a conditional request once it is
+    older than ONTOLOGY_MAX_AGE (or always with refresh), and used as is when the server
+    cannot be reached.
+
+    Args:
+        url (str): URL of the ontology file.
+        metadata (dict): Metadata of the downloaded ontologies, updated in place.
+        refresh (bool): Revalidate cached downloads regardless of their age.
+
+    Returns:
+        tuple: (path of the file, or the downloaded content if it could not be cached,
+                its SHA-256 checksum).
+    """
+    local_file = LOCAL_ONTOLOGY_FILES.get(url)
+    if local_file and os.path.isfile(local_file):
+        return local_file, file_sha256(local_file)
+
+    file_name = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16] + "-" + os.path.basename(urlsplit(url).path)
+    cached_file = os.path.join(ONTOLOGY_CACHE_DIR, "downloads", file_name)
+    entry = metadata.get(url, {})
+    cached = os.path.isfile(cached_file) and entry.get('sha256') == file_sha256(cached_file)
+    if cached and not refresh and time.time() - entry.get('checked', 0) < ONTOLOGY_MAX_AGE:
+        return cached_file, entry['sha256']
+
+    headers = {}
+    if cached and entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if cached and entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    try:
+        response = requests.get(url, headers=headers, timeout=ONTOLOGY_REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached:
+            metadata[url] = dict(entry, checked=int(time.time()))
+            return cached_file, entry['sha256']
+        response.raise_for_status()
+        if not response.content:
+            raise requests.exceptions.RequestException("downloaded file is empty")
+    except requests.exceptions.RequestException as e:
+        if cached:
+            print(f"--> Could not revalidate {url} ({e}), using the cached copy")
+            return cached_file, entry['sha256']
+        raise
+
+    sha256 = hashlib.sha256(response.content).hexdigest()
+    try:
+        write_file_atomically(cached_file, response.content)
+    except OSError as e:
+        # The cache is best-effort: parse the downloaded content directly
+        print(f"Warning: Could not cache the ontology from {url}: {e}")
+        return response.content, sha256
+    metadata[url] = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'sha256': sha256,
+        'checked': int(time.time()),
+    }
+    return cached_file, sha256
+
+
+def describe_ontology_source(source):
+    """Returns ' from <path>' for an ontology file, or '' for downloaded content, for progress messages."""
+    return "" if isinstance(source, bytes) else f" from {source}"
+
+
+def parsed_ontology_file(cache_key):
+    """Returns the path of the pickled graph for a cache key."""
+    return os.path.join(ONTOLOGY_CACHE_DIR, "parsed", f"{cache_key}.pickle")
+
+
+def parse_ontology(source, url):
+    """
+    Parses an ontology into its namespaces and triples.
+
+    The URL is used as the base IRI, so relative IRIs resolve as if the file had been
+    parsed from the URL.
+
+    Args:
+        source (str or bytes): Path of the Turtle file, or its content.
+        url (str): URL the file was published at.
+
+    Returns:
+        tuple: (list of (prefix, namespace) bindings, list of triples).
+    """
+    g = Graph()
+    if isinstance(source, bytes):
+        g.parse(data=source, format='turtle', publicID=url)
+    else:
+        g.parse(source, format='turtle', publicID=url)
+    # Share one object per distinct term, so pickle stores (and later rebuilds) each IRI only once
+    terms = {}
+    triples = [tuple(terms.setdefault(term, term) for term in triple) for triple in g]
+    return list(g.namespaces()), triples
+
+
+def parse_ontology_to_cache(source, url, cache_key):
+    """
+    Parses an ontology and pickles its namespaces and triples into the cache.
+
+    Runs in a worker process when several ontologies need parsing. The cache is
+    best-effort: if the pickle cannot be written, the parsed data is returned instead.
+
+    Args:
+        source (str or bytes): Path of the Turtle file, or its content.
+        url (str): URL the file was published at.
+        cache_key (str): Cache key of the parsed graph (see parsed_ontology_file).
+
+    Returns:
+        tuple: (None, None) if the parsed graph was cached, otherwise
+               (parsed data (see parse_ontology), error message).
+    """
+    data = parse_ontology(source, url)
+    try:
+        write_file_atomically(parsed_ontology_file(cache_key), pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError as e:
+        return data, str(e)
+    return None, None
+
+
+def load_cids_ontology(ontology_urls, refresh=False):
     """
     Loads the CIDS ontology from one or more URLs into an RDFLib graph.
 
+    Ontologies come from the repository's own files when available, otherwise from downloads
+    kept in ONTOLOGY_CACHE_DIR. Parsed graphs are cached in pickled form, keyed by the checksum
+    of the source file and the rdflib version, so a warm start only unpickles them and needs no
+    network. Sources that are not cached yet are parsed in parallel worker processes.
+
     Args:
         ontology_urls (list): A list of URLs pointing to the ontology files.
+        refresh (bool): Revalidate downloaded ontologies with their servers regardless of age.
 
     Returns:
         rdflib.Graph: A graph containing the CIDS ontology, or an empty graph if loading fails.
     """
-    g = Graph()
     print("Loading CIDS ontology from sources...")
+    start_time = time.time()
+    metadata = load_download_metadata()
+    sources = []
     for url in ontology_urls:
         try:
-            # rdflib's parse function can handle URLs directly and auto-detect format
-            print(f"--> Fetching from {url}")
-            g.parse(url, format='turtle') # Explicitly setting format for .ttl file
+            source, sha256 = resolve_ontology_source(url, metadata, refresh)
         except Exception as e:
-            print(f"An error occurred while parsing the ontology from {url}: {e}")
-    
+            print(f"An error occurred while fetching the ontology from {url}: {e}")
+            continue
+        cache_key = hashlib.sha256(
+            f"{ONTOLOGY_CACHE_VERSION}|{rdflib.__version__}|{url}|{sha256}".encode('utf-8')).hexdigest()
+        sources.append((url, source, cache_key))
+    if metadata:
+        try:
+            save_download_metadata(metadata)
+        except OSError as e:
+            print(f"Warning: Could not save the ontology download metadata: {e}")
+
+    # Parse the sources missing from the cache, in parallel when there are several
+    missing = [source for source in sources if not os.path.isfile(parsed_ontology_file(source[2]))]
+    parsed = {}
+    failed = set()
+
+    def collect(url, result):
+        data, cache_error = result
+        if data is not None:
+            print(f"Warning: Could not cache the parsed ontology from {url}: {cache_error}")
+            parsed[url] = data
+
+    if len(missing) > 1 and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(missing), os.cpu_count()),
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = [(url, source, executor.submit(parse_ontology_to_cache, source, url, cache_key))
+                       for url, source, cache_key in missing]
+            for url, source, future in futures:
+                print(f"--> Parsing {url}{describe_ontology_source(source)}")
+                try:
+                    collect(url, future.result())
+                except Exception as e:
+                    print(f"An error occurred while parsing the ontology from {url}: {e}")
+                    failed.add(url)
+    else:
+        for url, source, cache_key in missing:
+            print(f"--> Parsing {url}{describe_ontology_source(source)}")
+            try:
+                collect(url, parse_ontology_to_cache(source, url, cache_key))
+            except Exception as e:
+                print(f"An error occurred while parsing the ontology from {url}: {e}")
+                failed.add(url)
+
+    g = Graph()
+    for url, source, cache_key in sources:
+        if url in failed:
+            continue
+        data = parsed.get(url)
+        if data is None:
+            try:
+                with open(parsed_ontology_file(cache_key), 'rb') as f:
+                    data = pickle.load(f)
+            except Exception as e:
+                # An unreadable cache entry is parsed again
+                print(f"Warning: Could not load the cached ontology from {url} ({e}), parsing it again")
+                try:
+                    data, _ = parse_ontology_to_cache(source, url, cache_key)
+                    if data is None:
+                        with open(parsed_ontology_file(cache_key), 'rb') as f:
+                            data = pickle.load(f)
+                except Exception as e:
+                    print(f"An error occurred while parsing the ontology from {url}: {e}")
+                    continue
+        namespaces, triples = data
+        for prefix, namespace in namespaces:
+            g.bind(prefix, namespace, override=False)
+        g.addN((s, p, o, g) for s, p, o in triples)
+
     if len(g) > 0:
-        print("CIDS ontology loaded successfully.")
+        print(f"CIDS ontology loaded successfully ({len(g)} triples in {time.time() - start_time:.2f}s).")
     else:
         print("Warning: Failed to load any ontology data. The graph is empty.")
-    
+
     return g
 
-def get_text_from_pdf_url(url):
+# PDF text extraction runs in a pool of worker processes (page extraction is CPU-bound),
+# PDF_PAGES_PER_TASK pages per task; PDFs with fewer pages are extracted in-process.
+PDF_EXTRACTION_WORKERS = os.cpu_count() or 1
+PDF_PAGES_PER_TASK = 8
+
+# Downloaded PDFs are streamed to a temporary file in blocks of this size
+DOWNLOAD_BLOCK_SIZE = 1 << 16
+
+PageText = namedtuple("PageText", ["number", "text", "seconds"])
+
+_pdf_process_pool = None
+_pdf_process_pool_lock = threading.Lock()
+_worker_open_pdfs = {}
+
+
+def get_pdf_process_pool():
+    """
+    Returns the process pool for PDF text extraction, shared by all reports of a run.
+
+    Reports are extracted from executor threads, so the pool is created under a lock.
+    Workers are started with 'spawn' rather than fork: forking a process that runs an
+    event loop and other threads can copy locks held by those threads into the workers.
+    """
+    global _pdf_process_pool
+    with _pdf_process_pool_lock:
+        if _pdf_process_pool is None:
+            _pdf_process_pool = ProcessPoolExecutor(max_workers=PDF_EXTRACTION_WORKERS,
+                                                    mp_context=multiprocessing.get_context('spawn'))
+        return _pdf_process_pool
+
+
+def open_pdf_reader(pdf_path):
     """
-    Downloads a PDF from a URL and extracts its text content.
-    Note: You will need to install the 'requests' and 'PyPDF2' libraries.
-    Run: pip install requests PyPDF2
+    Opens a PDF file through a read-only memory map.
+
+    The pages are read straight from the operating system's page cache, so the
+    PDF is never copied into the process's memory as a whole.
 
     Args:
-        url (str): The URL of the PDF file.
+        pdf_path (str): Path to the PDF file.
 
     Returns:
-        str: The extracted text from the PDF, or None if an error occurs.
+        tuple: (PyPDF2.PdfReader, mmap.mmap); keep the map open while using the reader.
     """
-    print(f"Fetching report from {url}...")
+    with open(pdf_path, 'rb') as f:
+        pdf_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return PyPDF2.PdfReader(pdf_map), pdf_map
+
+
+def extract_page_range(pdf_path, start, stop):
+    """
+    Extracts the text of pages [start, stop) of a PDF (runs in a worker process).
+
+    Each worker keeps the PDF it used last open, so consecutive tasks for the same
+    report do not parse the document structure again.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+        start (int): Index of the first page (0-based).
+        stop (int): Index after the last page.
+
+    Returns:
+        list: PageText tuples (1-based page number, text, extraction seconds).
+    """
+    key = (pdf_path, os.path.getmtime(pdf_path))
+    if key not in _worker_open_pdfs:
+        for _, pdf_map in _worker_open_pdfs.values():
+            pdf_map.close()
+        _worker_open_pdfs.clear()
+        _worker_open_pdfs[key] = open_pdf_reader(pdf_path)
+    pdf_reader = _worker_open_pdfs[key][0]
+
+    pages = []
+    for index in range(start, stop):
+        start_time = time.perf_counter()
+        text = pdf_reader.pages[index].extract_text() or ""
+        pages.append(PageText(index + 1, text, time.perf_counter() - start_time))
+    return pages
+
+
+def iter_pdf_pages(pdf_path):
+    """
+    Extracts the text of a PDF page by page, in parallel, yielding the pages in order.
+
+    Page ranges are extracted by the shared process pool; pages are yielded as soon
+    as all earlier pages are done, so callers can start using the text before the
+    whole document is extracted.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+
+    Yields:
+        PageText: (1-based page number, text, extraction seconds) for each page.
+
+    Raises:
+        PyPDF2.errors.PdfReadError: If the file is not a readable PDF.
+    """
+    pdf_reader, pdf_map = open_pdf_reader(pdf_path)
     try:
-        # Use a User-Agent to mimic a browser and avoid potential blocking
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36'}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # Raise an exception for bad status codes
-
-        # Use BytesIO to treat the downloaded content as a file-like object
-        pdf_file = BytesIO(response.content)
-        
-        # Read the PDF
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() or ""
-        
-        print("Successfully extracted text from PDF.")
-        return text
-    except requests.exceptions.RequestException as e:
-        print(f"Error downloading the file: {e}")
-        return None
-    except PyPDF2.errors.PdfReadError:
-        print("Error: Could not read the PDF file. It may be corrupted or not a valid PDF.")
-        return None
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-        return None
+        page_count = len(pdf_reader.pages)
+        if page_count <= PDF_PAGES_PER_TASK or PDF_EXTRACTION_WORKERS <= 1:
+            # Not worth the round trip to the worker processes
+            for index in range(page_count):
+                start_time = time.perf_counter()
+                text = pdf_reader.pages[index].extract_text() or ""
+                yield PageText(index + 1, text, time.perf_counter() - start_time)
+            return
+    finally:
+        pdf_map.close()
+
+    pool = get_pdf_process_pool()
+    futures = [pool.submit(extract_page_range, pdf_path, start, min(start + PDF_PAGES_PER_TASK, page_count))
+               for start in range(0, page_count, PDF_PAGES_PER_TASK)]
+    try:
+        for future in futures:
+            yield from future.result()
+    finally:
+        # Stop the remaining tasks if the caller stops reading early (or a task failed)
+        for future in futures:
+            future.cancel()
 
 
-async def analyze_nonprofit_data(report_text, cids_graph):
+def extract_text_from_pdf(pdf_path, page_timings=None):
     """
-    Analyzes nonprofit report text using the Gemini API to extract entities
-    and relationships, formatting them according to a CIDS-aligned JSON schema.
+    Extracts the text content of a local PDF file.
 
     Args:
-        report_text (str): The text content of the nonprofit's report.
-        cids_graph (rdflib.Graph): The graph containing the CIDS ontology (for context).
+        pdf_path (str): Path to the PDF file.
+        page_timings (list): If given, (page number, seconds) is appended for every page.
 
     Returns:
-        list: A list of dictionaries representing the extracted entities, or None if an error occurs.
+        str: The extracted text.
+
+    Raises:
+        PyPDF2.errors.PdfReadError: If the file is not a readable PDF.
+    """
+    start_time = time.perf_counter()
+    texts = []
+    slowest = None
+    for page in iter_pdf_pages(pdf_path):
+        texts.append(page.text)
+        if page_timings is not None:
+            page_timings.append((page.number, page.seconds))
+        if slowest is None or page.seconds > slowest.seconds:
+            slowest = page
+    elapsed = time.perf_counter() - start_time
+    if slowest is not None:
+        print(f"--> Extracted {len(texts)} pages in {elapsed:.2f}s (slowest: page {slowest.number}, {slowest.seconds:.2f}s).")
+    return "".join(texts)
+
+
+# Define the flattened JSON schema with simplified property names that align with the CIDS context file.
+EXTRACTION_SCHEMA = {
+    "type": "ARRAY",
+    "description": "A flat list of all extracted entities, linked by unique @id fields, using simplified property names.",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "@id": {"type": "STRING", "description": "A unique, document-local identifier, starting with '#' (e.g., '#org-1')."},
+            "@type": {
+                "type": "STRING", 
+                "description": "The CIDS class type for the entity, with a prefix (e.g., 'cids:IndicatorReport').",
+                "pattern": "^[a-zA-Z]+:[A-Z][a-zA-Z]+$"
+            },
+            "hasName": {"type": "STRING"},
+            "hasDescription": {"type": "STRING"},
+            # --- Relational Properties ---
+            "hasOutcome": {
+                "type": "ARRAY", "items": {"type": "STRING", "description": "An array of @id strings referencing Outcome objects."}
+            },
+            "hasIndicator": {
+                "type": "ARRAY", "items": {"type": "STRING", "description": "An array of @id strings referencing Indicator objects."}
+            },
+            "hasIndicatorReport": {
+                "type": "ARRAY", "items": {"type": "STRING", "description": "An array of @id strings referencing IndicatorReport objects."}
+            },
+            "forTheme": {
+                "type": "ARRAY", "items": {"type": "STRING", "description": "An array of @id strings referencing Theme objects."}
+            },
+             "forOutcome": {
+                "type": "ARRAY", "items": {"type": "STRING", "description": "An array of @id strings referencing Outcome objects."}
+            },
+            # --- Literal Properties for specific types ---
+            "startedAtTime": {"type": "STRING", "format": "date-time"},
+            "endedAtTime": {"type": "STRING", "format": "date-time"},
+            "hasCode": {"type": "STRING", "description": "e.g., 'sdg:SDG-1.1'"}
+        },
+        "required": ["@id", "@type", "hasName"]
+    }
+}
+
+# Properties whose values are @id references to other extracted entities
+REFERENCE_PROPERTIES = ("hasOutcome", "hasIndicator", "hasIndicatorReport", "forTheme", "forOutcome")
+
+# The report text is analyzed in overlapping windows of this many characters, so long
+# reports are read in full while each request stays within the API limits.
+CHUNK_SIZE = 8000
+CHUNK_OVERLAP = 1000
+
+# Maximum number of chunks analyzed by the API at the same time
+MAX_CONCURRENT_REQUESTS = 8
+
+# Connection pool limits of the HTTP session shared by all downloads and API requests
+MAX_CONNECTIONS = 32
+MAX_CONNECTIONS_PER_HOST = 8
+
+# Failed HTTP requests (connection errors, timeouts, 429 and 5xx responses) are retried
+# up to MAX_RETRIES times, waiting RETRY_BASE_DELAY * 2**attempt seconds (plus jitter)
+# or as long as the server's Retry-After header asks.
+MAX_RETRIES = 4
+RETRY_BASE_DELAY = 1.0
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+# Seconds to wait for a response (LLM requests on long chunks can be slow)
+REQUEST_TIMEOUT = 300
+
+# Use a User-Agent to mimic a browser and avoid potential blocking when downloading reports
+PDF_REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36'}
+
+
+def create_http_session():
     """
-    print("Analyzing nonprofit data with the Gemini API...")
+    Creates the HTTP session shared by all requests of a run.
+
+    The session's connection pool keeps connections open between requests and limits
+    the number of connections per host, so many reports can be processed at once
+    without flooding a single server.
+
+    Returns:
+        aiohttp.ClientSession: The session (use with 'async with').
+    """
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=MAX_CONNECTIONS_PER_HOST)
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT))
+
+
+async def request_with_retry(session, method, url, response_type="json", destination=None, **kwargs):
+    """
+    Sends an HTTP request, retrying with exponential backoff on transient errors.
+
+    Args:
+        session (aiohttp.ClientSession): The shared HTTP session.
+        method (str): The HTTP method (e.g., "GET" or "POST").
+        url (str): The request URL.
+        response_type (str): "json", "bytes", "text" or "file".
+        destination (str): Path the body is streamed to, for response_type "file".
+        **kwargs: Further arguments for session.request (json, headers, ...).
+
+    Returns:
+        The response body as parsed JSON, bytes or text (None for "file").
+
+    Raises:
+        aiohttp.ClientError: If the request fails after all retries, or with a non-retryable status.
+        asyncio.TimeoutError: If the last attempt timed out.
+    """
+    host = urlsplit(url).netloc
+    for attempt in range(MAX_RETRIES + 1):
+        delay = RETRY_BASE_DELAY * (2 ** attempt) * (1 + random.random() / 2)
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                if response.status in RETRYABLE_STATUSES and attempt < MAX_RETRIES:
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        delay = float(retry_after)
+                    print(f"--> HTTP {response.status} from {host}; retrying in {delay:.1f}s...")
+                    await asyncio.sleep(delay)
+                    continue
+                response.raise_for_status()
+                if response_type == "file":
+                    with open(destination, 'wb') as f:
+                        async for block in response.content.iter_chunked(DOWNLOAD_BLOCK_SIZE):
+                            f.write(block)
+                    return None
+                if response_type == "bytes":
+                    return await response.read()
+                if response_type == "text":
+                    return await response.text()
+                return await response.json(content_type=None)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if attempt == MAX_RETRIES:
+                raise
+            print(f"--> Request to {host} failed ({e.__class__.__name__}); retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
+
+def get_api_url():
+    """
+    Returns the URL of the Gemini generateContent endpoint.
+
+    Set the LANGTEST_API_URL environment variable to send the requests to another
+    endpoint instead (e.g., a local mock server for testing).
+
+    Returns:
+        str: The API URL, or None if no API key is configured.
+    """
+    override_url = os.environ.get("LANGTEST_API_URL")
+    if override_url:
+        return override_url
 
     # --- IMPORTANT ---
     # Replace "YOUR_API_KEY_HERE" with your actual Gemini API key from Google AI Studio.
@@ -104,57 +612,64 @@ async def analyze_nonprofit_data(report_text, cids_graph):
         print("Error: Please replace 'YOUR_API_KEY_HERE' with your actual Gemini API key.")
         return None
 
-    api_url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-05-20:generateContent?key={api_key}"
-
-    # Define the flattened JSON schema with simplified property names that align with the CIDS context file.
-    json_schema = {
-        "type": "ARRAY",
-        "description": "A flat list of all extracted entities, linked by unique @id fields, using simplified property names.",
-        "items": {
-            "type": "OBJECT",
-            "properties": {
-                "@id": {"type": "STRING", "description": "A unique, document-local identifier, starting with '#' (e.g., '#org-1')."},
-                "@type": {
-                    "type": "STRING", 
-                    "description": "The CIDS class type for the entity, with a prefix (e.g., 'cids:IndicatorReport').",
-                    "pattern": "^[a-zA-Z]+:[A-Z][a-zA-Z]+$"
-                },
-                "hasName": {"type": "STRING"},
-                "hasDescription": {"type": "STRING"},
-                # --- Relational Properties ---
-                "hasOutcome": {
-                    "type": "ARRAY", "items": {"type": "STRING", "description": "An array of @id strings referencing Outcome objects."}
-                },
-                "hasIndicator": {
-                    "type": "ARRAY", "items": {"type": "STRING", "description": "An array of @id strings referencing Indicator objects."}
-                },
-                "hasIndicatorReport": {
-                    "type": "ARRAY", "items": {"type": "STRING", "description": "An array of @id strings referencing IndicatorReport objects."}
-                },
-                "forTheme": {
-                    "type": "ARRAY", "items": {"type": "STRING", "description": "An array of @id strings referencing Theme objects."}
-                },
-                 "forOutcome": {
-                    "type": "ARRAY", "items": {"type": "STRING", "description": "An array of @id strings referencing Outcome objects."}
-                },
-                # --- Literal Properties for specific types ---
-                "startedAtTime": {"type": "STRING", "format": "date-time"},
-                "endedAtTime": {"type": "STRING", "format": "date-time"},
-                "hasCode": {"type": "STRING", "description": "e.g., 'sdg:SDG-1.1'"}
-            },
-            "required": ["@id", "@type", "hasName"]
-        }
-    }
+    return f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-05-20:generateContent?key={api_key}"
 
 
+def split_into_chunks(text, chunk_size=CHUNK_SIZE, overlap=CHUNK_OVERLAP):
+    """
+    Splits text into overlapping windows.
+
+    Each window ends at a paragraph or line break (or a space) near its size limit
+    when possible, so entities are less often cut in half; the overlap gives every
+    entity near a boundary a second chance to be read whole.
+
+    Args:
+        text (str): The text to split.
+        chunk_size (int): Maximum number of characters per window.
+        overlap (int): Number of characters shared by consecutive windows.
+
+    Returns:
+        list: The text windows, in document order.
+    """
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_size, len(text))
+        if end < len(text):
+            # Prefer to break at a paragraph, line or word boundary in the last part of the window
+            for separator in ("\n\n", "\n", " "):
+                boundary = text.rfind(separator, start + chunk_size // 2, end)
+                if boundary != -1:
+                    end = boundary + len(separator)
+                    break
+        chunks.append(text[start:end])
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+    return chunks
+
+
+def build_extraction_payload(chunk_text, chunk_number, chunk_count):
+    """
+    Builds the generateContent request for one window of the report text.
+
+    Args:
+        chunk_text (str): The window of report text.
+        chunk_number (int): Number of the window (1-based).
+        chunk_count (int): Total number of windows.
+
+    Returns:
+        dict: The request payload.
+    """
     # Construct the prompt for the language model.
     prompt = f"""
     Analyze the following nonprofit annual report text. Your task is to extract key entities based on the CIDS ontology and structure them as a flattened graph with ID-based links.
+    The text is part {chunk_number} of {chunk_count} of the report; extract the entities mentioned in this part.
 
     Instructions:
     1.  Identify all relevant entities: the main Organization, all of its Outcomes, all Indicators, any IndicatorReports, and any thematic areas (including UN SDGs).
     2.  Create a flat JSON array containing an object for EACH entity.
-    3.  For every object, you MUST assign a unique, document-local `@id` starting with '#'. For example: `"#org-wikimedia"`.
+    3.  For every object, you MUST assign a unique, document-local `@id` starting with '#', derived from the entity's name so the same entity gets the same `@id` in every part. For example: `"#org-wikimedia"`.
     4.  For the `@type` property, you MUST use the full prefixed name, such as `cids:Organization` or `cids:IndicatorReport`.
     5.  For all other properties, you MUST use the simplified, unprefixed names as defined in the CIDS context (e.g., use `hasOutcome` instead of `cids:hasOutcome`, `hasName` instead of `org:hasName`).
     6.  Create relationships by referencing `@id`s. For example, an Outcome object's `hasIndicator` property should contain an array of `@id` strings that point to the relevant Indicator objects.
@@ -163,79 +678,331 @@ async def analyze_nonprofit_data(report_text, cids_graph):
 
     Report Text:
     ---
-    {report_text[:8000]} 
+    {chunk_text}
     ---
     """
-    
-    # We truncate the report text to avoid exceeding API limits.
 
-    payload = {
+    return {
         "contents": [{"role": "user", "parts": [{"text": prompt}]}],
         "generationConfig": {
             "responseMimeType": "application/json",
-            "responseSchema": json_schema
+            "responseSchema": EXTRACTION_SCHEMA
         }
     }
 
+
+async def analyze_chunk(session, semaphore, api_url, chunk_text, chunk_number, chunk_count, label=""):
+    """
+    Sends one window of the report text to the API and returns the extracted entities.
+
+    Args:
+        session (aiohttp.ClientSession): The shared HTTP session.
+        semaphore (asyncio.Semaphore): Limits the number of requests in flight.
+        api_url (str): The generateContent endpoint.
+        chunk_text (str): The window of report text.
+        chunk_number (int): Number of the window (1-based).
+        chunk_count (int): Total number of windows.
+        label (str): Name of the report, for progress messages.
+
+    Returns:
+        list: The extracted entities, or None if an error occurs.
+    """
+    prefix = f"[{label}] " if label else ""
+    payload = build_extraction_payload(chunk_text, chunk_number, chunk_count)
+    async with semaphore:
+        result = None
+        try:
+            result = await request_with_retry(session, "POST", api_url, json=payload)
+            
+            # Extract the JSON string from the response
+            content_part = result.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0]
+            json_string = content_part.get('text', '[]')
+            entities = json.loads(json_string)
+            if not isinstance(entities, list):
+                raise ValueError(f"expected a JSON array of entities, got {type(entities).__name__}")
+            print(f"{prefix}--> Part {chunk_number}/{chunk_count}: {len(entities)} entities")
+            return entities
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"{prefix}An error occurred during the API request for part {chunk_number}: {e or 'request timed out'}")
+            return None
+        except (ValueError, TypeError, IndexError, KeyError, AttributeError) as e:
+            print(f"{prefix}Error parsing the API response for part {chunk_number}: {e}")
+            print("Raw response:", json.dumps(result)[:2000])
+            return None
+
+
+def normalize_name(name):
+    """Returns a name in lower case with punctuation removed and whitespace collapsed, for matching."""
+    if not isinstance(name, str):
+        return ""
+    return " ".join(re.sub(r"[^\w\s]", " ", name.lower()).split())
+
+
+def merge_extracted_entities(chunk_results):
+    """
+    Merges the entity lists extracted from the report windows into one list.
+
+    Each window is analyzed on its own, so the same entity can appear in several
+    windows, and the same @id can name different entities in different windows.
+    Entities are merged when they have the same @type and normalized hasName, or the
+    same @id with no conflicting name; an @id already used by another entity is
+    renamed. References between entities are rewritten to the merged @ids.
+
+    Args:
+        chunk_results (list): The entity lists of the windows, in document order.
+
+    Returns:
+        list: The merged entities, in order of first appearance.
+    """
+    merged = {}
+    by_name = {}
+
+    for chunk_number, entities in enumerate(chunk_results, start=1):
+        # Map the window's own @ids to the merged @ids before rewriting references
+        id_map = {}
+        for entity in entities:
+            if not isinstance(entity, dict) or not entity.get("@id"):
+                continue
+            local_id = entity["@id"]
+            name_key = (entity.get("@type"), normalize_name(entity.get("hasName")))
+            existing = merged.get(local_id)
+            if name_key[1] and name_key in by_name:
+                merged_id = by_name[name_key]
+            elif existing is not None and existing.get("@type") == entity.get("@type") and \
+                    (not name_key[1] or not normalize_name(existing.get("hasName")) or
+                     normalize_name(existing.get("hasName")) == name_key[1]):
+                merged_id = local_id
+            elif existing is None:
+                merged_id = local_id
+            else:
+                # The @id already names a different entity
+                merged_id = f"{local_id}-{chunk_number}"
+                suffix = 2
+                while merged_id in merged:
+                    merged_id = f"{local_id}-{chunk_number}-{suffix}"
+                    suffix += 1
+            id_map.setdefault(local_id, merged_id)
+            if name_key[1]:
+                by_name.setdefault(name_key, merged_id)
+
+        for entity in entities:
+            if not isinstance(entity, dict) or entity.get("@id") not in id_map:
+                continue
+            merged_id = id_map[entity["@id"]]
+            entity = dict(entity, **{"@id": merged_id})
+            for prop in REFERENCE_PROPERTIES:
+                if isinstance(entity.get(prop), list):
+                    entity[prop] = [id_map.get(ref, ref) for ref in entity[prop]]
+
+            target = merged.get(merged_id)
+            if target is None:
+                merged[merged_id] = entity
+            else:
+                # Combine the descriptions of the same entity: union of references,
+                # first non-empty value of everything else
+                for prop, value in entity.items():
+                    if isinstance(value, list):
+                        current = target.get(prop) if isinstance(target.get(prop), list) else []
+                        target[prop] = current + [v for v in value if v not in current]
+                    elif not target.get(prop) and value:
+                        target[prop] = value
+            name_key = (merged[merged_id].get("@type"), normalize_name(merged[merged_id].get("hasName")))
+            if name_key[1]:
+                by_name.setdefault(name_key, merged_id)
+
+    return list(merged.values())
+
+
+async def analyze_nonprofit_data(report_text, cids_graph, chunk_size=CHUNK_SIZE, overlap=CHUNK_OVERLAP,
+                                 max_concurrency=MAX_CONCURRENT_REQUESTS, session=None, semaphore=None, label=""):
+    """
+    Analyzes nonprofit report text using the Gemini API to extract entities
+    and relationships, formatting them according to a CIDS-aligned JSON schema.
+
+    The full text is split into overlapping windows that are analyzed concurrently
+    (at most max_concurrency requests at a time over one HTTP session), and the
+    entities of all windows are merged into one list.
+
+    Args:
+        report_text (str): The text content of the nonprofit's report.
+        cids_graph (rdflib.Graph): The graph containing the CIDS ontology (for context).
+        chunk_size (int): Maximum number of characters per window.
+        overlap (int): Number of characters shared by consecutive windows.
+        max_concurrency (int): Maximum number of API requests in flight.
+        session (aiohttp.ClientSession): HTTP session to use (batch mode); a new one is created if None.
+        semaphore (asyncio.Semaphore): Limit on API requests shared with other reports (batch mode);
+                                       if None, max_concurrency applies to this report alone.
+        label (str): Name of the report, for progress messages.
+
+    Returns:
+        list: A list of dictionaries representing the extracted entities, or None if an error occurs.
+    """
+    prefix = f"[{label}] " if label else ""
+    print(f"{prefix}Analyzing nonprofit data with the Gemini API...")
+
+    api_url = get_api_url()
+    if api_url is None:
+        return None
+
+    chunks = split_into_chunks(report_text, chunk_size, overlap)
+    print(f"{prefix}Split report text ({len(report_text)} characters) into {len(chunks)} parts.")
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def analyze_chunks(session):
+        return await asyncio.gather(*(
+            analyze_chunk(session, semaphore, api_url, chunk, number, len(chunks), label)
+            for number, chunk in enumerate(chunks, start=1)
+        ))
+
+    if session is None:
+        async with create_http_session() as own_session:
+            chunk_results = await analyze_chunks(own_session)
+    else:
+        chunk_results = await analyze_chunks(session)
+
+    successful_results = [entities for entities in chunk_results if entities is not None]
+    if not successful_results:
+        print(f"{prefix}Error: None of the report parts could be analyzed.")
+        return None
+    if len(successful_results) < len(chunks):
+        print(f"{prefix}Warning: {len(chunks) - len(successful_results)} of {len(chunks)} report parts could not be analyzed.")
+
+    entities = merge_extracted_entities(successful_results)
+    extracted_count = sum(len(result) for result in successful_results)
+    print(f"{prefix}Successfully received and parsed structured data from the API ({extracted_count} entities merged into {len(entities)}).")
+    return entities
+
+
+def is_url(source):
+    """Returns True if a report source is an HTTP(S) URL rather than a local file path."""
+    return urlsplit(source).scheme in ("http", "https")
+
+
+async def fetch_report_text(session, source, label="", page_timings=None):
+    """
+    Downloads (or reads) a PDF report and extracts its text content.
+
+    The download goes through the shared session (with retries) and is streamed to
+    a temporary file; the text is extracted by the shared process pool (see
+    iter_pdf_pages), waited on from a worker thread so other reports keep
+    downloading and being analyzed in the meantime.
+
+    Args:
+        session (aiohttp.ClientSession): The shared HTTP session.
+        source (str): The URL or local path of the PDF file.
+        label (str): Name of the report, for progress messages.
+        page_timings (list): If given, (page number, seconds) is appended for every
+                             extracted page (see extract_text_from_pdf).
+
+    Returns:
+        str: The extracted text from the PDF, or None if an error occurs.
+    """
+    prefix = f"[{label}] " if label else ""
+    loop = asyncio.get_running_loop()
+    temp_path = None
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(api_url, json=payload) as response:
-                response.raise_for_status()
-                result = await response.json()
-                
-                # Extract the JSON string from the response
-                content_part = result.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0]
-                json_string = content_part.get('text', '[]')
-                
-                print("Successfully received and parsed structured data from the API.")
-                return json.loads(json_string)
-
-    except aiohttp.ClientError as e:
-        print(f"An error occurred during the API request: {e}")
+        if is_url(source):
+            print(f"{prefix}Fetching report from {source}...")
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+                temp_path = temp_file.name
+            await request_with_retry(session, "GET", source, response_type="file", destination=temp_path,
+                                     headers=PDF_REQUEST_HEADERS)
+            pdf_path = temp_path
+        else:
+            print(f"{prefix}Reading report from {source}...")
+            pdf_path = source
+        text = await loop.run_in_executor(None, extract_text_from_pdf, pdf_path, page_timings)
+        print(f"{prefix}Successfully extracted text from PDF ({len(text)} characters).")
+        return text
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"{prefix}Error downloading the file: {e or 'request timed out'}")
+        return None
+    except OSError as e:
+        print(f"{prefix}Error reading the file: {e}")
         return None
-    except (json.JSONDecodeError, IndexError, KeyError) as e:
-        print(f"Error parsing the API response: {e}")
-        print("Raw response:", await response.text())
+    except PyPDF2.errors.PdfReadError:
+        print(f"{prefix}Error: Could not read the PDF file. It may be corrupted or not a valid PDF.")
+        return None
+    except Exception as e:
+        print(f"{prefix}An unexpected error occurred: {e}")
         return None
+    finally:
+        if temp_path:
+            os.remove(temp_path)
+
+
+CIDS_CONTEXT_URL = "https://ontology.commonapproach.org/contexts/cidsContext.jsonld"
+# Copy of the CIDS context in this repository, used if fetching it fails
+CIDS_CONTEXT_FILE = os.path.join(REPO_ROOT, "contexts", "cidsContext.jsonld")
 
 
-def create_jsonld_knowledge_graph(extracted_data):
+def fallback_cids_context():
     """
-    Creates a self-contained JSON-LD knowledge graph from the extracted data
-    by fetching and embedding the official CIDS context.
+    Returns the context used if fetching the CIDS context fails: the copy in this
+    repository, or a minimal context if that cannot be read either.
+    """
+    try:
+        with open(CIDS_CONTEXT_FILE, 'r', encoding='utf-8') as f:
+            context = json.load(f)["@context"]
+        if isinstance(context, dict):
+            return context
+        print(f"Warning: '{CIDS_CONTEXT_FILE}' does not contain a context object.")
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Warning: Could not read the CIDS context from '{CIDS_CONTEXT_FILE}': {e}")
+    return {
+        "cids": str(CIDS),
+        "org": str(ORG),
+        "sdg": str(SDG),
+        "rdf": str(RDF),
+        "rdfs": str(RDFS),
+        "prov": "http://www.w3.org/ns/prov#"
+    }
+
+
+async def fetch_cids_context(session):
+    """
+    Fetches the official CIDS JSON-LD context over the shared session.
 
     Args:
-        extracted_data (list): A list of dictionaries representing the flattened
-                               graph entities.
+        session (aiohttp.ClientSession): The shared HTTP session.
 
     Returns:
-        dict: A dictionary representing the JSON-LD knowledge graph.
+        dict: The context, or the fallback context if fetching fails (see fallback_cids_context).
     """
-    # Fetch the external CIDS context
-    context_url = "https://ontology.commonapproach.org/contexts/cidsContext.jsonld"
-    print(f"Fetching context from {context_url}...")
+    print(f"Fetching context from {CIDS_CONTEXT_URL}...")
     try:
-        response = requests.get(context_url)
-        response.raise_for_status()
+        context_document = await request_with_retry(session, "GET", CIDS_CONTEXT_URL)
         # The context from the URL is nested under a "@context" key
-        cids_context = response.json().get("@context", {})
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching CIDS context: {e}. Using a fallback.")
-        # Fallback to a minimal context if fetching fails
-        cids_context = {
-            "cids": str(CIDS),
-            "org": str(ORG),
-            "sdg": str(SDG),
-            "rdf": str(RDF),
-            "rdfs": str(RDFS),
-            "prov": "http://www.w3.org/ns/prov#"
-        }
-    except json.JSONDecodeError:
-        print("Error decoding CIDS context JSON. Using a fallback.")
-        cids_context = {}
+        context = context_document.get("@context") if isinstance(context_document, dict) else None
+        if isinstance(context, dict):
+            return context
+        print("Error: The CIDS context document has no context object. Using the repository copy.")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"Error fetching CIDS context: {e or 'request timed out'}. Using the repository copy.")
+    except Exception as e:
+        print(f"Error decoding CIDS context JSON: {e}. Using the repository copy.")
+    return fallback_cids_context()
+
+
+def create_jsonld_knowledge_graph(extracted_data, cids_context):
+    """
+    Creates a self-contained JSON-LD knowledge graph from the extracted data
+    by embedding the official CIDS context.
 
+    Args:
+        extracted_data (list): A list of dictionaries representing the flattened
+                               graph entities.
+        cids_context (dict): The CIDS context to embed (see fetch_cids_context; fetched
+                             once for all reports of a run).
 
+    Returns:
+        dict: A dictionary representing the JSON-LD knowledge graph.
+    """
     # Add the @base URI to the fetched context for local ID resolution
+    cids_context = dict(cids_context)
     cids_context["@base"] = "https://www.example.org/"
 
     jsonld_graph = {
@@ -261,42 +1028,227 @@ def save_jsonld_to_file(jsonld_data, output_file):
         print(f"Error saving file: {e}")
 
 
+# Maximum number of reports in progress at the same time in batch mode (bounds the
+# memory used by downloaded PDFs and extracted text); downloads, text extraction and
+# analysis of different reports overlap within this limit.
+MAX_CONCURRENT_REPORTS = 16
+
+
+def read_report_list(list_file):
+    """
+    Reads a batch list of report sources (URLs or local PDF paths), one per line.
+
+    Blank lines and lines starting with '#' are skipped; relative paths are relative to the list file.
+
+    Args:
+        list_file (str): Path to the list file.
+
+    Returns:
+        list: The report sources, in file order.
+    """
+    list_dir = os.path.dirname(os.path.abspath(list_file))
+    sources = []
+    with open(list_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if not is_url(line) and not os.path.isabs(line):
+                line = os.path.join(list_dir, line)
+            sources.append(line)
+    return sources
+
+
+def output_file_for(source, output_dir, used_names):
+    """
+    Returns the output path of a report's knowledge graph: [output_dir]/[report name].jsonld.
+
+    Args:
+        source (str): The URL or local path of the report.
+        output_dir (str): The output directory.
+        used_names (set): Names already used in this batch (updated); a counter is added on clashes.
+
+    Returns:
+        str: The output file path.
+    """
+    path = urlsplit(source).path if is_url(source) else source
+    name = os.path.splitext(os.path.basename(path.rstrip('/')))[0] or "report"
+    name = re.sub(r"[^A-Za-z0-9_-]", "_", name)
+    unique_name = name
+    counter = 2
+    while unique_name in used_names:
+        unique_name = f"{name}-{counter}"
+        counter += 1
+    used_names.add(unique_name)
+    return os.path.join(output_dir, f"{unique_name}.jsonld")
+
+
+async def process_report(session, report_semaphore, api_semaphore, source, output_file, cids_graph, cids_context):
+    """
+    Runs the pipeline for one report: download, text extraction, analysis and saving.
+
+    Args:
+        session (aiohttp.ClientSession): The shared HTTP session.
+        report_semaphore (asyncio.Semaphore): Limits the number of reports in progress.
+        api_semaphore (asyncio.Semaphore): Limits the number of API requests in flight across all reports.
+        source (str): The URL or local path of the report.
+        output_file (str): Path for the knowledge graph.
+        cids_graph (rdflib.Graph): The graph containing the CIDS ontology.
+        cids_context (asyncio.Task): Task fetching the CIDS context to embed (see
+                                     fetch_cids_context), awaited once the graph is built.
+
+    Returns:
+        dict: The report's result (source, status, entities, seconds, pages, slowest page
+              and its extraction seconds, output_file).
+    """
+    label = os.path.basename(output_file)[:-len(".jsonld")]
+    async with report_semaphore:
+        start_time = time.time()
+        result = {"source": source, "status": "error", "entities": 0, "seconds": 0, "pages": 0,
+                  "slowest_page": "", "slowest_page_seconds": "", "output_file": ""}
+        page_timings = []
+
+        # An unexpected error fails this report only, not the whole batch
+        try:
+            report_text = await fetch_report_text(session, source, label, page_timings)
+            if report_text:
+                extracted_entities = await analyze_nonprofit_data(report_text, cids_graph, session=session,
+                                                                  semaphore=api_semaphore, label=label)
+                if extracted_entities:
+                    knowledge_graph = create_jsonld_knowledge_graph(extracted_entities, await cids_context)
+                    save_jsonld_to_file(knowledge_graph, output_file)
+                    result.update(status="ok", entities=len(extracted_entities), output_file=output_file)
+                else:
+                    print(f"[{label}] Analysis did not return any entities.")
+            else:
+                print(f"[{label}] Could not process the report due to an error in text extraction.")
+        except Exception as e:
+            print(f"[{label}] An unexpected error occurred while processing the report: {e!r}")
+
+        result["seconds"] = round(time.time() - start_time, 1)
+        if page_timings:
+            slowest_page, slowest_seconds = max(page_timings, key=lambda timing: timing[1])
+            result.update(pages=len(page_timings), slowest_page=slowest_page,
+                          slowest_page_seconds=round(slowest_seconds, 2))
+        return result
+
+
+async def process_reports(reports, cids_graph, index_file=None):
+    """
+    Turns many reports into CIDS JSON-LD knowledge graphs in one run.
+
+    All reports share one HTTP session (connection pool with per-host limits and
+    retries), one CIDS context download and one limit on API requests in flight,
+    so the downloads, text extraction and analysis of different reports overlap.
+    The context is downloaded while the first reports are processed.
+
+    Args:
+        reports (list): (source, output_file) pairs.
+        cids_graph (rdflib.Graph): The graph containing the CIDS ontology.
+        index_file (str): Optional path of a tab-separated index of the results.
+
+    Returns:
+        list: The result of each report (see process_report), in input order.
+    """
+    start_time = time.time()
+    # Create the PDF extraction pool here in the main thread, before any report is extracted
+    get_pdf_process_pool()
+    async with create_http_session() as session:
+        cids_context = asyncio.create_task(fetch_cids_context(session))
+        report_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REPORTS)
+        api_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        results = await asyncio.gather(*(
+            process_report(session, report_semaphore, api_semaphore, source, output_file, cids_graph, cids_context)
+            for source, output_file in reports
+        ))
+        # Not needed if no report got as far as building a graph
+        cids_context.cancel()
+    elapsed = time.time() - start_time
+
+    if index_file:
+        with open(index_file, 'w') as f:
+            f.write("source\tstatus\tentities\tseconds\tpages\tslowest_page\tslowest_page_seconds\toutput_file\n")
+            for result in results:
+                f.write(f"{result['source']}\t{result['status']}\t{result['entities']}\t{result['seconds']}\t"
+                        f"{result['pages']}\t{result['slowest_page']}\t{result['slowest_page_seconds']}\t"
+                        f"{result['output_file']}\n")
+        print(f"Batch index saved to '{index_file}'.")
+
+    succeeded = sum(1 for result in results if result["status"] == "ok")
+    print(f"Processed {len(results)} report(s) in {elapsed:.1f}s: {succeeded} succeeded, {len(results) - succeeded} failed.")
+    return results
+
+
 async def main():
     """
     Main function to run the entire data processing pipeline.
+
+    Usage:
+        python LangTest.py                                   # the default report -> knowledge_graph.jsonld
+        python LangTest.py [--output-dir DIR] REPORT...       # URLs or local PDF paths
+        python LangTest.py [--output-dir DIR] --batch LIST    # a file listing one report per line
+
+    --refresh-ontology revalidates downloaded ontologies with their servers (otherwise done daily).
     """
-    # 1. Load the CIDS ontology and SDG codelist from URLs
+    usage = "Usage: python LangTest.py [--output-dir DIR] [--batch LIST_FILE] [--refresh-ontology] [REPORT_URL_OR_PDF ...]"
+
+    # Parse command-line arguments
+    sources = []
+    output_dir = "knowledge_graphs"
+    refresh_ontology = False
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg == "--refresh-ontology":
+            refresh_ontology = True
+            i += 1
+        elif arg in ("--output-dir", "--batch"):
+            if i + 1 >= len(sys.argv):
+                print(f"Error: {arg} requires a value")
+                print(usage)
+                return
+            if arg == "--output-dir":
+                output_dir = sys.argv[i + 1]
+            else:
+                try:
+                    sources.extend(read_report_list(sys.argv[i + 1]))
+                except OSError as e:
+                    print(f"Error reading the batch list: {e}")
+                    return
+            i += 2
+        elif arg.startswith("--"):
+            print(f"Error: Unknown option: {arg}")
+            print(usage)
+            return
+        else:
+            sources.append(arg)
+            i += 1
+
+    # 1. Load the CIDS ontology and SDG codelist (from the repository or the local ontology cache)
     cids_ontology_urls = [
         "https://ontology.commonapproach.org/cids.ttl",
         "https://codelist.commonapproach.org/SDGImpacts/SDGImpacts.ttl"
     ]
-    cids_graph = load_cids_ontology(cids_ontology_urls)
+    cids_graph = load_cids_ontology(cids_ontology_urls, refresh=refresh_ontology)
 
     # Proceed only if the ontology was loaded successfully
-    if cids_graph and len(cids_graph) > 0:
-        # 2. Specify the URL for the nonprofit report and extract text
-        report_url = "https://fsgv.ca/wp-content/uploads/2024/09/Digital-Family-Services-of-Greater-Vancouver-Annual-Report-2024.pdf"
-        nonprofit_report_text = get_text_from_pdf_url(report_url)
-
-        # Proceed only if text was successfully extracted
-        if nonprofit_report_text:
-            extracted_entities = await analyze_nonprofit_data(nonprofit_report_text, cids_graph)
+    if not (cids_graph and len(cids_graph) > 0):
+        print("Could not run analysis because the CIDS ontology failed to load.")
+        return
 
-            if extracted_entities:
-                # 3. Create the JSON-LD knowledge graph
-                knowledge_graph = create_jsonld_knowledge_graph(extracted_entities)
+    if not sources:
+        # 2. Without arguments, process the default nonprofit report into knowledge_graph.jsonld
+        report_url = "https://fsgv.ca/wp-content/uploads/2024/09/Digital-Family-Services-of-Greater-Vancouver-Annual-Report-2024.pdf"
+        await process_reports([(report_url, 'knowledge_graph.jsonld')], cids_graph)
+        return
 
-                # 4. Save the knowledge graph to a file
-                output_filename = 'knowledge_graph.jsonld'
-                save_jsonld_to_file(knowledge_graph, output_filename)
-            else:
-                print("Analysis did not return any entities. Halting process.")
-        else:
-            print("Could not process the report due to an error in text extraction.")
-    else:
-        print("Could not run analysis because the CIDS ontology failed to load.")
+    # 2. Batch mode: one knowledge graph per report in the output directory, plus an index
+    os.makedirs(output_dir, exist_ok=True)
+    used_names = set()
+    reports = [(source, output_file_for(source, output_dir, used_names)) for source in sources]
+    print(f"Processing {len(reports)} report(s) into '{output_dir}'...")
+    await process_reports(reports, cids_graph, index_file=os.path.join(output_dir, "index.tsv"))
 
 if __name__ == "__main__":
     # Run the main asynchronous function
     asyncio.run(main())
-
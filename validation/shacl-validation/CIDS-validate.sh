@@ -23,7 +23,8 @@
 # chmod +x CIDS-validate.sh
 
 # Usage:
-#   ./CIDS-validate.sh [--basic] [--sff] [--codelists] [--code-violations] [--no-summary] [--rebuild-cache] <data_file>
+#   ./CIDS-validate.sh [--basic] [--sff] [--codelists] [--code-violations] [--no-summary] [--rebuild-cache] [--no-result-cache] [--prune-shapes] [--incremental | --previous DIR] [--jobs N] <data_file>
+#   ./CIDS-validate.sh [OPTIONS] <data_file>... | <directory> | --manifest <file>   (batch mode)
 #
 # Arguments:
 #   --basic            Validate against CIDS basic tier SHACL shapes
@@ -31,8 +32,18 @@
 #   --codelists        Include all .ttl files from CodeLists directory in validation
 #   --code-violations  Include violations from imported codelists in summary (default: excluded)
 #   --no-summary       Skip generation of violation summary reports
-#   --rebuild-cache    Force rebuild of cached merged codelists file
+#   --rebuild-cache    Refresh the cached codelists and shapes from the server (unchanged files are
+#                      not downloaded again) and rebuild the merged codelists file if any changed
+#   --no-result-cache  Always run Jena, ignoring (and not filling) the validation result cache
+#   --prune-shapes     Validate only against the shapes whose target classes occur in the data
+#   --incremental      Revalidate only the nodes that changed since the last run on this data file
+#                      and merge them with that run's reports (full validation when not possible)
+#   --previous DIR     Like --incremental, with the earlier validation folder DIR as the last run
+#   --jobs N           Run up to N shapes validations (and summaries) in parallel (default: 1);
+#                      in batch mode, the number of data files validated at once
+#   --manifest FILE    Batch mode: validate the data files listed in FILE (one path per line)
 #   <data_file>        Path to the JSON-LD data file to validate (required)
+#                      Several data files or a directory (searched for .jsonld/.json) switch to batch mode
 #
 # Examples:
 #   ./CIDS-validate.sh --basic CRGbasic.jsonld
@@ -40,6 +51,9 @@
 #   ./CIDS-validate.sh --basic --code-violations CRGbasic.jsonld
 #   ./CIDS-validate.sh --basic --no-summary data.jsonld
 #   ./CIDS-validate.sh --sff --codelists --rebuild-cache mydata.jsonld
+#   ./CIDS-validate.sh --basic --sff --codelists --jobs 2 mydata.jsonld
+#   ./CIDS-validate.sh --sff --codelists --jobs 4 submissions/
+#   ./CIDS-validate.sh --sff --codelists --incremental mydata.jsonld
 #
 # Output:
 #   Validation results are saved in: JenaValidator/validations/[filename][timestamp]/
@@ -48,8 +62,20 @@
 #   - Validation report files (*.ttl)
 #   - Warning files (*_warnings.txt)
 #   - Summary files (*_summary.txt) - unless --no-summary is used
-#   - Merged file (merged-file-[filename].ttl) - when --codelists is used
-#     (contains codelists and data merged with formatted Turtle output and prefix definitions)
+#   - Merged file (merged-file-[filename].nt) - when --codelists is used
+#     (N-Triples: the cached codelists followed by the data file)
+#   - Prepared data file (data-[filename].nt) - the validated N-Triples without --codelists
+#   - Input stamps (*_inputs.txt) - shapes, codelists and Jena version of each report,
+#     used by --incremental to check that a previous report can be reused
+#   - Pruned shapes files (pruned-shapes/) - when --prune-shapes is used
+#   Batch mode also creates JenaValidator/validations/batch-[timestamp]/ containing
+#   index.tsv (status and violation count per data file) and logs/ (one log per file)
+#
+# Validation result cache:
+#   Reports, warnings and summaries are also stored in cache/results/, keyed on the
+#   checksums of the data file, shapes file and codelist cache and on the Jena version.
+#   Validating unchanged inputs again restores them without running Jena. Entries
+#   not used for 30 days are removed at the start of each run.
 #
 # Basic usage of Jena's shacl validate (without this script):
 #   shacl validate -s cids.shacl.ttl -d my-data.jsonld > report.ttl
@@ -64,7 +90,16 @@ use_sff=false
 use_codelists=false
 include_code_violations=false
 rebuild_cache=false
-data_file=""
+use_result_cache=true
+prune_shapes=false
+incremental=false
+previous_folder=""
+jobs=1
+data_files=()
+manifest_file=""
+
+# Start time, used for the batch index row (see below)
+run_start_time=$(date +%s)
 
 while [[ $# -gt 0 ]]; do
   case $1 in
@@ -92,14 +127,46 @@ while [[ $# -gt 0 ]]; do
       rebuild_cache=true
       shift
       ;;
-    *)
-      # Assume this is the data file path
-      if [ -z "$data_file" ]; then
-        data_file="$1"
-      else
-        echo "Error: Multiple data files specified. Only one data file is allowed."
+    --no-result-cache)
+      use_result_cache=false
+      shift
+      ;;
+    --prune-shapes)
+      prune_shapes=true
+      shift
+      ;;
+    --incremental)
+      incremental=true
+      shift
+      ;;
+    --previous)
+      incremental=true
+      previous_folder="$2"
+      if [ ! -d "$previous_folder" ]; then
+        echo "Error: Previous validation folder not found: '$previous_folder'"
+        exit 1
+      fi
+      shift 2
+      ;;
+    --jobs)
+      jobs="$2"
+      if ! [[ "$jobs" =~ ^[1-9][0-9]*$ ]]; then
+        echo "Error: --jobs requires a positive integer"
+        exit 1
+      fi
+      shift 2
+      ;;
+    --manifest)
+      manifest_file="$2"
+      if [ ! -f "$manifest_file" ]; then
+        echo "Error: Manifest file not found: '$manifest_file'"
         exit 1
       fi
+      shift 2
+      ;;
+    *)
+      # Assume this is a data file (or directory) path
+      data_files+=("$1")
       shift
       ;;
   esac
@@ -108,19 +175,32 @@ done
 # Validate that at least one shapes file flag is provided
 if [ "$use_basic" = false ] && [ "$use_sff" = false ]; then
   echo "Error: At least one shapes file flag must be specified (--basic or --sff)"
-  echo "Usage: $0 [--basic] [--sff] [--codelists] [--code-violations] [--no-summary] <data_file>"
+  echo "Usage: $0 [--basic] [--sff] [--codelists] [--code-violations] [--no-summary] [--no-result-cache] [--prune-shapes] [--incremental] [--jobs N] <data_file>... | <directory> | --manifest <file>"
+  exit 1
+fi
+
+# Several data files, a directory or a manifest switch to batch mode (see below)
+batch_mode=false
+if [ -n "$manifest_file" ] || [ ${#data_files[@]} -gt 1 ] || [ -d "${data_files[@]:0:1}" ]; then
+  batch_mode=true
+fi
+data_file="${data_files[@]:0:1}"
+
+# Each batch worker finds its own previous run; a single folder only fits one data file
+if [ "$batch_mode" = true ] && [ -n "$previous_folder" ]; then
+  echo "Error: --previous takes a single data file; use --incremental in batch mode"
   exit 1
 fi
 
 # Validate that a data file was provided
-if [ -z "$data_file" ]; then
+if [ "$batch_mode" = false ] && [ -z "$data_file" ]; then
   echo "Error: Data file path is required"
-  echo "Usage: $0 [--basic] [--sff] [--codelists] [--code-violations] [--no-summary] <data_file>"
+  echo "Usage: $0 [--basic] [--sff] [--codelists] [--code-violations] [--no-summary] [--no-result-cache] [--prune-shapes] [--incremental] [--jobs N] <data_file>... | <directory> | --manifest <file>"
   exit 1
 fi
 
 # Validate that the data file exists
-if [ ! -f "$data_file" ]; then
+if [ "$batch_mode" = false ] && [ ! -f "$data_file" ]; then
   echo "Error: Data file not found: '$data_file'"
   exit 1
 fi
@@ -148,41 +228,30 @@ if [ -f "${script_dir}/cids-codes-and-orgs.ttl" ] && [ ! -f "${cache_dir}/cids-c
   mv "${script_dir}/cids-codes-and-orgs.ttl" "${cache_dir}/cids-codes-and-orgs.ttl"
 fi
 
-# Function to download a file from URL to cache directory
-download_file() {
-  local url="$1"
-  local cache_file="$2"
-  local file_name="$3"
+# Function to download files from URLs into a cache subdirectory
+# Downloads run concurrently over pooled keep-alive connections (see
+# RefreshCache/refresh_cache.py). Cached files are revalidated with conditional
+# requests (ETag / Last-Modified), so unchanged files are not transferred again.
+# Without rebuild, only files missing from the cache are downloaded.
+# Set CIDS_CACHE_BASE_URL (e.g. http://127.0.0.1:8000) to download from another server.
+refresh_cached_files() {
+  local cache_dir="$1"
+  local rebuild="$2"
+  local subdir="$3"
+  shift 3
+  local refresh_script="${cache_dir}/RefreshCache/refresh_cache.py"
   
-  # Check if curl is available
-  if ! command -v curl &> /dev/null; then
-    echo "Error: curl is required to download files but is not installed"
+  if [ ! -f "$refresh_script" ]; then
+    echo "Error: Cache refresh script not found at '$refresh_script'"
     return 1
   fi
   
-  # Download the file
-  if curl -sSfL -o "$cache_file" "$url" 2>/dev/null; then
-    # Verify the file was downloaded and has content
-    if [ -f "$cache_file" ] && [ -s "$cache_file" ]; then
-      return 0
-    else
-      echo "Error: Downloaded file is empty: $file_name"
-      rm -f "$cache_file"
-      return 1
-    fi
-  else
-    echo "Error: Failed to download $file_name from $url"
-    rm -f "$cache_file"
-    return 1
+  local refresh_args=("python3" "$refresh_script" "--cache-dir" "$cache_dir")
+  if [ "$rebuild" != true ]; then
+    refresh_args+=("--only-missing")
   fi
-}
-
-# Function to download a codelist file from URL to cache directory
-download_codelist() {
-  local url="$1"
-  local cache_file="$2"
-  local codelist_name="$3"
-  download_file "$url" "$cache_file" "$codelist_name"
+  refresh_args+=("--to" "$subdir" "$@")
+  "${refresh_args[@]}"
 }
 
 # Function to get SHACL filename from URL
@@ -217,7 +286,7 @@ ensure_shacl_files_cached() {
   
   local needs_download=false
   
-  # Check which files need to be downloaded
+  # Check which files need to be downloaded (with --rebuild-cache, all are revalidated)
   for url in "${shacl_urls[@]}"; do
     local filename=$(get_shacl_filename "$url")
     if [ -z "$filename" ]; then
@@ -233,25 +302,12 @@ ensure_shacl_files_cached() {
   
   if [ "$needs_download" = true ]; then
     if [ "$rebuild" = true ]; then
-      echo "Downloading SHACL shape files (--rebuild-cache flag set)..."
+      echo "Refreshing SHACL shape files (--rebuild-cache flag set)..."
     else
       echo "Downloading SHACL shape files..."
     fi
     
-    local download_failed=false
-    for url in "${shacl_urls[@]}"; do
-      local filename=$(get_shacl_filename "$url")
-      if [ -z "$filename" ]; then
-        continue
-      fi
-      local cached_file="${cache_dir}/shacl/${filename}"
-      
-      if ! download_file "$url" "$cached_file" "$filename"; then
-        download_failed=true
-      fi
-    done
-    
-    if [ "$download_failed" = true ]; then
+    if ! refresh_cached_files "$cache_dir" "$rebuild" "shacl" "${shacl_urls[@]}"; then
       echo "Error: Some SHACL shape files failed to download"
       return 1
     fi
@@ -304,11 +360,86 @@ if [ "$use_sff" = true ]; then
   fi
 fi
 
-# Function to create or update cached merged codelists file
+# Format version of the cached codelists artifact; bump when the build steps change
+codelist_artifact_version=1
+
+# Function to print the SHA-256 checksum of a file (macOS and Linux)
+file_sha256() {
+  local file="$1"
+  if command -v shasum &> /dev/null; then
+    shasum -a 256 "$file" | awk '{print $1}'
+  else
+    sha256sum "$file" | awk '{print $1}'
+  fi
+}
+
+# Function to print the version stamp of the cached codelists artifact
+# The stamp lists the artifact format version and the checksum of every source file,
+# so the artifact is rebuilt whenever any codelist changes.
+codelist_version_stamp() {
+  echo "version ${codelist_artifact_version}"
+  local source_file
+  for source_file in "$@"; do
+    echo "$(file_sha256 "$source_file") $(basename "$source_file")"
+  done
+}
+
+# Function to print the SHA-256 checksum of a string
+string_sha256() {
+  if command -v shasum &> /dev/null; then
+    printf '%s' "$1" | shasum -a 256 | awk '{print $1}'
+  else
+    printf '%s' "$1" | sha256sum | awk '{print $1}'
+  fi
+}
+
+# Validation result cache
+# A report depends only on the data file (content and location), the shapes file,
+# the codelist cache and the Jena version, so it is stored in cache/results/[key]/
+# under a checksum of those inputs and restored instead of running Jena again.
+# Bump result_cache_version when the way reports are produced changes.
+result_cache_version=2
+result_cache_dir="${cache_dir}/results"
+# Entries not used for this many days are removed (see prune_result_cache)
+result_cache_max_age_days=30
+
+# Function to remove result cache entries that were not used recently
+# Restoring a report or node type counts updates the entry's modification time, so
+# entries are removed least-recently-used first, once they have not been used
+# (or filled) for result_cache_max_age_days days.
+prune_result_cache() {
+  if [ ! -d "$result_cache_dir" ]; then
+    return 0
+  fi
+  find "$result_cache_dir" -mindepth 1 -maxdepth 1 -mtime +"$result_cache_max_age_days" \
+    -exec rm -rf {} + 2>/dev/null
+  return 0
+}
+
+# Function to print the Jena version used in result cache keys
+# Starting Jena takes a while, so the version is cached per 'shacl' executable
+# (path and modification time); upgrading Jena changes one or the other.
+jena_tool_version() {
+  local shacl_cmd=$(command -v shacl)
+  local shacl_mtime=$(stat -f %m "$shacl_cmd" 2>/dev/null || stat -c %Y "$shacl_cmd" 2>/dev/null)
+  local version_file="${result_cache_dir}/jena-version-$(string_sha256 "${shacl_cmd} ${shacl_mtime}").txt"
+  if [ ! -s "$version_file" ]; then
+    mkdir -p "$result_cache_dir"
+    shacl --version 2>&1 | tr -s ' \n' ' ' > "$version_file"
+  fi
+  cat "$version_file"
+}
+
+# Function to create or update the cached merged codelists file
+# The cache is a single N-Triples file, validated once when it is built, so each
+# validation only has to convert the data file and append it to the codelists.
+# A version stamp ([cache_file].version) records which source files it was built from,
+# so it is only rebuilt when a refresh actually changed a codelist.
 create_cached_codelists() {
   local cache_file="$1"
   local rebuild="$2"
   local cache_dir="$3"
+  local stamp_file="${cache_file}.version"
   
   # Base URL for codelist files
   local codelist_base_url="https://codelist.commonapproach.org"
@@ -331,91 +462,79 @@ create_cached_codelists() {
     "UnitsOfMeasureList.ttl"
   )
   
-  # Check if cache needs to be rebuilt
+  # Check if codelists need to be downloaded and the cache rebuilt
+  local needs_download=false
   local needs_rebuild=false
   
   if [ "$rebuild" = true ]; then
-    needs_rebuild=true
-    echo "Rebuilding cached codelists file (--rebuild-cache flag set)..."
-  elif [ ! -f "$cache_file" ]; then
-    needs_rebuild=true
-    echo "Cached codelists file not found. Creating cache..."
+    needs_download=true
+    echo "Refreshing codelist files (--rebuild-cache flag set)..."
   else
-    # Check if any cached codelist file is missing or if cids-codes-and-orgs.ttl is newer
-    local cache_mtime=$(stat -f %m "$cache_file" 2>/dev/null || stat -c %Y "$cache_file" 2>/dev/null)
-    
     # Check individual codelist cache files
     for codelist_name in "${codelist_names[@]}"; do
       local cached_codelist_file="${cache_dir}/codelists/${codelist_name}"
       if [ ! -f "$cached_codelist_file" ]; then
-        needs_rebuild=true
-        echo "Cached codelist file missing: ${codelist_name}. Rebuilding cache..."
+        needs_download=true
+        echo "Cached codelist file missing: ${codelist_name}. Downloading missing codelists..."
         break
       fi
     done
-    
-    # Also check cids-codes-and-orgs.ttl
-    if [ "$needs_rebuild" = false ]; then
-      local cids_codes_file="${cache_dir}/cids-codes-and-orgs.ttl"
-      if [ -f "$cids_codes_file" ]; then
-        local cids_mtime=$(stat -f %m "$cids_codes_file" 2>/dev/null || stat -c %Y "$cids_codes_file" 2>/dev/null)
-        if [ "$cids_mtime" -gt "$cache_mtime" ]; then
-          needs_rebuild=true
-          echo "Cached codelists file is stale (cids-codes-and-orgs.ttl is newer). Rebuilding cache..."
-        fi
-      fi
-    fi
   fi
   
-  if [ "$needs_rebuild" = true ]; then
-    # Create codelists cache subdirectory
-    mkdir -p "${cache_dir}/codelists"
-    
-    # Download codelist files from URLs
+  if [ "$needs_download" = true ]; then
+    # Download (or revalidate) the codelist files from URLs
     echo "Downloading codelist files from ${codelist_base_url}..."
-    local download_failed=false
+    local codelist_urls=()
     for codelist_name in "${codelist_names[@]}"; do
-      local url="${codelist_base_url}/${codelist_name}"
-      local cached_codelist_file="${cache_dir}/codelists/${codelist_name}"
-      
-      if ! download_codelist "$url" "$cached_codelist_file" "$codelist_name"; then
-        download_failed=true
-      fi
+      codelist_urls+=("${codelist_base_url}/${codelist_name}")
     done
     
-    if [ "$download_failed" = true ]; then
+    if ! refresh_cached_files "$cache_dir" "$rebuild" "codelists" "${codelist_urls[@]}"; then
       echo "Error: Some codelist files failed to download"
       return 1
     fi
-    
-    # Collect source files (now from cache directory)
-    local source_files=()
-    for codelist_name in "${codelist_names[@]}"; do
-      local cached_codelist_file="${cache_dir}/codelists/${codelist_name}"
-      if [ -f "$cached_codelist_file" ]; then
-        source_files+=("$cached_codelist_file")
-      else
-        echo "Warning: Cached codelist file not found: '$codelist_name'"
-      fi
-    done
-    
-    # Add cids-codes-and-orgs.ttl
-    local cids_codes_file="${cache_dir}/cids-codes-and-orgs.ttl"
-    if [ -f "$cids_codes_file" ]; then
-      source_files+=("$cids_codes_file")
-    fi
-    
-    if [ ${#source_files[@]} -eq 0 ]; then
-      echo "Error: No codelist files found to create cache"
-      return 1
+  fi
+  
+  # Collect source files (now from cache directory)
+  local source_files=()
+  for codelist_name in "${codelist_names[@]}"; do
+    local cached_codelist_file="${cache_dir}/codelists/${codelist_name}"
+    if [ -f "$cached_codelist_file" ]; then
+      source_files+=("$cached_codelist_file")
+    else
+      echo "Warning: Cached codelist file not found: '$codelist_name'"
     fi
-    
-    # Create temporary files for two-step conversion
+  done
+  
+  # Add cids-codes-and-orgs.ttl
+  local cids_codes_file="${cache_dir}/cids-codes-and-orgs.ttl"
+  if [ -f "$cids_codes_file" ]; then
+    source_files+=("$cids_codes_file")
+  fi
+  
+  if [ ${#source_files[@]} -eq 0 ]; then
+    echo "Error: No codelist files found to create cache"
+    return 1
+  fi
+  
+  # Compare the version stamp of the cached file with the current source files
+  local expected_stamp="$(codelist_version_stamp "${source_files[@]}")"
+  if [ ! -s "$cache_file" ] || [ ! -f "$stamp_file" ]; then
+    needs_rebuild=true
+    echo "Cached codelists file not found. Creating cache..."
+  elif [ "$(cat "$stamp_file")" != "$expected_stamp" ]; then
+    needs_rebuild=true
+    echo "Cached codelists file is stale (codelist sources or format changed). Rebuilding cache..."
+  fi
+  
+  if [ "$needs_rebuild" = true ]; then
+    # Build into temporary files so a failed build never leaves a partial cache behind
     local temp_nt_file="${cache_dir}/.temp_codelists_cache.nt"
+    local temp_cache_file="${cache_file}.tmp"
     local temp_stderr_file="${cache_dir}/.temp_codelists_cache.stderr"
-    local prefixes_file="${cache_dir}/prefixes.ttl"
+    rm -f "$stamp_file"
     
-    # Step 1: Convert codelist files to N-Triples
+    # Step 1: Convert codelist files to N-Triples (resolves relative IRIs)
     local step1_args=("riot" "--output=N-Triples")
     for source_file in "${source_files[@]}"; do
       step1_args+=("$source_file")
@@ -433,29 +552,29 @@ create_cached_codelists() {
       return 1
     fi
     
-    # Step 2: Convert N-Triples to formatted Turtle with prefix definitions
-    local step2_args=("riot" "--formatted=TURTLE")
-    if [ -f "$prefixes_file" ]; then
-      step2_args+=("$prefixes_file")
-    fi
-    step2_args+=("$temp_nt_file")
-    
-    "${step2_args[@]}" > "$cache_file" 2> "$temp_stderr_file"
-    local step2_exit_code=$?
+    # Step 2: Prefix blank node labels so they cannot clash with the labels of a
+    # data file appended to the codelists (N-Triples labels are scoped per file)
+    sed -E 's/^_:/_:codelist/; s/ _:([^ "]+) \.$/ _:codelist\1 ./' "$temp_nt_file" > "$temp_cache_file"
+    rm -f "$temp_nt_file"
     
-    # Clean up temporary files
-    rm -f "$temp_nt_file" "$temp_stderr_file"
+    # Step 3: Validate the artifact once, so validations can append to it as is
+    riot --validate --syntax=N-Triples "$temp_cache_file" > "$temp_stderr_file" 2>&1
+    local step3_exit_code=$?
     
-    if [ $step2_exit_code -ne 0 ] || [ ! -f "$cache_file" ] || [ ! -s "$cache_file" ]; then
+    if [ $step3_exit_code -ne 0 ] || [ ! -s "$temp_cache_file" ]; then
       echo "Error: Failed to create cached codelists file"
       if [ -s "$temp_stderr_file" ]; then
-        cat "$temp_stderr_file"
+        head -20 "$temp_stderr_file"
       fi
-      rm -f "$cache_file"
+      rm -f "$temp_cache_file" "$temp_stderr_file"
       return 1
     fi
     
-    echo "Cached codelists file created successfully: $cache_file"
+    rm -f "$temp_stderr_file"
+    mv -f "$temp_cache_file" "$cache_file"
+    echo "$expected_stamp" > "$stamp_file"
+    
+    echo "Cached codelists file created successfully: $cache_file ($(wc -l < "$cache_file" | tr -d ' ') triples)"
   else
     echo "Using cached codelists file: $cache_file"
   fi
@@ -465,7 +584,7 @@ create_cached_codelists() {
 
 # Collect codelist files if --codelists flag is set
 codelist_files=()
-cached_codelists_file="${cache_dir}/merged-codelists.ttl"
+cached_codelists_file="${cache_dir}/merged-codelists.nt"
 
 if [ "$use_codelists" = true ]; then
   # Create or update cached merged codelists file (downloads from URLs if needed)
@@ -479,19 +598,169 @@ if [ "$use_codelists" = true ]; then
   fi
 fi
 
-echo "Starting SHACL validation process for '$data_file'..."
+# Function to list the data files of a batch, one per line
+# Directories are searched recursively for .jsonld and .json files (sorted by path);
+# manifest lines are paths relative to the manifest ('#' comments and blank lines are skipped).
+list_batch_files() {
+  local entry line
+  if [ -n "$manifest_file" ]; then
+    local manifest_dir="$(cd "$(dirname "$manifest_file")" && pwd)"
+    while IFS= read -r line || [ -n "$line" ]; do
+      line="${line%%#*}"
+      line="$(echo "$line" | sed 's/^[[:space:]]*//; s/[[:space:]]*$//')"
+      if [ -z "$line" ]; then
+        continue
+      fi
+      case "$line" in
+        /*) echo "$line" ;;
+        *) echo "${manifest_dir}/${line}" ;;
+      esac
+    done < "$manifest_file"
+  fi
+  for entry in "${data_files[@]}"; do
+    if [ -d "$entry" ]; then
+      find "$entry" -type f \( -name '*.jsonld' -o -name '*.json' \) | LC_ALL=C sort
+    else
+      echo "$entry"
+    fi
+  done
+}
 
-# Check if the data file has a .json extension and create a temporary .jsonld file if needed
-if [[ "$data_file" == *.json ]]; then
-  echo "Converting .json file to .jsonld for Jena compatibility..."
-  temp_data_file="${data_file%.json}.jsonld"
-  cp "$data_file" "$temp_data_file"
-  echo "Created temporary file: $temp_data_file"
-  data_file_for_validation="$temp_data_file"
-else
-  data_file_for_validation="$data_file"
+# Batch mode: validate every data file with a bounded pool of workers
+# The shapes and codelist caches are prepared once above; each worker runs this
+# script for one data file (reusing the caches and the result cache) and writes
+# its row of the batch index, so the index is in input order whatever finishes first.
+if [ "$batch_mode" = true ]; then
+  batch_files=()
+  while IFS= read -r batch_file; do
+    if [ -f "$batch_file" ]; then
+      batch_files+=("$batch_file")
+    else
+      echo "Warning: Data file not found, skipping: '$batch_file'"
+    fi
+  done < <(list_batch_files)
+  
+  if [ ${#batch_files[@]} -eq 0 ]; then
+    echo "Error: No data files found to validate"
+    exit 1
+  fi
+  
+  # Look up the Jena version once, instead of in every worker at the same time
+  if [ "$use_result_cache" = true ] || [ "$incremental" = true ]; then
+    jena_tool_version > /dev/null
+  fi
+  
+  # Expire old result cache entries once, before the workers use the cache
+  if [ "$use_result_cache" = true ]; then
+    prune_result_cache
+  fi
+  
+  # Options passed to every worker (the caches are already up to date)
+  worker_args=()
+  [ "$use_basic" = true ] && worker_args+=("--basic")
+  [ "$use_sff" = true ] && worker_args+=("--sff")
+  [ "$use_codelists" = true ] && worker_args+=("--codelists")
+  [ "$include_code_violations" = true ] && worker_args+=("--code-violations")
+  [ "$skip_summary" = true ] && worker_args+=("--no-summary")
+  [ "$use_result_cache" = false ] && worker_args+=("--no-result-cache")
+  [ "$prune_shapes" = true ] && worker_args+=("--prune-shapes")
+  [ "$incremental" = true ] && worker_args+=("--incremental")
+  
+  # Run the workers with the same shell as this script
+  if [ -n "$ZSH_VERSION" ]; then
+    worker_shell="zsh"
+    worker_script="${(%):-%x}"
+  else
+    worker_shell="bash"
+    worker_script="${BASH_SOURCE[0]}"
+  fi
+  
+  batch_folder="${script_dir}/validations/batch-$(date +"%Y%m%d-%H%M%S")"
+  mkdir -p "${batch_folder}/logs"
+  
+  echo "==================================="
+  echo "Batch validation of ${#batch_files[@]} data file(s) with up to $jobs worker(s)"
+  echo "Batch results will be saved in: '$batch_folder/'"
+  echo "==================================="
+  
+  batch_start_time=$(date +%s)
+  running_pids=()
+  row_files=()
+  file_number=0
+  for batch_file in "${batch_files[@]}"; do
+    file_number=$((file_number + 1))
+    
+    # Wait until a worker slot is free (whichever worker finishes first)
+    while [ ${#running_pids[@]} -ge "$jobs" ]; do
+      still_running=()
+      for pid in "${running_pids[@]}"; do
+        if kill -0 "$pid" 2>/dev/null; then
+          still_running+=("$pid")
+        else
+          wait "$pid"
+        fi
+      done
+      running_pids=("${still_running[@]}")
+      if [ ${#running_pids[@]} -ge "$jobs" ]; then
+        sleep 0.2
+      fi
+    done
+    
+    job_name="$(printf '%05d' "$file_number")-$(basename "$batch_file")"
+    row_file="${batch_folder}/logs/${job_name}.row"
+    row_files+=("$row_file")
+    echo "[$file_number/${#batch_files[@]}] Validating '$batch_file'..."
+    CIDS_BATCH_ROW_FILE="$row_file" "$worker_shell" "$worker_script" "${worker_args[@]}" "$batch_file" \
+      > "${batch_folder}/logs/${job_name}.log" 2>&1 < /dev/null &
+    running_pids+=($!)
+  done
+  
+  # Wait for the remaining workers
+  for pid in "${running_pids[@]}"; do
+    wait "$pid"
+  done
+  batch_elapsed=$(( $(date +%s) - batch_start_time ))
+  
+  # Roll up the worker rows into the batch index (a worker that failed leaves no row)
+  index_file="${batch_folder}/index.tsv"
+  printf 'data_file\tstatus\tviolations\treports\tseconds\tvalidation_folder\n' > "$index_file"
+  for batch_file in "${batch_files[@]}"; do
+    row_file="${row_files[@]:0:1}"
+    row_files=("${row_files[@]:1}")
+    if [ -s "$row_file" ]; then
+      cat "$row_file" >> "$index_file"
+      rm -f "$row_file"
+    else
+      printf '%s\terror\t\t\t\t\n' "$batch_file" >> "$index_file"
+    fi
+  done
+  
+  passed=$(awk -F '\t' 'NR > 1 && $2 == "pass"' "$index_file" | wc -l | tr -d ' ')
+  failed=$(awk -F '\t' 'NR > 1 && $2 == "fail"' "$index_file" | wc -l | tr -d ' ')
+  errors=$(awk -F '\t' 'NR > 1 && $2 == "error"' "$index_file" | wc -l | tr -d ' ')
+  throughput=$(awk -v files="${#batch_files[@]}" -v seconds="$batch_elapsed" \
+    'BEGIN { if (seconds < 1) seconds = 1; printf "%.1f", files * 60 / seconds }')
+  
+  echo "==================================="
+  if [ "$errors" -gt 0 ] || [ "$failed" -gt 0 ]; then
+    echo "Batch validation complete."
+  else
+    echo "Batch validation complete. ✅"
+  fi
+  echo "  Passed: $passed, failed: $failed, errors: $errors (logs in '${batch_folder}/logs/')"
+  echo "  ${#batch_files[@]} file(s) in ${batch_elapsed}s (${throughput} files/minute)"
+  echo "  Index written to: '$index_file'"
+  # Exit status for CI: 1 if any file could not be validated, 2 if any file has violations
+  if [ "$errors" -gt 0 ]; then
+    exit 1
+  elif [ "$failed" -gt 0 ]; then
+    exit 2
+  fi
+  exit 0
 fi
 
+echo "Starting SHACL validation process for '$data_file'..."
+
 # Get the data file's name without its extension (e.g., "my-data")
 # Handle filenames with multiple dots by removing only the last extension
 data_file_prefix=${data_file:r}
@@ -513,17 +782,24 @@ validation_folder_name="${data_file_basename_no_ext}${date_time_stamp}"
 # script_dir is already defined earlier, just set validations_base_dir
 validations_base_dir="${script_dir}/validations"
 
-# Locate prefixes file for formatted Turtle output (now in cache directory)
-prefixes_file="${cache_dir}/prefixes.ttl"
-
 # Create the validations base directory if it doesn't exist
 mkdir -p "$validations_base_dir"
 
 # Full path to validation folder
 validation_folder="${validations_base_dir}/${validation_folder_name}"
 
-echo "Creating validation results folder: '$validation_folder'"
-mkdir -p "$validation_folder"
+# Runs started in the same second (e.g. batch workers validating files with the
+# same name) would share a folder, so add a counter when the folder already exists
+folder_suffix=1
+while ! mkdir "$validation_folder" 2>/dev/null; do
+  folder_suffix=$((folder_suffix + 1))
+  validation_folder="${validations_base_dir}/${validation_folder_name}-${folder_suffix}"
+  if [ $folder_suffix -gt 100 ]; then
+    echo "Error: Could not create validation results folder in '$validations_base_dir'"
+    exit 1
+  fi
+done
+echo "Created validation results folder: '$validation_folder'"
 
 # Copy the source file to the validation folder
 echo "Copying source file to validation folder..."
@@ -535,9 +811,14 @@ echo "Validation results will be saved in: '$validation_folder/'"
 echo "==================================="
 
 # Cross-shell yes/no prompt helper (works in zsh and bash)
+# Answers "no" without prompting when stdin is not a terminal (unattended runs)
 ask_yes_no() {
   local prompt_msg="$1"
   local reply
+  if [ ! -t 0 ]; then
+    echo "${prompt_msg} N (not running interactively)"
+    return 1
+  fi
   if [ -n "$ZSH_VERSION" ]; then
     read -q "reply?${prompt_msg} "
     echo ""
@@ -549,11 +830,228 @@ ask_yes_no() {
   fi
 }
 
+# Function to print the stamp of the inputs (other than the data) of one shapes file's report
+# A report can only be reused, from the result cache or by --incremental, when the
+# shapes file, codelist cache, pruning and Jena version are the same.
+# Prints nothing when the shapes file is not a local file (remote shapes cannot be checksummed).
+validation_inputs_stamp() {
+  local shapes_file="$1"
+  local codelist_stamp="none"
+  if [ ! -f "$shapes_file" ]; then
+    return 0
+  fi
+  if [ ${#codelist_files[@]} -gt 0 ]; then
+    codelist_stamp=$(cat "${cached_codelists_file}.version" 2>/dev/null)
+  fi
+  echo "shapes $(file_sha256 "$shapes_file")
+codelists ${codelist_stamp}
+prune-shapes ${prune_shapes}
+jena ${jena_version}"
+}
+
+# Function to print the result cache key for a report, given its inputs stamp
+# Prints nothing when the stamp is empty.
+result_cache_key() {
+  local inputs_stamp="$1"
+  if [ -z "$inputs_stamp" ]; then
+    return 0
+  fi
+  string_sha256 "result-cache ${result_cache_version}
+data ${data_file_sha256} ${data_file_location}
+${inputs_stamp}"
+}
+
+# Function to store a file in a result cache entry
+# The file is copied under a temporary name and renamed, so concurrent runs
+# never see a partially written entry.
+store_cached_result() {
+  local key="$1"
+  local source_file="$2"
+  local entry_name="$3"
+  local entry_dir="${result_cache_dir}/${key}"
+  mkdir -p "$entry_dir"
+  if cp "$source_file" "${entry_dir}/.${entry_name}.$$.tmp" 2>/dev/null; then
+    mv -f "${entry_dir}/.${entry_name}.$$.tmp" "${entry_dir}/${entry_name}"
+  fi
+}
+
+# Prepared data file (see prepare_data_file)
+# Kept in the validation folder when it is the validated file, for later --incremental runs
+data_nt_file="${validation_folder}/data-${safe_data_file_prefix}.nt"
+prepare_warning_file="${validation_folder}/.prepare_${safe_data_file_prefix}_warnings.txt"
+data_prepared=false
+
+# Function to prepare the data file: parse it once with riot into N-Triples
+# The N-Triples (with relative IRIs resolved) are used for the codelist merge, for
+# validation and for counting node types, so no later step parses the data again.
+# Runs at most once per run, and only when a step needs the data (cached results
+# do not). Returns non-zero if the data file could not be converted.
+prepare_data_file() {
+  if [ "$data_prepared" = true ]; then
+    [ -s "$data_nt_file" ]
+    return
+  fi
+  data_prepared=true
+  
+  # Plain .json files hold JSON-LD; tell riot the syntax instead of copying them to .jsonld
+  local riot_args=("riot" "--output=N-Triples")
+  if [[ "$data_file" == *.json ]]; then
+    riot_args+=("--syntax=jsonld")
+  fi
+  riot_args+=("$data_file")
+  
+  echo "Preparing data file (parsing to N-Triples)..."
+  "${riot_args[@]}" > "$data_nt_file" 2> "$prepare_warning_file"
+  local riot_exit_code=$?
+  
+  # Only fail if file doesn't exist or is empty (warnings from data file are expected)
+  if [ ! -s "$data_nt_file" ]; then
+    echo "  ⚠️  Warning: Failed to convert data file to N-Triples"
+    if [ -s "$prepare_warning_file" ]; then
+      echo "  Error details:"
+      head -20 "$prepare_warning_file"
+    fi
+    rm -f "$data_nt_file"
+    return 1
+  fi
+  if [ $riot_exit_code -ne 0 ]; then
+    echo "  ⚠️  Warning: Errors found while converting the data file (see warning files)"
+  fi
+  echo "  ✓ Data file prepared ($(wc -l < "$data_nt_file" | tr -d ' ') triples)"
+  return 0
+}
+
+# Validate the data file against one shapes file
+# Writes the report, warning and inputs stamp files; progress messages go to stdout.
+# With --incremental, only the nodes that changed since the previous run are validated
+# when that run used the same inputs (see IncrementalValidation/incremental_validate.py).
+# In parallel mode (--jobs N), several calls run at the same time; they only
+# read the prepared (or merged) data file, which is built before the validations start.
+validate_shapes_file() {
+  local current_shapes_file="$1"
+  local report_file="$2"
+  local warning_file="$3"
+  local result_key="$4"
+  local inputs_stamp="$5"
+  local validate_args validate_exit_code
+  local previous_report="${previous_folder}/$(basename "$report_file")"
+  local incremental_done=false
+  
+  # Build the shacl validate command with the merged file (codelists + data) or the main data file
+  # Use non-verbose output for cleaner LLM analysis
+  # Capture stderr (warnings) separately from stdout (TTL report)
+  
+  # Start from the warnings of parsing the data file (shared by all shapes files)
+  if [ -s "$prepare_warning_file" ]; then
+    cp "$prepare_warning_file" "$warning_file"
+  else
+    : > "$warning_file"
+  fi
+  
+  # Reuse the previous report if it was made from the same inputs (apart from the data)
+  if [ -n "$previous_data_file" ] && [ -n "$inputs_stamp" ] && [ -s "$previous_report" ] && \
+     [ "$(cat "${previous_report%.ttl}_inputs.txt" 2>/dev/null)" = "$inputs_stamp" ]; then
+    echo "  Validating changes since '$previous_folder'..."
+    if python3 "$incremental_script" --previous-data "$previous_data_file" --previous-report "$previous_report" \
+         --data "$validation_data_file" --shapes "$current_shapes_file" --output "$report_file" 2>> "$warning_file"; then
+      incremental_done=true
+    else
+      echo "  Falling back to a full validation"
+    fi
+  elif [ -n "$previous_data_file" ]; then
+    echo "  Previous report missing or made with other shapes, codelists or Jena version; running a full validation"
+  fi
+  
+  validate_exit_code=0
+  if [ "$incremental_done" = false ]; then
+    validate_args=("shacl" "validate" "--shapes" "$current_shapes_file" "--data" "$validation_data_file")
+    "${validate_args[@]}" > "$report_file" 2>> "$warning_file"
+    validate_exit_code=$?
+  fi
+  
+  if [ $validate_exit_code -ne 0 ] && [ -n "$merged_file" ]; then
+    echo "  ⚠️  Warning: Error during validation with merged codelist files"
+  fi
+  
+  # Record the inputs of the report for later --incremental runs
+  if [ $validate_exit_code -eq 0 ] && [ -n "$inputs_stamp" ]; then
+    echo "$inputs_stamp" > "${report_file%.ttl}_inputs.txt"
+  fi
+  
+  # Fill the result cache (warnings first, so an entry with a report is complete)
+  # Only full validations are stored, so cached reports never depend on an earlier run
+  if [ $validate_exit_code -eq 0 ] && [ "$incremental_done" = false ] && [ -n "$result_key" ] && [ -s "$report_file" ]; then
+    store_cached_result "$result_key" "$warning_file" "warnings.txt"
+    store_cached_result "$result_key" "$report_file" "report.ttl"
+  fi
+  
+  echo "--> Success: Report saved to '$report_file'."
+  echo "--> Warnings saved to '$warning_file'."
+}
+
 # Create empty arrays to hold the list of report files and warning files
 report_files_list=()
 warning_files_list=()
 
+# Result cache key of each report (empty when the report is not cached)
+report_cache_keys=()
+
+# Validations to run (shapes file, report file, warning file, shapes prefix, result cache key, inputs stamp)
+pending_shapes_files=()
+pending_report_files=()
+pending_warning_files=()
+pending_shacl_prefixes=()
+pending_cache_keys=()
+pending_inputs_stamps=()
+
+# Checksums shared by the result cache keys of all shapes files
+# (old entries are expired first; batch workers leave that to the batch run)
+if [ "$use_result_cache" = true ]; then
+  if [ -z "$CIDS_BATCH_ROW_FILE" ]; then
+    prune_result_cache
+  fi
+  data_file_sha256=$(file_sha256 "$data_file")
+  # Relative IRIs in the data resolve against its location, so the path is part of the key
+  data_file_location="$(cd "$(dirname "$data_file")" && pwd)/$(basename "$data_file")"
+fi
+if [ "$use_result_cache" = true ] || [ "$incremental" = true ]; then
+  jena_version=$(jena_tool_version)
+fi
+
+# Function to print the validated N-Triples file kept in a validation folder (if any)
+previous_validated_data() {
+  find "$1" -maxdepth 1 \( -name 'merged-file-*.nt' -o -name 'data-*.nt' \) 2>/dev/null | sort | head -1
+}
+
+# Find the previous run for --incremental: the given folder (--previous), or the newest
+# earlier validation folder of this data file that kept its validated N-Triples
+previous_data_file=""
+incremental_script="${cache_dir}/IncrementalValidation/incremental_validate.py"
+if [ "$incremental" = true ]; then
+  if [ -z "$previous_folder" ]; then
+    while IFS= read -r candidate_folder; do
+      if [ "$candidate_folder" != "$validation_folder" ] && [ -n "$(previous_validated_data "$candidate_folder")" ]; then
+        previous_folder="$candidate_folder"
+      fi
+    done < <(find "$validations_base_dir" -mindepth 1 -maxdepth 1 -type d -name "${data_file_basename_no_ext}[0-9]*" | sort)
+  fi
+  if [ ! -f "$incremental_script" ]; then
+    echo "⚠️  Warning: Incremental validation script not found at '$incremental_script'; running a full validation"
+  elif [ -z "$previous_folder" ]; then
+    echo "No previous validation of '$data_file_basename' found; running a full validation"
+  else
+    previous_data_file=$(previous_validated_data "$previous_folder")
+    if [ -z "$previous_data_file" ]; then
+      echo "⚠️  Warning: No validated N-Triples file in '$previous_folder'; running a full validation"
+    else
+      echo "Incremental validation against the previous run in '$previous_folder'"
+    fi
+  fi
+  echo ""
+fi
+
 # Loop through each file in the shapes_files array
+# Overwrite prompts are answered here, before any validation job is started
 for current_shapes_file in "${shapes_files[@]}"; do
   # First, get just the filename from the full path (e.g., "cids.shacl.ttl")
   filename_only=${current_shapes_file:t}
@@ -564,185 +1062,181 @@ for current_shapes_file in "${shapes_files[@]}"; do
   # Dynamically generate the report filename using the specified format
           report_file="${validation_folder}/report-${shacl_prefix}-${safe_data_file_prefix}.ttl"
 
-  echo "Validating with '$current_shapes_file'..."
-  
   # Generate warning file name (replace .ttl with _warnings.txt)
   warning_file="${report_file%.ttl}_warnings.txt"
   
+  report_files_list+=("$report_file") # Add the report file to the list
+  warning_files_list+=("$warning_file") # Add the warning file to the list (may not exist)
+  
   # Check if report file already exists and prompt user
   if [ -f "$report_file" ]; then
     echo "⚠️  Report file '$report_file' already exists."
     if ! ask_yes_no "Overwrite existing file? (y/N):"; then
       echo "  Skipping validation for '$current_shapes_file' (using existing report)"
-      report_files_list+=("$report_file") # Add existing report to the list
-      warning_files_list+=("$warning_file") # Add warning file to the list (may not exist)
+      report_cache_keys+=("")
       echo "" # Add a blank line for readability
       continue
     fi
     echo "  Proceeding with validation (will overwrite existing file)"
   fi
   
-  # Build the shacl validate command with primary data file and any codelist files
-  # Use non-verbose output for cleaner LLM analysis
-  # Capture stderr (warnings) separately from stdout (TTL report)
+  # Restore the report from the result cache if these inputs were validated before
+  inputs_stamp=""
+  result_key=""
+  if [ "$use_result_cache" = true ] || [ "$incremental" = true ]; then
+    inputs_stamp=$(validation_inputs_stamp "$current_shapes_file")
+  fi
+  if [ "$use_result_cache" = true ]; then
+    result_key=$(result_cache_key "$inputs_stamp")
+  fi
+  report_cache_keys+=("$result_key")
+  if [ -n "$result_key" ] && [ -s "${result_cache_dir}/${result_key}/report.ttl" ]; then
+    cp "${result_cache_dir}/${result_key}/report.ttl" "$report_file"
+    cp "${result_cache_dir}/${result_key}/warnings.txt" "$warning_file" 2>/dev/null || : > "$warning_file"
+    touch "${result_cache_dir}/${result_key}"
+    echo "$inputs_stamp" > "${report_file%.ttl}_inputs.txt"
+    echo "Using cached validation result for '$current_shapes_file' (key ${result_key:0:12})"
+    echo "--> Report restored to '$report_file'."
+    echo "" # Add a blank line for readability
+    continue
+  fi
   
-  # If codelist files are included, we need to merge them with the main data file
-  # because Jena's shacl validate appears to only use the last --data file when multiple are provided
-  if [ ${#codelist_files[@]} -gt 0 ]; then
-    # Create merged file in validation folder
-    merged_file="${validation_folder}/merged-file-${safe_data_file_prefix}.ttl"
-    
-    # Create temporary files for two-step conversion
-    temp_codelists_nt="${validation_folder}/.temp_codelists_${shacl_prefix}_${safe_data_file_prefix}.nt"
-    temp_merged_nt="${validation_folder}/.temp_merged_${shacl_prefix}_${safe_data_file_prefix}.nt"
-    temp_stderr_file="${validation_folder}/.temp_merged_${shacl_prefix}_${safe_data_file_prefix}.stderr"
-    
-    # Step 1a: Convert codelist files to N-Triples (static reference data - should always work)
-    echo "  Merging ${#codelist_files[@]} codelist file(s)..."
-    echo "  Step 1a: Converting codelists to N-Triples..."
-    step1a_args=("riot" "--output=N-Triples")
-    for codelist_file in "${codelist_files[@]}"; do
-      step1a_args+=("$codelist_file")
-    done
-    
-    "${step1a_args[@]}" > "$temp_codelists_nt" 2> "$temp_stderr_file"
-    step1a_exit_code=$?
-    
-    if [ $step1a_exit_code -ne 0 ] || [ ! -f "$temp_codelists_nt" ] || [ ! -s "$temp_codelists_nt" ]; then
-      echo "  ⚠️  Error: Failed to convert codelists to N-Triples"
-      if [ -s "$temp_stderr_file" ]; then
-        echo "  Error details:"
-        head -20 "$temp_stderr_file"
-      fi
-    else
-      echo "  ✓ Codelists converted to N-Triples ($(wc -l < "$temp_codelists_nt" | tr -d ' ') lines)"
+  pending_shapes_files+=("$current_shapes_file")
+  pending_report_files+=("$report_file")
+  pending_warning_files+=("$warning_file")
+  pending_shacl_prefixes+=("$shacl_prefix")
+  pending_cache_keys+=("$result_key")
+  pending_inputs_stamps+=("$inputs_stamp")
+done
+
+# Prepare the data file and merge the codelists with it once for all shapes files
+# If codelist files are included, we need to merge them with the main data file
+# because Jena's shacl validate appears to only use the last --data file when multiple are provided.
+# The prepared N-Triples are appended to the prebuilt N-Triples codelists file,
+# so the merge time depends on the data file only.
+validation_data_file="$data_file"
+merged_file=""
+temp_data_file=""
+if [ ${#pending_shapes_files[@]} -gt 0 ]; then
+  if prepare_data_file; then
+    validation_data_file="$data_nt_file"
+    if [ ${#codelist_files[@]} -gt 0 ]; then
+      echo "Merging ${#codelist_files[@]} codelist file(s) with the data file..."
+      merged_file="${validation_folder}/merged-file-${safe_data_file_prefix}.nt"
+      cat "${codelist_files[@]}" "$data_nt_file" > "$merged_file"
+      validation_data_file="$merged_file"
+      echo "  ✓ Merged file created ($(wc -l < "$merged_file" | tr -d ' ') lines)"
     fi
-    
-    # Check for errors from codelist merge (these are static files, so errors are unexpected)
-    if [ -s "$temp_stderr_file" ]; then
-      # Filter out just warnings - codelists should not have errors
-      if grep -q "ERROR" "$temp_stderr_file"; then
-        echo "  ⚠️  Warning: Errors found in codelist files (unexpected for static reference data)"
-        cat "$temp_stderr_file" >> "$warning_file"
-      else
-        # Just warnings/info - capture but don't worry
-        cat "$temp_stderr_file" >> "$warning_file"
-      fi
+  else
+    if [ ${#codelist_files[@]} -gt 0 ]; then
+      echo "  ⚠️  Warning: Failed to merge codelist files with data file, validating main file only"
     fi
-    
-    # Step 1b: Merge codelists N-Triples with data file
-    if [ -f "$temp_codelists_nt" ] && [ -s "$temp_codelists_nt" ]; then
-      echo "  Step 1b: Merging codelists with data file..."
-      step1b_args=("riot" "--output=N-Triples" "$temp_codelists_nt" "$data_file_for_validation")
-      "${step1b_args[@]}" > "$temp_merged_nt" 2> "$temp_stderr_file"
-      step1b_exit_code=$?
-      
-      if [ $step1b_exit_code -ne 0 ] || [ ! -f "$temp_merged_nt" ] || [ ! -s "$temp_merged_nt" ]; then
-        echo "  ⚠️  Error: Failed to merge codelists with data file"
-        if [ -s "$temp_stderr_file" ]; then
-          echo "  Error details:"
-          head -20 "$temp_stderr_file"
-        fi
-      else
-        echo "  ✓ Merged file created ($(wc -l < "$temp_merged_nt" | tr -d ' ') lines)"
-      fi
-      
-      # Check for errors from data file merge (warnings are expected, errors are not)
-      if [ -s "$temp_stderr_file" ]; then
-        cat "$temp_stderr_file" >> "$warning_file"
-      fi
-      
-      # Use the merged file for step 2
-      temp_nt_file="$temp_merged_nt"
-      step1_exit_code=$step1b_exit_code
-    else
-      echo "  ⚠️  Warning: Failed to merge codelist files, validating main file only"
-      rm -f "$temp_codelists_nt" "$temp_merged_nt" "$temp_stderr_file"
-      # Fallback: validate just the main file
-      validate_args=("shacl" "validate" "--shapes" "$current_shapes_file" "--data" "$data_file_for_validation")
-      "${validate_args[@]}" > "$report_file" 2>> "$warning_file"
-      # Skip to next shapes file
-      report_files_list+=("$report_file")
-      warning_files_list+=("$warning_file")
-      echo "" # Add a blank line for readability
-      continue
+    # Incremental validation compares N-Triples, so it needs the prepared data
+    previous_data_file=""
+    # Jena cannot tell the syntax of a .json file, so validate a .jsonld copy of it
+    if [[ "$data_file" == *.json ]]; then
+      echo "Converting .json file to .jsonld for Jena compatibility..."
+      temp_data_file="${validation_folder}/data-${safe_data_file_prefix}.jsonld"
+      cp "$data_file" "$temp_data_file"
+      echo "Created temporary file: $temp_data_file"
+      validation_data_file="$temp_data_file"
     fi
+  fi
+  echo ""
+fi
+
+# Prune the shapes files to the shapes that can apply to the data (--prune-shapes)
+# Shapes whose sh:targetClass (or a subclass of it) has no instances in the prepared
+# data produce no results, so dropping them does not change the reports.
+if [ "$prune_shapes" = true ] && [ ${#pending_shapes_files[@]} -gt 0 ]; then
+  prune_script="${cache_dir}/PruneShapes/prune_shapes.py"
+  pruned_shapes_dir="${validation_folder}/pruned-shapes"
+  if [ ! -s "$data_nt_file" ]; then
+    echo "⚠️  Warning: Data file was not prepared; validating with the full shapes files"
+  elif [ ! -f "$prune_script" ]; then
+    echo "⚠️  Warning: Shape pruning script not found at '$prune_script'; validating with the full shapes files"
+  elif python3 "$prune_script" --data "$validation_data_file" --output-dir "$pruned_shapes_dir" "${pending_shapes_files[@]}"; then
+    pruned_shapes_files=()
+    for current_shapes_file in "${pending_shapes_files[@]}"; do
+      pruned_shapes_files+=("${pruned_shapes_dir}/$(basename "$current_shapes_file")")
+    done
+    pending_shapes_files=("${pruned_shapes_files[@]}")
+  else
+    echo "⚠️  Warning: Shape pruning failed; validating with the full shapes files"
+  fi
+  echo ""
+fi
+
+if [ "$jobs" -le 1 ] || [ ${#pending_shapes_files[@]} -le 1 ]; then
+  # Serial mode: validate one shapes file at a time
+  for current_shapes_file in "${pending_shapes_files[@]}"; do
+    report_file="${pending_report_files[@]:0:1}"
+    warning_file="${pending_warning_files[@]:0:1}"
+    result_key="${pending_cache_keys[@]:0:1}"
+    inputs_stamp="${pending_inputs_stamps[@]:0:1}"
+    pending_report_files=("${pending_report_files[@]:1}")
+    pending_warning_files=("${pending_warning_files[@]:1}")
+    pending_cache_keys=("${pending_cache_keys[@]:1}")
+    pending_inputs_stamps=("${pending_inputs_stamps[@]:1}")
     
-    # Step 2: Build command to convert N-Triples to formatted Turtle with prefix definitions
-    step2_args=("riot" "--formatted=TURTLE")
-    if [ -f "$prefixes_file" ]; then
-      step2_args+=("$prefixes_file")
-    fi
-    step2_args+=("$temp_nt_file")
+    echo "Validating with '$current_shapes_file'..."
+    validate_shapes_file "$current_shapes_file" "$report_file" "$warning_file" "$result_key" "$inputs_stamp"
+    echo "" # Add a blank line for readability
+  done
+else
+  # Parallel mode: run up to $jobs validations at a time in the background.
+  # Each job writes its messages to its own log, and the logs are printed in
+  # shapes file order once all jobs are done, so the output is deterministic.
+  echo "Running ${#pending_shapes_files[@]} validations with up to $jobs parallel jobs..."
+  job_logs=()
+  running_pids=()
+  for current_shapes_file in "${pending_shapes_files[@]}"; do
+    report_file="${pending_report_files[@]:0:1}"
+    warning_file="${pending_warning_files[@]:0:1}"
+    shacl_prefix="${pending_shacl_prefixes[@]:0:1}"
+    result_key="${pending_cache_keys[@]:0:1}"
+    inputs_stamp="${pending_inputs_stamps[@]:0:1}"
+    pending_report_files=("${pending_report_files[@]:1}")
+    pending_warning_files=("${pending_warning_files[@]:1}")
+    pending_shacl_prefixes=("${pending_shacl_prefixes[@]:1}")
+    pending_cache_keys=("${pending_cache_keys[@]:1}")
+    pending_inputs_stamps=("${pending_inputs_stamps[@]:1}")
     
-    # Only fail if file doesn't exist or is empty (warnings from data file are expected)
-    if [ ! -f "$temp_nt_file" ] || [ ! -s "$temp_nt_file" ]; then
-      echo "  ⚠️  Warning: Failed to merge codelist files with data file, validating main file only"
-      # Clean up temporary files
-      rm -f "$temp_codelists_nt" "$temp_merged_nt" "$temp_nt_file" "$temp_stderr_file"
-      # Fallback: validate just the main file
-      validate_args=("shacl" "validate" "--shapes" "$current_shapes_file" "--data" "$data_file_for_validation")
-      "${validate_args[@]}" > "$report_file" 2>> "$warning_file"
-    else
-      # Step 2: Convert N-Triples to formatted Turtle
-      "${step2_args[@]}" > "$merged_file" 2> "$temp_stderr_file"
-      step2_exit_code=$?
-      
-      # Check for errors from step 2
-      if [ -s "$temp_stderr_file" ]; then
-        cat "$temp_stderr_file" >> "$warning_file"
-      fi
-      
-      # Clean up temporary files
-      rm -f "$temp_codelists_nt" "$temp_merged_nt" "$temp_nt_file" "$temp_stderr_file"
-      
-      # Proceed if merged file exists and has content (warnings are acceptable)
-      if [ ! -f "$merged_file" ] || [ ! -s "$merged_file" ]; then
-        echo "  ⚠️  Warning: Failed to convert merged file to Turtle, validating main file only"
-        # Fallback: validate just the main file
-        validate_args=("shacl" "validate" "--shapes" "$current_shapes_file" "--data" "$data_file_for_validation")
-        "${validate_args[@]}" > "$report_file" 2>> "$warning_file"
-      else
-        # Validate the merged file
-        validate_args=("shacl" "validate" "--shapes" "$current_shapes_file" "--data" "$merged_file")
-        "${validate_args[@]}" > "$report_file" 2>> "$warning_file"
-        merge_exit_code=$?
-        
-        if [ $merge_exit_code -ne 0 ]; then
-          echo "  ⚠️  Warning: Error during validation with merged codelist files"
-        fi
-      fi
+    # Wait for the oldest job when all slots are busy
+    if [ ${#running_pids[@]} -ge "$jobs" ]; then
+      wait "${running_pids[@]:0:1}"
+      running_pids=("${running_pids[@]:1}")
     fi
-  else
-    # No codelist files, just validate the main data file
-    validate_args=("shacl" "validate" "--shapes" "$current_shapes_file" "--data" "$data_file_for_validation")
-    "${validate_args[@]}" > "$report_file" 2> "$warning_file"
-  fi
+    
+    job_log="${validation_folder}/.validate_${shacl_prefix}_${safe_data_file_prefix}.log"
+    job_logs+=("$job_log")
+    echo "  Started validation with '$current_shapes_file'"
+    {
+      echo "Validating with '$current_shapes_file'..."
+      validate_shapes_file "$current_shapes_file" "$report_file" "$warning_file" "$result_key" "$inputs_stamp"
+    } > "$job_log" 2>&1 &
+    running_pids+=($!)
+  done
   
-  echo "--> Success: Report saved to '$report_file'."
-  echo "--> Warnings saved to '$warning_file'."
-  report_files_list+=("$report_file") # Add the report file to the list
-  warning_files_list+=("$warning_file") # Add the warning file to the list
-  echo "" # Add a blank line for readability
-done
+  # Wait for the remaining jobs
+  for pid in "${running_pids[@]}"; do
+    wait "$pid"
+  done
+  echo ""
+  
+  for job_log in "${job_logs[@]}"; do
+    cat "$job_log"
+    rm -f "$job_log"
+    echo "" # Add a blank line for readability
+  done
+fi
 
 echo "==================================="
 echo "All validations complete. ✅"
 
-# Function to count node types in the source data file
+# Function to count node types in the prepared N-Triples data file
 count_node_types() {
-  local data_file="$1"
-  local temp_nt_file="${validation_folder}/.temp_node_types_${safe_data_file_prefix}.nt"
-  local temp_stderr_file="${validation_folder}/.temp_node_types_${safe_data_file_prefix}.stderr"
-  
-  # Convert data file to N-Triples to extract rdf:type statements
-  riot --output=N-Triples "$data_file" > "$temp_nt_file" 2> "$temp_stderr_file"
-  
-  if [ ! -f "$temp_nt_file" ] || [ ! -s "$temp_nt_file" ]; then
-    rm -f "$temp_nt_file" "$temp_stderr_file"
-    echo "{}"
-    return 1
-  fi
+  local nt_file="$1"
   
   # Extract rdf:type statements and count node types using Python for better JSON handling
   python3 <<PYTHON_SCRIPT
@@ -754,7 +1248,7 @@ rdf_type_uri = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#type'
 counts = defaultdict(int)
 
 try:
-    with open('$temp_nt_file', 'r') as f:
+    with open('$nt_file', 'r') as f:
         for line in f:
             # Pattern: <subject> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <type> .
             if rdf_type_uri in line:
@@ -774,9 +1268,6 @@ try:
 except Exception as e:
     print("{}")
 PYTHON_SCRIPT
-  
-  # Clean up
-  rm -f "$temp_nt_file" "$temp_stderr_file"
 }
 
 # Generate summaries unless --no-summary flag is set
@@ -785,9 +1276,21 @@ if [ "$skip_summary" = false ]; then
   echo "Generating violation summaries..."
   echo "==================================="
   
-  # Count node types in source data file
+  # Count node types in source data file (cached per data file checksum with the results)
   echo "Counting node types in source data file..."
-  node_type_counts=$(count_node_types "$data_file_for_validation")
+  node_types_cache_file="${result_cache_dir}/node-types-${data_file_sha256}.json"
+  if [ "$use_result_cache" = true ] && [ -s "$node_types_cache_file" ]; then
+    node_type_counts=$(cat "$node_types_cache_file")
+    touch "$node_types_cache_file"
+  elif prepare_data_file; then
+    node_type_counts=$(count_node_types "$data_nt_file")
+    if [ "$use_result_cache" = true ]; then
+      mkdir -p "$result_cache_dir"
+      echo "$node_type_counts" > "$node_types_cache_file"
+    fi
+  else
+    node_type_counts="{}"
+  fi
   
   # Path to the summarization script (now in cache directory)
   summarize_script="${cache_dir}/SummarizeReports/summarize_shacl_violations.py"
@@ -797,34 +1300,109 @@ if [ "$skip_summary" = false ]; then
     echo "⚠️  Warning: Summarization script not found at '$summarize_script'"
     echo "   Skipping summary generation."
   else
-    # Loop through each report file and generate a summary
+    # The summary also depends on the summarizer and its options, so cached
+    # summaries are stored per summary key inside the report's cache entry
+    summarize_script_sha256=$(file_sha256 "$summarize_script")
+    
+    # Collect the report files that exist, restoring cached summaries where possible
+    existing_report_files=()
+    summary_cache_files=()
     for report_file in "${report_files_list[@]}"; do
-      if [ -f "$report_file" ]; then
-        # Generate summary filename: replace .ttl with _summary.txt
-        summary_file="${report_file%.ttl}_summary.txt"
-        echo "Generating summary for '$report_file'..."
-        # Pass --code-violations flag, original command, and node type counts to Python script
-        if [ "$include_code_violations" = true ]; then
-          python3 "$summarize_script" --code-violations --command "$original_command" --node-types "$node_type_counts" "$report_file" "$summary_file"
-        else
-          python3 "$summarize_script" --command "$original_command" --node-types "$node_type_counts" "$report_file" "$summary_file"
+      result_key="${report_cache_keys[@]:0:1}"
+      report_cache_keys=("${report_cache_keys[@]:1}")
+      if [ ! -f "$report_file" ]; then
+        continue
+      fi
+      summary_cache_file=""
+      if [ -n "$result_key" ]; then
+        summary_key=$(string_sha256 "summary ${summarize_script_sha256}
+code-violations ${include_code_violations}
+command ${original_command}
+node-types ${node_type_counts}")
+        summary_cache_file="${result_cache_dir}/${result_key}/summary-${summary_key}.txt"
+        if [ -s "$summary_cache_file" ]; then
+          cp "$summary_cache_file" "${report_file%.ttl}_summary.txt"
+          echo "Using cached summary for '$report_file'"
+          continue
         fi
       fi
+      echo "Generating summary for '$report_file'..."
+      existing_report_files+=("$report_file")
+      summary_cache_files+=("$summary_cache_file")
     done
+    
+    # Summarize all reports with a single Python process (batch mode) so the
+    # interpreter and rdflib start-up cost is paid once, not once per report.
+    # Each report still gets its own [report]_summary.txt file.
+    if [ ${#existing_report_files[@]} -gt 0 ]; then
+      summarize_args=("python3" "$summarize_script" "--batch")
+      # Pass --code-violations flag, original command, and node type counts to Python script
+      if [ "$include_code_violations" = true ]; then
+        summarize_args+=("--code-violations")
+      fi
+      # With --jobs, summarize the reports with the same number of worker processes
+      if [ "$jobs" -gt 1 ]; then
+        summarize_args+=("--jobs" "$jobs")
+      fi
+      summarize_args+=("--command" "$original_command" "--node-types" "$node_type_counts")
+      summarize_args+=("${existing_report_files[@]}")
+      "${summarize_args[@]}"
+      
+      # Fill the result cache with the new summaries
+      for report_file in "${existing_report_files[@]}"; do
+        summary_cache_file="${summary_cache_files[@]:0:1}"
+        summary_cache_files=("${summary_cache_files[@]:1}")
+        if [ -n "$summary_cache_file" ] && [ -s "${report_file%.ttl}_summary.txt" ]; then
+          store_cached_result "$(basename "$(dirname "$summary_cache_file")")" "${report_file%.ttl}_summary.txt" "$(basename "$summary_cache_file")"
+        fi
+      done
+    fi
     echo ""
     echo "Summary generation complete. ✅"
   fi
   echo "==================================="
 fi
 
-# Clean up temporary .jsonld file if it was created
+# Clean up the prepared data file, unless it is the validated file kept for --incremental,
+# and the .jsonld copy of a .json data file that could not be prepared
+if [ "$validation_data_file" != "$data_nt_file" ]; then
+  rm -f "$data_nt_file"
+fi
 if [[ -n "$temp_data_file" && -f "$temp_data_file" ]]; then
   echo "Cleaning up temporary file: $temp_data_file"
-  rm "$temp_data_file"
+  rm -f "$temp_data_file"
 fi
+rm -f "$prepare_warning_file"
 
 echo "All validation results are organized in the '$validation_folder' folder"
 
+# When run as a batch worker, write this file's row of the batch index
+# Violations are the totals of the summaries, or the results in the reports with --no-summary.
+if [ -n "$CIDS_BATCH_ROW_FILE" ]; then
+  batch_status="pass"
+  batch_violations=0
+  batch_reports=0
+  for report_file in "${report_files_list[@]}"; do
+    summary_file="${report_file%.ttl}_summary.txt"
+    if [ ! -s "$report_file" ]; then
+      batch_status="error"
+      continue
+    fi
+    batch_reports=$((batch_reports + 1))
+    if [ -s "$summary_file" ]; then
+      report_violations=$(sed -n 's/^Total Violations: \([0-9][0-9]*\).*/\1/p' "$summary_file" | head -1)
+    else
+      report_violations=$(grep -c 'sh:ValidationResult' "$report_file")
+    fi
+    batch_violations=$((batch_violations + ${report_violations:-0}))
+  done
+  if [ "$batch_status" = "pass" ] && [ $batch_violations -gt 0 ]; then
+    batch_status="fail"
+  fi
+  printf '%s\t%s\t%s\t%s\t%s\t%s\n' "$data_file" "$batch_status" "$batch_violations" "$batch_reports" \
+    "$(( $(date +%s) - run_start_time ))" "$validation_folder" > "$CIDS_BATCH_ROW_FILE"
+fi
+
 ### Additional Notes on Jena SHACL Command Options
 # The 'shacl validate' command comes with a variety of options to customize its behavior.
 # You can view all available options by running:
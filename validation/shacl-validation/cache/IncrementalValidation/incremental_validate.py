@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Incrementally re-validate a data file against SHACL shapes, reusing a previous run.
+Diffs the new N-Triples against the previous run's, validates only the focus nodes
+that changed (and the nodes whose results depend on them) with Jena, and merges those
+results with the unchanged results of the previous report.
+Usage: python incremental_validate.py --previous-data old.nt --previous-report old.ttl --data new.nt --shapes shapes.ttl --output report.ttl
+Example: python incremental_validate.py --previous-data validations/x20250101-120000/merged-file-x.nt \
+    --previous-report validations/x20250101-120000/report-sff-x.ttl --data validations/x20250102-090000/merged-file-x.nt \
+    --shapes cache/shacl/sff.shacl.ttl --output validations/x20250102-090000/report-sff-x.ttl
+Exit status: 0 when the report was written, 3 when a full validation is needed instead, 1 on errors.
+"""
+
+import sys
+import os
+import re
+import hashlib
+import subprocess
+import tempfile
+from collections import defaultdict
+
+# Namespaces
+SH = "http://www.w3.org/ns/shacl#"
+RDF_TYPE = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+RDFS_SUBCLASS_OF = "<http://www.w3.org/2000/01/rdf-schema#subClassOf>"
+
+# Exit status telling the caller to run a full validation
+EXIT_FULL_VALIDATION = 3
+
+# Default share of changed focus nodes above which a full validation is cheaper
+MAX_CHANGED_RATIO = 0.5
+
+# SHACL features whose results depend on more than a focus node's own triples and the
+# types of its values. The dependency analysis below does not cover them, so shapes
+# using any of these are always validated in full.
+UNSUPPORTED_SHAPE_PREDICATES = tuple(SH + name for name in (
+    'node', 'qualifiedValueShape', 'and', 'or', 'xone', 'not', 'sparql', 'target',
+    'targetSubjectsOf', 'targetObjectsOf', 'equals', 'disjoint', 'lessThan', 'lessThanOrEquals',
+    'inversePath', 'alternativePath', 'zeroOrMorePath', 'oneOrMorePath', 'zeroOrOnePath',
+))
+
+# One N-Triples statement: subject, predicate and object (which may contain spaces)
+NT_LINE_RE = re.compile(r'^(\S+)\s+(\S+)\s+(.*?)\s*\.\s*$')
+
+
+class FullValidationNeeded(Exception):
+    """Raised when the change cannot be validated incrementally"""
+    pass
+
+
+def read_ntriples(file_path):
+    """
+    Read an N-Triples file into a list of (subject, predicate, object) strings.
+
+    Terms are kept in their N-Triples form (<iri>, _:label or "literal"...).
+
+    Args:
+        file_path: Path to the N-Triples file
+
+    Returns:
+        List of (subject, predicate, object) tuples
+    """
+    triples = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            match = NT_LINE_RE.match(line)
+            if match:
+                triples.append(match.groups())
+    return triples
+
+
+def bnode_signatures(triples):
+    """
+    Give every blank node a label derived from its content.
+
+    Jena labels blank nodes differently on every parse, so two runs over the same data
+    only agree on blank nodes through their content: the sorted predicate/object pairs,
+    with nested blank nodes replaced by their own signature. Blank nodes in a cycle
+    are labelled as such.
+
+    Args:
+        triples: List of (subject, predicate, object) tuples
+
+    Returns:
+        Dict of blank node label -> signature (e.g. '_:sig3f2a...')
+    """
+    edges = defaultdict(list)
+    for s, p, o in triples:
+        if s.startswith('_:'):
+            edges[s].append((p, o))
+
+    signatures = {}
+    on_stack = set()
+    for root in edges:
+        if root in signatures:
+            continue
+        # Iterative post-order walk (RDF lists can nest deeper than the recursion limit)
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in signatures:
+                continue
+            if expanded:
+                parts = sorted(f"{p} {signatures.get(o, '_:cycle') if o.startswith('_:') else o}"
+                               for p, o in edges.get(node, ()))
+                digest = hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()[:20]
+                signatures[node] = f"_:sig{digest}"
+                on_stack.discard(node)
+                continue
+            if node in on_stack:
+                continue
+            on_stack.add(node)
+            stack.append((node, True))
+            for _, o in edges.get(node, ()):
+                if o.startswith('_:') and o not in signatures and o not in on_stack:
+                    stack.append((o, False))
+    return signatures
+
+
+def canonical_triples(triples):
+    """Return the set of triples with blank nodes replaced by their content signature"""
+    signatures = bnode_signatures(triples)
+    canonical = set()
+    for s, p, o in triples:
+        if s.startswith('_:'):
+            s = signatures.get(s, s)
+        if o.startswith('_:'):
+            o = signatures.get(o, o)
+        canonical.add((s, p, o))
+    return canonical
+
+
+def check_shapes_supported(shapes_file):
+    """
+    Raise FullValidationNeeded if the shapes use features the dependency analysis does not cover.
+
+    Supported shapes only look at a focus node's own triples along simple predicate
+    paths and, for sh:class, at the rdf:type (and rdfs:subClassOf) of its values.
+    """
+    from rdflib import Graph, URIRef, BNode
+    g = Graph()
+    g.parse(shapes_file, format='turtle')
+    for predicate in UNSUPPORTED_SHAPE_PREDICATES:
+        if (None, URIRef(predicate), None) in g:
+            raise FullValidationNeeded(f"shapes use {predicate.replace(SH, 'sh:')}")
+    for path in g.objects(None, URIRef(SH + 'path')):
+        if isinstance(path, BNode):
+            raise FullValidationNeeded("shapes use complex property paths")
+
+
+def find_focus_nodes(old_triples, new_triples):
+    """
+    Find the nodes whose validation results may differ between two versions of the data.
+
+    A node needs revalidation when one of its own triples changed, or when it has a
+    value whose rdf:type changed (sh:class checks). Blank node focus nodes cannot be
+    matched between reports, so they are always revalidated (see build_subgraph).
+
+    Args:
+        old_triples: Triples of the previous data (see read_ntriples)
+        new_triples: Triples of the new data
+
+    Returns:
+        Tuple (focus_nodes, changed_count): set of IRIs (in <...> form) to revalidate,
+        and the number of changed triples
+    """
+    old_canonical = canonical_triples(old_triples)
+    new_canonical = canonical_triples(new_triples)
+    changed_triples = old_canonical ^ new_canonical
+
+    changed_nodes = set()
+    retyped_nodes = set()
+    for s, p, o in changed_triples:
+        if p == RDFS_SUBCLASS_OF:
+            raise FullValidationNeeded("rdfs:subClassOf statements changed")
+        if s.startswith('<'):
+            changed_nodes.add(s)
+            if p == RDF_TYPE:
+                retyped_nodes.add(s)
+
+    # Nodes pointing at a node whose type changed may pass or fail sh:class differently
+    dependents = set()
+    if retyped_nodes:
+        for triples in (old_triples, new_triples):
+            for s, p, o in triples:
+                if o in retyped_nodes and s.startswith('<'):
+                    dependents.add(s)
+
+    return changed_nodes | dependents, len(changed_triples)
+
+
+def build_subgraph(new_triples, focus_nodes, output_file):
+    """
+    Write the part of the new data needed to validate the focus nodes.
+
+    The subgraph has all triples of the focus nodes and of every blank node, the
+    rdf:type statements of the nodes they point at (for sh:class), and all
+    rdfs:subClassOf statements.
+
+    Args:
+        new_triples: Triples of the new data
+        focus_nodes: IRIs to revalidate
+        output_file: Path of the N-Triples file to write
+
+    Returns:
+        Number of triples written
+    """
+    included = []
+    referenced = set()
+    for triple in new_triples:
+        s, p, o = triple
+        if s in focus_nodes or s.startswith('_:'):
+            included.append(triple)
+            if o.startswith('<'):
+                referenced.add(o)
+        elif p == RDFS_SUBCLASS_OF:
+            included.append(triple)
+    for triple in new_triples:
+        s, p, o = triple
+        if p == RDF_TYPE and s in referenced and s not in focus_nodes:
+            included.append(triple)
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for s, p, o in included:
+            f.write(f"{s} {p} {o} .\n")
+    return len(included)
+
+
+def run_shacl(shacl_command, shapes_file, data_file):
+    """
+    Validate a data file with Jena's shacl command and return the report (Turtle).
+
+    Jena's warnings are passed through to stderr.
+    """
+    result = subprocess.run(shacl_command + ['validate', '--shapes', shapes_file, '--data', data_file],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if result.stderr:
+        sys.stderr.write(result.stderr)
+    if result.returncode != 0:
+        raise RuntimeError(f"shacl validate exited with status {result.returncode}")
+    return result.stdout
+
+
+def merge_reports(previous_report_file, partial_report_text, focus_nodes, output_file):
+    """
+    Write a report with the previous results of unchanged nodes and the new results of the focus nodes.
+
+    Args:
+        previous_report_file: Path to the previous report (Turtle)
+        partial_report_text: Report of the subgraph validation (Turtle)
+        focus_nodes: IRIs (in <...> form) that were revalidated
+        output_file: Path for the merged report
+
+    Returns:
+        Tuple (kept, added): number of results kept from the previous report and taken from the new one
+    """
+    from rdflib import Graph, URIRef, BNode, Literal, RDF
+
+    sh_result = URIRef(SH + 'ValidationResult')
+    sh_focus = URIRef(SH + 'focusNode')
+    focus_iris = {URIRef(node[1:-1]) for node in focus_nodes}
+
+    previous = Graph()
+    previous.parse(previous_report_file, format='turtle')
+    partial = Graph()
+    partial.parse(data=partial_report_text, format='turtle')
+
+    merged = Graph()
+    for prefix, namespace in previous.namespaces():
+        merged.bind(prefix, namespace, override=False)
+    report = BNode()
+    merged.add((report, RDF.type, URIRef(SH + 'ValidationReport')))
+
+    def copy_result(source, result):
+        # Copy the result with everything it nests (paths, values as blank nodes, ...)
+        merged.add((report, URIRef(SH + 'result'), result))
+        queue, seen = [result], {result}
+        while queue:
+            node = queue.pop()
+            for p, o in source.predicate_objects(node):
+                merged.add((node, p, o))
+                if isinstance(o, BNode) and o not in seen:
+                    seen.add(o)
+                    queue.append(o)
+
+    kept = 0
+    for result in previous.subjects(RDF.type, sh_result):
+        focus = previous.value(result, sh_focus)
+        if isinstance(focus, URIRef) and focus not in focus_iris:
+            copy_result(previous, result)
+            kept += 1
+
+    added = 0
+    for result in partial.subjects(RDF.type, sh_result):
+        focus = partial.value(result, sh_focus)
+        if isinstance(focus, BNode) or focus in focus_iris:
+            copy_result(partial, result)
+            added += 1
+
+    merged.add((report, URIRef(SH + 'conforms'), Literal(kept + added == 0)))
+    merged.serialize(destination=output_file, format='turtle')
+    return kept, added
+
+
+def incremental_validate(previous_data, previous_report, data_file, shapes_file, output_file,
+                         shacl_command=('shacl',), max_changed_ratio=MAX_CHANGED_RATIO):
+    """
+    Validate a new version of a data file incrementally.
+
+    Args:
+        previous_data: N-Triples file validated by the previous run
+        previous_report: Report of the previous run (same shapes, codelists and Jena version)
+        data_file: N-Triples file to validate now
+        shapes_file: SHACL shapes file
+        output_file: Path for the report
+        shacl_command: Command to run Jena's shacl tool
+        max_changed_ratio: Share of revalidated nodes above which a full validation is used
+
+    Raises:
+        FullValidationNeeded: When the change or the shapes need a full validation
+    """
+    check_shapes_supported(shapes_file)
+
+    old_triples = read_ntriples(previous_data)
+    new_triples = read_ntriples(data_file)
+    focus_nodes, changed_count = find_focus_nodes(old_triples, new_triples)
+
+    subjects = {s for s, _, _ in new_triples if s.startswith('<')}
+    if subjects and len(focus_nodes) > max_changed_ratio * len(subjects):
+        raise FullValidationNeeded(f"{len(focus_nodes)} of {len(subjects)} nodes changed")
+    print(f"Changed triples: {changed_count}, nodes to revalidate: {len(focus_nodes)} of {len(subjects)}")
+
+    fd, subgraph_file = tempfile.mkstemp(suffix='.nt', prefix='.incremental-',
+                                         dir=os.path.dirname(os.path.abspath(output_file)))
+    os.close(fd)
+    try:
+        subgraph_size = build_subgraph(new_triples, focus_nodes, subgraph_file)
+        print(f"Validating subgraph of {subgraph_size} triple(s)...")
+        partial_report = run_shacl(list(shacl_command), shapes_file, subgraph_file)
+    finally:
+        os.remove(subgraph_file)
+
+    kept, added = merge_reports(previous_report, partial_report, focus_nodes, output_file)
+    print(f"Report written to: {output_file} ({kept} previous result(s) kept, {added} new result(s))")
+
+
+def main():
+    usage = ("Usage: python incremental_validate.py --previous-data old.nt --previous-report old.ttl "
+             "--data new.nt --shapes shapes.ttl --output report.ttl [--shacl CMD] [--max-changed-ratio R]")
+
+    # Parse command-line arguments
+    options = {}
+    value_options = ('--previous-data', '--previous-report', '--data', '--shapes', '--output',
+                     '--shacl', '--max-changed-ratio')
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg in value_options and i + 1 < len(sys.argv):
+            options[arg] = sys.argv[i + 1]
+            i += 2
+        else:
+            print(f"Error: Unknown or incomplete argument: {arg}")
+            print(usage)
+            sys.exit(1)
+
+    required = ('--previous-data', '--previous-report', '--data', '--shapes', '--output')
+    missing = [name for name in required if name not in options]
+    if missing:
+        print(f"Error: Missing {', '.join(missing)}")
+        print(usage)
+        sys.exit(1)
+    for name in ('--previous-data', '--previous-report', '--data', '--shapes'):
+        if not os.path.exists(options[name]):
+            print(f"Error: File not found: {options[name]}")
+            sys.exit(1)
+
+    try:
+        max_changed_ratio = float(options.get('--max-changed-ratio', MAX_CHANGED_RATIO))
+    except ValueError:
+        print("Error: --max-changed-ratio requires a number")
+        sys.exit(1)
+
+    try:
+        incremental_validate(options['--previous-data'], options['--previous-report'], options['--data'],
+                             options['--shapes'], options['--output'],
+                             shacl_command=options.get('--shacl', 'shacl').split(),
+                             max_changed_ratio=max_changed_ratio)
+    except FullValidationNeeded as e:
+        print(f"Full validation needed: {e}")
+        sys.exit(EXIT_FULL_VALIDATION)
+    except Exception as e:
+        print(f"Error: Incremental validation failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
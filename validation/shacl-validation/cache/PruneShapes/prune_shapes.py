@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Prune SHACL shapes files down to the shapes that can apply to a data file.
+Keeps the shapes whose sh:targetClass (or implicit class target) is a class used
+in the data or a superclass of one, plus every shape they reference.
+Usage: python prune_shapes.py --data <data.nt> [--output pruned.ttl | --output-dir DIR] <shapes.ttl>...
+Example: python prune_shapes.py --data validations/x/.data-x.nt --output-dir validations/x/pruned-shapes cache/shacl/sff.shacl.ttl
+"""
+
+import sys
+import os
+import json
+from collections import defaultdict, deque
+
+# Namespaces
+SH = "http://www.w3.org/ns/shacl#"
+RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+RDFS_SUBCLASS_OF = "http://www.w3.org/2000/01/rdf-schema#subClassOf"
+RDFS_CLASS = "http://www.w3.org/2000/01/rdf-schema#Class"
+OWL_CLASS = "http://www.w3.org/2002/07/owl#Class"
+
+# Shape types that make a class an implicit class target (SHACL 2.1.3.3)
+SHAPE_TYPES = (SH + 'NodeShape', SH + 'PropertyShape')
+
+# Targets other than classes; shapes with one of these are always kept
+OTHER_TARGETS = (SH + 'targetNode', SH + 'targetSubjectsOf', SH + 'targetObjectsOf', SH + 'target')
+
+
+def local_name(uri):
+    """Return the part of a URI after the last # or /"""
+    uri = str(uri)
+    if '#' in uri:
+        return uri.split('#')[-1]
+    return uri.rsplit('/', 1)[-1]
+
+
+def scan_ntriples_classes(file_path):
+    """
+    Collect the classes used in an N-Triples file with a single line scan.
+
+    Args:
+        file_path: Path to the N-Triples file (e.g. the prepared data file of CIDS-validate.sh)
+
+    Returns:
+        Tuple (type_counts, subclass_edges): Counter-like dict of class IRI -> number of
+        rdf:type statements, and a list of (subclass IRI, superclass IRI) pairs
+    """
+    type_pred = f"<{RDF_TYPE}>"
+    subclass_pred = f"<{RDFS_SUBCLASS_OF}>"
+    type_counts = defaultdict(int)
+    subclass_edges = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if type_pred not in line and subclass_pred not in line:
+                continue
+            parts = line.split(None, 2)
+            if len(parts) < 3 or not parts[2].startswith('<'):
+                continue
+            obj = parts[2][1:parts[2].index('>')]
+            if parts[1] == type_pred:
+                type_counts[obj] += 1
+            elif parts[1] == subclass_pred and parts[0].startswith('<'):
+                subclass_edges.append((parts[0][1:-1], obj))
+    return dict(type_counts), subclass_edges
+
+
+def load_data_classes(file_path):
+    """
+    Collect the classes used in a data file.
+
+    N-Triples files (.nt) are scanned line by line; other formats are parsed with RDFLib.
+
+    Args:
+        file_path: Path to the data file
+
+    Returns:
+        Tuple (type_counts, subclass_edges), see scan_ntriples_classes
+    """
+    if file_path.endswith('.nt'):
+        return scan_ntriples_classes(file_path)
+
+    from rdflib import Graph, URIRef
+    from rdflib.util import guess_format
+    g = Graph()
+    data_format = guess_format(file_path) or ('json-ld' if file_path.endswith('.json') else 'turtle')
+    g.parse(file_path, format=data_format)
+    type_counts = defaultdict(int)
+    for cls in g.objects(None, URIRef(RDF_TYPE)):
+        if isinstance(cls, URIRef):
+            type_counts[str(cls)] += 1
+    subclass_edges = [(str(s), str(o)) for s, o in g.subject_objects(URIRef(RDFS_SUBCLASS_OF))
+                      if isinstance(s, URIRef) and isinstance(o, URIRef)]
+    return dict(type_counts), subclass_edges
+
+
+def superclass_closure(classes, subclass_edges):
+    """
+    Return the given classes together with all their (transitive) superclasses.
+
+    A shape targeting class C also targets instances of every subclass of C, so a
+    shape is relevant when its target class is in this closure.
+    """
+    superclasses = defaultdict(set)
+    for sub, sup in subclass_edges:
+        superclasses[sub].add(sup)
+    closure = set(classes)
+    queue = deque(closure)
+    while queue:
+        for sup in superclasses.get(queue.popleft(), ()):
+            if sup not in closure:
+                closure.add(sup)
+                queue.append(sup)
+    return closure
+
+
+def is_shape(shapes_graph, node, shape_types):
+    """Return True if a node is a shape: typed as one, or described with SHACL predicates"""
+    for pred, obj in shapes_graph.predicate_objects(node):
+        if str(pred).startswith(SH) or (str(pred) == RDF_TYPE and obj in shape_types):
+            return True
+    return False
+
+
+def prune_shapes_graph(shapes_graph, relevant_classes=None, relevant_local_names=None, subclass_edges=()):
+    """
+    Remove the class-targeted shapes that cannot apply to the data from a shapes graph.
+
+    A shape is kept if one of its target classes (sh:targetClass, or the shape itself when
+    it is also an rdfs:Class/owl:Class) is relevant, if it has any other kind of target, or
+    if a kept shape references it (sh:property, sh:node, lists, ...). Shapes that are not
+    kept are dropped with the blank nodes only reachable from them; shapes without
+    targets never produce results on their own. Other triples (ontology axioms) are kept.
+
+    Args:
+        shapes_graph: RDFLib Graph with the shapes (modified in place)
+        relevant_classes: Set of class IRIs used in the data (superclasses are added here)
+        relevant_local_names: Set of class local names used in the data, for when only a
+                              node type histogram is available (see --node-types)
+        subclass_edges: (subclass, superclass) IRI pairs from the data
+
+    Returns:
+        Tuple (kept_roots, removed_roots): lists of the class-targeted shapes kept and removed
+    """
+    from rdflib import URIRef, BNode
+
+    sh_target_class = URIRef(SH + 'targetClass')
+    rdf_type = URIRef(RDF_TYPE)
+
+    # Subclass axioms in the shapes graph count too (Jena reads them from the data graph,
+    # but keeping extra shapes is always safe)
+    edges = list(subclass_edges)
+    edges.extend((str(s), str(o)) for s, o in shapes_graph.subject_objects(URIRef(RDFS_SUBCLASS_OF)))
+    relevant = superclass_closure(relevant_classes or (), edges)
+
+    def is_relevant(cls):
+        if str(cls) in relevant:
+            return True
+        return relevant_local_names is not None and local_name(cls) in relevant_local_names
+
+    # Collect the class-targeted shapes ("roots") and decide which ones stay
+    roots = {}
+    for shape, cls in shapes_graph.subject_objects(sh_target_class):
+        roots.setdefault(shape, []).append(cls)
+    class_types = {URIRef(RDFS_CLASS), URIRef(OWL_CLASS)}
+    shape_types = {URIRef(t) for t in SHAPE_TYPES}
+    for shape in set(shapes_graph.subjects(rdf_type, None)):
+        types = set(shapes_graph.objects(shape, rdf_type))
+        if types & class_types and types & shape_types:
+            roots.setdefault(shape, []).append(shape)
+
+    other_targets = [URIRef(p) for p in OTHER_TARGETS]
+    kept = set()
+    for shape, classes in roots.items():
+        if any(is_relevant(cls) for cls in classes) or \
+                any((shape, p, None) in shapes_graph for p in other_targets):
+            kept.add(shape)
+
+    # Everything reachable from the kept roots and from the named subjects that are not
+    # shapes stays, including class-targeted shapes that a kept shape references
+    subjects = set(shapes_graph.subjects())
+    reachable = set(kept)
+    for subject in subjects:
+        if isinstance(subject, BNode) or subject in roots:
+            continue
+        if any((subject, p, None) in shapes_graph for p in other_targets) or \
+                not is_shape(shapes_graph, subject, shape_types):
+            reachable.add(subject)
+    queue = deque(reachable)
+    while queue:
+        for obj in shapes_graph.objects(queue.popleft(), None):
+            if obj in subjects and obj not in reachable:
+                reachable.add(obj)
+                queue.append(obj)
+
+    for subject in subjects - reachable:
+        shapes_graph.remove((subject, None, None))
+
+    kept_roots = sorted(str(s) for s in roots if s in reachable)
+    removed_roots = sorted(str(s) for s in roots if s not in reachable)
+    return kept_roots, removed_roots
+
+
+def prune_shapes_file(shapes_file, output_file, relevant_classes, relevant_local_names=None, subclass_edges=()):
+    """
+    Write a pruned copy of a shapes file.
+
+    Args:
+        shapes_file: Path to the SHACL shapes file (Turtle)
+        output_file: Path for the pruned shapes file (Turtle)
+        relevant_classes, relevant_local_names, subclass_edges: See prune_shapes_graph
+
+    Returns:
+        Tuple (kept_roots, removed_roots), see prune_shapes_graph
+    """
+    from rdflib import Graph
+    g = Graph()
+    g.parse(shapes_file, format='turtle')
+    kept_roots, removed_roots = prune_shapes_graph(g, relevant_classes, relevant_local_names, subclass_edges)
+    g.serialize(destination=output_file, format='turtle')
+    total = len(kept_roots) + len(removed_roots)
+    print(f"Pruned '{shapes_file}': kept {len(kept_roots)} of {total} class-targeted shape(s) -> {output_file}")
+    return kept_roots, removed_roots
+
+
+def main():
+    usage = ("Usage: python prune_shapes.py (--data <data_file> | --node-types JSON) "
+             "[--output pruned.ttl | --output-dir DIR] <shapes.ttl>...")
+    if len(sys.argv) < 2:
+        print(usage)
+        sys.exit(1)
+
+    # Parse command-line arguments
+    data_file = None
+    node_types_str = None
+    output_file = None
+    output_dir = None
+    shapes_files = []
+
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg in ('--data', '--node-types', '--output', '--output-dir'):
+            if i + 1 >= len(sys.argv):
+                print(f"Error: {arg} requires a value")
+                sys.exit(1)
+            value = sys.argv[i + 1]
+            if arg == '--data':
+                data_file = value
+            elif arg == '--node-types':
+                node_types_str = value
+            elif arg == '--output':
+                output_file = value
+            else:
+                output_dir = value
+            i += 2
+        else:
+            shapes_files.append(arg)
+            i += 1
+
+    if not shapes_files or (data_file is None and node_types_str is None):
+        print(usage)
+        sys.exit(1)
+    if output_file and len(shapes_files) > 1:
+        print("Error: --output takes a single shapes file; use --output-dir for several")
+        sys.exit(1)
+
+    # Classes used in the data: full IRIs from the data file, or local names from a
+    # node type histogram (as printed by CIDS-validate.sh for --node-types)
+    relevant_classes = set()
+    relevant_local_names = None
+    subclass_edges = []
+    if data_file:
+        if not os.path.exists(data_file):
+            print(f"Error: Data file not found: {data_file}")
+            sys.exit(1)
+        type_counts, subclass_edges = load_data_classes(data_file)
+        relevant_classes = set(type_counts)
+        print(f"Found {len(type_counts)} class(es) in '{data_file}'")
+    if node_types_str is not None:
+        try:
+            relevant_local_names = set(json.loads(node_types_str))
+        except (json.JSONDecodeError, TypeError):
+            print("Error: --node-types must be a JSON object of node type counts")
+            sys.exit(1)
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    for shapes_file in shapes_files:
+        if not os.path.exists(shapes_file):
+            print(f"Error: Shapes file not found: {shapes_file}")
+            sys.exit(1)
+        if output_file:
+            target = output_file
+        elif output_dir:
+            target = os.path.join(output_dir, os.path.basename(shapes_file))
+        else:
+            base, ext = os.path.splitext(shapes_file)
+            target = f"{base}.pruned{ext or '.ttl'}"
+        prune_shapes_file(shapes_file, target, relevant_classes, relevant_local_names, subclass_edges)
+
+
+if __name__ == "__main__":
+    main()
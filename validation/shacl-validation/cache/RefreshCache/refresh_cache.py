@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Download or refresh cached files (codelists, SHACL shapes) concurrently.
+Files are fetched by a pool of worker threads sharing keep-alive connections, with
+conditional requests (ETag / Last-Modified) so unchanged files are not transferred again.
+Usage: python refresh_cache.py --cache-dir DIR [--only-missing] [--base-url URL] [--jobs N] --to SUBDIR URL... [--to SUBDIR URL...]
+Example: python refresh_cache.py --cache-dir cache --to codelists https://codelist.commonapproach.org/ESDCSector.ttl \
+    --to shacl https://ontology.commonapproach.org/validation/shacl/sff.shacl.ttl
+"""
+
+import sys
+import os
+import json
+import time
+import queue
+import hashlib
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+# Number of concurrent downloads (and pooled connections per host) by default
+DEFAULT_JOBS = 8
+
+# Seconds to wait for a server before a download fails
+TIMEOUT = 60
+
+# Redirects followed per file (curl -L)
+MAX_REDIRECTS = 5
+
+# Download metadata (ETag, Last-Modified, checksum) kept in each destination directory
+METADATA_FILE = ".download-metadata.json"
+
+
+def file_sha256(file_path):
+    """Return the SHA-256 checksum of a file"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def rebase_url(url, base_url):
+    """
+    Point a URL at another server, keeping its path.
+
+    Used with --base-url to test against a local HTTP stand-in, e.g.
+    https://codelist.commonapproach.org/ESDCSector.ttl -> http://127.0.0.1:8000/ESDCSector.ttl
+
+    Args:
+        url: Original URL
+        base_url: Scheme and host (optionally with a path prefix) of the other server
+
+    Returns:
+        The rebased URL, or the original URL when base_url is empty
+    """
+    if not base_url:
+        return url
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    return base_url.rstrip('/') + path
+
+
+class ConnectionPool:
+    """
+    Keep-alive HTTP(S) connections shared by the download threads.
+
+    Connections are kept per (scheme, host, port) and handed to one thread at a time,
+    so several files from the same server reuse a few TLS connections instead of
+    opening one per file.
+    """
+
+    def __init__(self, max_per_host):
+        self.max_per_host = max_per_host
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    def _idle_queue(self, key):
+        with self.lock:
+            if key not in self.idle:
+                self.idle[key] = queue.LifoQueue(maxsize=self.max_per_host)
+            return self.idle[key]
+
+    def acquire(self, scheme, host, port):
+        """Return an idle connection to the server, or a new one"""
+        try:
+            return self._idle_queue((scheme, host, port)).get_nowait()
+        except queue.Empty:
+            connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            return connection_class(host, port, timeout=TIMEOUT)
+
+    def release(self, scheme, host, port, connection):
+        """Return a connection to the pool (closed if the pool is full)"""
+        try:
+            self._idle_queue((scheme, host, port)).put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def close(self):
+        """Close all idle connections"""
+        with self.lock:
+            for idle_queue in self.idle.values():
+                while not idle_queue.empty():
+                    idle_queue.get_nowait().close()
+
+
+def http_get(pool, url, headers):
+    """
+    Send a GET request over a pooled connection, following redirects.
+
+    A request on a reused connection that the server has closed in the meantime is
+    retried once on a new connection.
+
+    Args:
+        pool: ConnectionPool
+        url: URL to fetch
+        headers: Extra request headers (conditional request headers)
+
+    Returns:
+        Tuple (status, response headers as a lower-case dict, body bytes)
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'https'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        path = (parts.path or '/') + (f"?{parts.query}" if parts.query else "")
+
+        for attempt in range(2):
+            connection = pool.acquire(scheme, parts.hostname, port)
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if attempt == 1:
+                    raise
+                continue
+            if response.will_close:
+                connection.close()
+            else:
+                pool.release(scheme, parts.hostname, port, connection)
+            break
+
+        response_headers = {name.lower(): value for name, value in response.getheaders()}
+        if response.status in (301, 302, 303, 307, 308) and 'location' in response_headers:
+            # Resolve relative locations ('/x', 'file.ttl', '../x') against the requested URL
+            url = urljoin(url, response_headers['location'])
+            continue
+        return response.status, response_headers, body
+    raise http.client.HTTPException(f"too many redirects for {url}")
+
+
+def refresh_file(pool, url, target_file, metadata, only_missing):
+    """
+    Download one file into the cache, unless the cached copy is still current.
+
+    The cached copy is revalidated with If-None-Match / If-Modified-Since when its
+    ETag or Last-Modified date is known and the file is unchanged on disk; a 304
+    response leaves it as is. New content is written to a temporary file and renamed,
+    so an interrupted download never leaves a partial file in the cache.
+
+    Args:
+        pool: ConnectionPool
+        url: URL to download
+        target_file: Path of the cached file
+        metadata: Previous metadata entry of the file (dict, may be empty)
+        only_missing: Only download the file if it is not cached yet
+
+    Returns:
+        Tuple (status, metadata): status is 'cached', 'unchanged', 'downloaded' or 'updated';
+        metadata is the new metadata entry
+    """
+    exists = os.path.isfile(target_file) and os.path.getsize(target_file) > 0
+    if exists and only_missing:
+        return 'cached', metadata
+
+    headers = {'User-Agent': 'CIDS-validate refresh_cache.py'}
+    old_sha256 = file_sha256(target_file) if exists else None
+    # Only revalidate files that still match what was downloaded
+    if exists and metadata.get('sha256') == old_sha256 and metadata.get('url') == url:
+        if metadata.get('etag'):
+            headers['If-None-Match'] = metadata['etag']
+        if metadata.get('last_modified'):
+            headers['If-Modified-Since'] = metadata['last_modified']
+
+    status, response_headers, body = http_get(pool, url, headers)
+    if status == 304 and exists:
+        return 'unchanged', dict(metadata, checked=int(time.time()))
+    if status != 200:
+        raise http.client.HTTPException(f"HTTP {status}")
+    if not body:
+        raise http.client.HTTPException("downloaded file is empty")
+
+    temp_file = f"{target_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(body)
+    os.replace(temp_file, target_file)
+
+    new_sha256 = hashlib.sha256(body).hexdigest()
+    new_metadata = {
+        'url': url,
+        'etag': response_headers.get('etag'),
+        'last_modified': response_headers.get('last-modified'),
+        'sha256': new_sha256,
+        'checked': int(time.time()),
+    }
+    if not exists:
+        return 'downloaded', new_metadata
+    return ('unchanged' if new_sha256 == old_sha256 else 'updated'), new_metadata
+
+
+def load_metadata(directory):
+    """Load the download metadata of a cache directory (empty if missing or unreadable)"""
+    try:
+        with open(os.path.join(directory, METADATA_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_metadata(directory, metadata):
+    """Write the download metadata of a cache directory (atomically)"""
+    metadata_file = os.path.join(directory, METADATA_FILE)
+    temp_file = f"{metadata_file}.{os.getpid()}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, indent=2, sort_keys=True)
+    os.replace(temp_file, metadata_file)
+
+
+def refresh_cache(cache_dir, downloads, base_url=None, jobs=DEFAULT_JOBS, only_missing=False):
+    """
+    Download or refresh a set of cached files concurrently.
+
+    Args:
+        cache_dir: Cache directory
+        downloads: List of (subdirectory, URL) pairs; each file is saved as
+                   cache_dir/subdirectory/[last part of the URL path]
+        base_url: Server to download from instead of the URLs' own (see rebase_url)
+        jobs: Number of concurrent downloads
+        only_missing: Only download files that are not cached yet
+
+    Returns:
+        Dict of status ('cached', 'unchanged', 'downloaded', 'updated', 'failed') -> list of cached file paths
+    """
+    metadata = {}
+    for subdir, _ in downloads:
+        directory = os.path.join(cache_dir, subdir)
+        if directory not in metadata:
+            os.makedirs(directory, exist_ok=True)
+            metadata[directory] = load_metadata(directory)
+
+    pool = ConnectionPool(max_per_host=jobs)
+    results = {'cached': [], 'unchanged': [], 'downloaded': [], 'updated': [], 'failed': []}
+
+    def task(subdir, url):
+        directory = os.path.join(cache_dir, subdir)
+        file_name = os.path.basename(urlsplit(url).path)
+        target_file = os.path.join(directory, file_name)
+        source_url = rebase_url(url, base_url)
+        try:
+            status, entry = refresh_file(pool, source_url, target_file,
+                                         metadata[directory].get(file_name, {}), only_missing)
+        except (http.client.HTTPException, OSError) as e:
+            print(f"Error: Failed to download {file_name} from {source_url}: {e}")
+            return 'failed', directory, file_name, None
+        return status, directory, file_name, entry
+
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(task, subdir, url) for subdir, url in downloads]
+            for future in futures:
+                status, directory, file_name, entry = future.result()
+                if entry:
+                    metadata[directory][file_name] = entry
+                results[status].append(os.path.join(directory, file_name))
+                if status in ('downloaded', 'updated'):
+                    print(f"  {status.capitalize()}: {file_name}")
+    finally:
+        pool.close()
+
+    for directory, entries in metadata.items():
+        save_metadata(directory, entries)
+    return results
+
+
+def main():
+    usage = ("Usage: python refresh_cache.py --cache-dir DIR [--only-missing] [--base-url URL] [--jobs N] "
+             "--to SUBDIR URL... [--to SUBDIR URL...]")
+
+    # Parse command-line arguments
+    cache_dir = None
+    base_url = os.environ.get('CIDS_CACHE_BASE_URL') or None
+    jobs = DEFAULT_JOBS
+    only_missing = False
+    subdir = None
+    downloads = []
+
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg == '--only-missing':
+            only_missing = True
+            i += 1
+        elif arg in ('--cache-dir', '--base-url', '--jobs', '--to'):
+            if i + 1 >= len(sys.argv):
+                print(f"Error: {arg} requires a value")
+                sys.exit(1)
+            value = sys.argv[i + 1]
+            if arg == '--cache-dir':
+                cache_dir = value
+            elif arg == '--base-url':
+                base_url = value
+            elif arg == '--to':
+                subdir = value
+            else:
+                try:
+                    jobs = int(value)
+                    if jobs < 1:
+                        raise ValueError
+                except ValueError:
+                    print("Error: --jobs requires a positive integer")
+                    sys.exit(1)
+            i += 2
+        elif arg.startswith('--'):
+            print(f"Error: Unknown option: {arg}")
+            print(usage)
+            sys.exit(1)
+        else:
+            if subdir is None:
+                print(f"Error: No --to directory given for {arg}")
+                print(usage)
+                sys.exit(1)
+            downloads.append((subdir, arg))
+            i += 1
+
+    if not cache_dir or not downloads:
+        print(usage)
+        sys.exit(1)
+
+    start_time = time.time()
+    results = refresh_cache(cache_dir, downloads, base_url=base_url, jobs=jobs, only_missing=only_missing)
+    elapsed = time.time() - start_time
+
+    print(f"Refreshed {len(downloads)} file(s) in {elapsed:.1f}s: {len(results['downloaded'])} downloaded, "
+          f"{len(results['updated'])} updated, {len(results['unchanged'])} unchanged, "
+          f"{len(results['cached'])} already cached, {len(results['failed'])} failed")
+    if results['failed']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
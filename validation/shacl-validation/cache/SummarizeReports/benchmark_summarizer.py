@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Benchmark the SHACL violations summarizer on synthetic Apache Jena validation reports.
+Generates reports with a realistic mix of minCount, DatatypeConstraint, ClassConstraint
+and NodeKind results (including codelist focus nodes), then times report parsing,
+summary generation and the normalization helpers at each size. Every measurement runs
+in a fresh process so that its peak memory can be attributed to it.
+Usage: python benchmark_summarizer.py [--sizes 1000,10000,...] [--output results.json] [--compare baseline.json]
+       python benchmark_summarizer.py --check [--sizes 1000,...]
+Example: python benchmark_summarizer.py --sizes 1000,10000 --compare benchmark-results/baseline.json
+"""
+
+import sys
+import os
+import json
+import contextlib
+import time
+import random
+import shutil
+import platform
+import tempfile
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+import summarize_shacl_violations as summarizer
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+# RDFLib needs roughly 10 KB of memory per result, so graph parsing is skipped above this size
+DEFAULT_MAX_RDFLIB_SIZE = 100000
+RESULTS_DIR = os.path.join(SCRIPT_DIR, 'benchmark-results')
+OPERATIONS = ('parse', 'stream', 'summary', 'normalize')
+# Shards used by --check for sharded N-Triples parsing
+CHECK_SHARDS = 4
+
+# Share of each kind of result, roughly as seen in CIDS/SFF reports
+RESULT_MIX = (
+    ('minCount', 0.45),
+    ('DatatypeConstraint', 0.25),
+    ('ClassConstraint', 0.20),
+    ('NodeKind', 0.10),
+)
+# Share of results whose focus node comes from an imported codelist
+CODELIST_RATIO = 0.15
+
+NODE_TYPES = ('Organization', 'Indicator', 'IndicatorReport', 'Outcome', 'Theme', 'Address', 'Characteristic')
+PROPERTIES = (
+    ('cids', 'hasName'), ('cids', 'hasDescription'), ('cids', 'forOrganization'), ('cids', 'hasIndicator'),
+    ('prov', 'startedAtTime'), ('prov', 'endedAtTime'), ('i72', 'value'), ('org', 'hasLegalName'),
+)
+CODELISTS = (
+    ('https://codelist.commonapproach.org', ('ICNPOsector', 'ProvinceTerritory', 'Locality', 'SELI-GLI')),
+    ('https://metadata.un.org', ('sdg/1', 'sdg/3', 'sdg/8', 'sdg/13')),
+)
+DATATYPES = (('xsd:string', 'xsd:dateTime'), ('xsd:dateTime', 'xsd:string'), ('xsd:decimal', 'xsd:string'))
+
+PREFIXES = """PREFIX cids:    <https://ontology.commonapproach.org/cids#>
+PREFIX csh:     <https://ontology.commonapproach.org/cids/shacl#>
+PREFIX i72:     <http://ontology.eil.utoronto.ca/ISO21972/iso21972#>
+PREFIX org:     <http://ontology.eil.utoronto.ca/tove/organization#>
+PREFIX prov:    <http://www.w3.org/ns/prov#>
+PREFIX rdf:     <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+PREFIX sh:      <http://www.w3.org/ns/shacl#>
+PREFIX xsd:     <http://www.w3.org/2001/XMLSchema#>
+
+"""
+
+def _turtle_string(text):
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def _random_result(rng, results):
+    """Return (focus node, message, path, shape, component, severity, value) Turtle terms for one result."""
+    kind = rng.choices([k for k, _ in RESULT_MIX], [w for _, w in RESULT_MIX])[0]
+    node_type = rng.choice(NODE_TYPES)
+    prefix, prop = rng.choice(PROPERTIES)
+    if rng.random() < CODELIST_RATIO:
+        base, lists = rng.choice(CODELISTS)
+        focus = f"<{base}/{rng.choice(lists)}/{rng.randrange(200)}>"
+    else:
+        # About three results per focus node, spread over a few data sources
+        focus = f"<https://example{rng.randrange(5)}.org/{node_type}/{rng.randrange(max(1, results // 3))}>"
+    shape = f"csh:{node_type}_{prop}_PropertyShape" if rng.random() < 0.7 else f"csh:{prop}_PropertyShape"
+    severity = 'sh:Violation' if rng.random() < 0.9 else 'sh:Warning'
+
+    if kind == 'minCount':
+        message = "minCount[1]: Invalid cardinality: expected min 1: Got count = 0"
+        component, value = 'sh:MinCountConstraintComponent', None
+    elif kind == 'DatatypeConstraint':
+        expected, actual = rng.choice(DATATYPES)
+        if actual == 'xsd:dateTime':
+            lexical = f"2024-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}T19:00:00-08:00"
+        elif rng.random() < 0.1:
+            # Empty strings resolved by Jena to the document base URI
+            lexical = None
+        else:
+            lexical = f"value {rng.randrange(1000)}"
+        if lexical is None:
+            message = f"DatatypeConstraint[{expected}]: Expected {expected} : Actual IRI : Node <file:///data/input.jsonld>"
+            value = "<file:///data/input.jsonld>"
+        else:
+            message = (f'DatatypeConstraint[{expected}]: Expected {expected} : Actual {actual} : '
+                       f'Node "{lexical}"^^{actual}')
+            value = f'{_turtle_string(lexical)}^^{actual}'
+        component = 'sh:DatatypeConstraintComponent'
+    elif kind == 'ClassConstraint':
+        expected = rng.choice(NODE_TYPES)
+        target = f"https://example{rng.randrange(5)}.org/{rng.choice(NODE_TYPES)}/{rng.randrange(1000)}"
+        message = (f"ClassConstraint[<https://ontology.commonapproach.org/cids#{expected}>]: "
+                   f"Expected class :<https://ontology.commonapproach.org/cids#{expected}> for <{target}>")
+        component, value = 'sh:ClassConstraintComponent', f"<{target}>"
+    else:
+        lexical = f"contact{rng.randrange(1000)}@example.org"
+        message = f'NodeKind[IRI] : Expected IRI for "{lexical}"'
+        component, value = 'sh:NodeKindConstraintComponent', _turtle_string(lexical)
+    return focus, _turtle_string(message), f"{prefix}:{prop}", shape, component, severity, value
+
+def generate_report(file_path, results, seed=0):
+    """
+    Write a synthetic validation report in the Turtle layout of Jena's `shacl validate`.
+
+    Args:
+        file_path: Path of the report to write
+        results: Number of sh:ValidationResult entries
+        seed: Random seed (the same seed and size always give the same report)
+    """
+    rng = random.Random(seed)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(PREFIXES)
+        f.write("[ rdf:type     sh:ValidationReport;\n  sh:conforms  false")
+        for _ in range(results):
+            focus, message, path, shape, component, severity, value = _random_result(rng, results)
+            f.write(";\n  sh:result    [ rdf:type                      sh:ValidationResult;\n"
+                    f"                 sh:focusNode                  {focus};\n"
+                    f"                 sh:resultMessage              {message};\n"
+                    f"                 sh:resultPath                 {path};\n"
+                    f"                 sh:resultSeverity             {severity};\n"
+                    f"                 sh:sourceConstraintComponent  {component};\n"
+                    f"                 sh:sourceShape                {shape}")
+            if value is not None:
+                f.write(f";\n                 sh:value                      {value}")
+            f.write("\n               ]")
+        f.write("\n] .\n")
+
+def _quiet():
+    """Silence the summarizer's progress output in benchmark workers."""
+    sys.stdout = open(os.devnull, 'w')
+
+def _run_operation(args):
+    """
+    Worker entry point: run one operation on one report and measure it.
+    parse/stream save the parsed violations to store_file, which summary/normalize load.
+    """
+    operation, report_file, store_file, work_dir = args
+    rss_before = summarizer.peak_rss_mb()
+    if operation in ('summary', 'normalize'):
+        violations = summarizer.ViolationStore.load(store_file)
+        rss_before = summarizer.peak_rss_mb()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    if operation == 'parse':
+        violations = summarizer.parse_validation_report(report_file)
+        items = len(violations)
+    elif operation == 'stream':
+        violations = summarizer.ViolationStore.from_violations(summarizer.iter_validation_results(report_file))
+        items = len(violations)
+    elif operation == 'summary':
+        summarizer.generate_summary(violations, os.path.join(work_dir, 'summary.txt'))
+        items = len(violations)
+    else:
+        summarizer.clear_classification_caches()
+        strings = violations.pool.strings
+        columns = violations.columns
+        for focus_id, message_id, path_id, shape_id, severity_id, value_id in zip(
+                columns['focusNode'], columns['resultMessage'], columns['resultPath'],
+                columns['sourceShape'], columns['severity'], columns['value']):
+            message = strings[message_id]
+            summarizer.normalize_error_message(message)
+            summarizer.extract_constraint_type(message)
+            summarizer.extract_node_type(strings[shape_id])
+            summarizer.extract_property_name(strings[path_id])
+            summarizer.extract_severity_name(strings[severity_id])
+            summarizer.normalize_value(strings[value_id])
+            summarizer.is_codelist_node(strings[focus_id])
+        items = len(violations)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    if operation in ('parse', 'stream'):
+        violations.save(store_file)
+    return {
+        'wall_seconds': round(wall, 6),
+        'cpu_seconds': round(cpu, 6),
+        'items': items,
+        'throughput_per_second': round(items / wall, 1) if wall > 0 else None,
+        'rss_before_mb': rss_before,
+        'peak_rss_mb': summarizer.peak_rss_mb(),
+    }
+
+def run_benchmark(sizes, repeat=1, max_rdflib_size=DEFAULT_MAX_RDFLIB_SIZE, reports_dir=None, seed=0):
+    """
+    Generate a report for each size and measure every operation (see OPERATIONS).
+
+    Args:
+        sizes: Numbers of validation results
+        repeat: Runs per operation; the fastest run is kept
+        max_rdflib_size: Largest size for which the RDFLib 'parse' operation is run
+        reports_dir: Directory to keep generated reports in (default: a temporary directory)
+        seed: Random seed for the report generator
+
+    Returns:
+        List of result dictionaries (size, operation, timings, throughput, memory)
+    """
+    work_dir = reports_dir or tempfile.mkdtemp(prefix='summarizer-benchmark-')
+    os.makedirs(work_dir, exist_ok=True)
+    # Fresh interpreter per measurement, so peak RSS belongs to that measurement alone
+    context = multiprocessing.get_context('spawn')
+    results = []
+    try:
+        for size in sizes:
+            report_file = os.path.join(work_dir, f"report-synthetic-{size}.ttl")
+            store_file = os.path.join(work_dir, f"report-synthetic-{size}.pickle")
+            if not os.path.exists(report_file):
+                print(f"Generating report with {size} results...")
+                generate_report(report_file, size, seed)
+            report_bytes = os.path.getsize(report_file)
+
+            for operation in OPERATIONS:
+                if operation == 'parse' and size > max_rdflib_size:
+                    print(f"  {size:>9} {operation:<10} skipped (above --max-rdflib-size)")
+                    continue
+                runs = []
+                for _ in range(repeat):
+                    with ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_quiet) as executor:
+                        runs.append(executor.submit(_run_operation, (operation, report_file, store_file, work_dir)).result())
+                best = min(runs, key=lambda run: run['wall_seconds'])
+                best.update({'size': size, 'operation': operation, 'report_bytes': report_bytes,
+                             'runs': [run['wall_seconds'] for run in runs]})
+                results.append(best)
+                print(f"  {size:>9} {operation:<10} {best['wall_seconds']:>10.3f}s "
+                      f"{best['throughput_per_second'] or 0:>12.0f}/s {best['peak_rss_mb'] or 0:>9.1f} MB")
+    finally:
+        if reports_dir is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+def write_ntriples_layouts(report_file, grouped_file, shuffled_file, seed=0):
+    """
+    Re-serialize a Turtle report as N-Triples twice: with the triples of each subject
+    on consecutive lines (the layout Jena writes), and in random line order.
+    """
+    from rdflib import Graph
+    g = Graph()
+    g.parse(report_file, format='turtle')
+    lines = [f"{s.n3()} {p.n3()} {o.n3()} .\n" for s, p, o in g]
+    lines.sort(key=lambda line: line.split(' ', 1)[0])
+    with open(grouped_file, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+    random.Random(seed).shuffle(lines)
+    with open(shuffled_file, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+
+def _load_for_check(report_file, parser):
+    """Load a report without the cache; returns (sorted violation tuples, excluded codelist count)."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        violations = summarizer.load_violations(report_file, parser=parser,
+                                                codelist_filter=summarizer.CodelistFilter())
+    rows = sorted(tuple(violation[field] or '' for field in summarizer.ViolationStore.FIELDS)
+                  for violation in violations)
+    return rows, violations.excluded_codelist_count
+
+def _summary_for_check(report_file, shards):
+    """Summarize a report without the cache and return the summary text."""
+    summary_file = f"{report_file}.{shards}-shards.txt"
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        summarizer.summarize_report(report_file, summary_file, shards=shards)
+    with open(summary_file, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def check_parsers(sizes, seed=0):
+    """
+    Check that the default parser gives the same violations as RDFLib, for the Turtle
+    report and for N-Triples serializations that are and are not grouped by subject,
+    and that sharded parsing of the N-Triples gives the same summary as the Turtle report.
+
+    Args:
+        sizes: Numbers of validation results
+        seed: Random seed for the report generator and the line shuffle
+
+    Returns:
+        Number of mismatches (0 if every layout matched)
+    """
+    work_dir = tempfile.mkdtemp(prefix='summarizer-check-')
+    mismatches = 0
+    try:
+        for size in sizes:
+            report_file = os.path.join(work_dir, f"report-synthetic-{size}.ttl")
+            grouped_file = os.path.join(work_dir, f"report-synthetic-{size}.nt")
+            shuffled_file = os.path.join(work_dir, f"report-synthetic-{size}-shuffled.nt")
+            generate_report(report_file, size, seed)
+            write_ntriples_layouts(report_file, grouped_file, shuffled_file, seed)
+            expected = _load_for_check(report_file, 'rdflib')
+            expected_summary = _summary_for_check(report_file, 1)
+            for label, file_path in (('turtle', report_file), ('nt', grouped_file), ('nt-shuffled', shuffled_file)):
+                actual = _load_for_check(file_path, 'auto')
+                ok = actual == expected
+                mismatches += not ok
+                print(f"  {size:>9} {label:<19} {'ok' if ok else 'MISMATCH'} "
+                      f"({len(actual[0])} violations, {actual[1]} excluded; expected {len(expected[0])}, {expected[1]})")
+                if file_path != report_file:
+                    ok = _summary_for_check(file_path, CHECK_SHARDS) == expected_summary
+                    mismatches += not ok
+                    print(f"  {size:>9} {label + ' shards':<19} {'ok' if ok else 'MISMATCH'} "
+                          f"(summary with {CHECK_SHARDS} shards)")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return mismatches
+
+def compare_results(baseline, current):
+    """Print wall time and peak memory of the current run against a baseline run."""
+    baseline_index = {(r['size'], r['operation']): r for r in baseline['results']}
+    print(f"\nComparison with baseline from {baseline.get('created', 'unknown date')}")
+    print(f"{'Size':>9} {'Operation':<10} {'Baseline':>10} {'Current':>10} {'Speedup':>8} {'Base MB':>9} {'Cur MB':>9}")
+    for result in current['results']:
+        old = baseline_index.get((result['size'], result['operation']))
+        if old is None:
+            continue
+        speedup = old['wall_seconds'] / result['wall_seconds'] if result['wall_seconds'] else float('inf')
+        print(f"{result['size']:>9} {result['operation']:<10} {old['wall_seconds']:>9.3f}s "
+              f"{result['wall_seconds']:>9.3f}s {speedup:>7.2f}x "
+              f"{old.get('peak_rss_mb') or 0:>9.1f} {result.get('peak_rss_mb') or 0:>9.1f}")
+
+def main():
+    usage = ("Usage: python benchmark_summarizer.py [--sizes N,N,...] [--repeat R] [--max-rdflib-size N] "
+             "[--keep-reports DIR] [--seed S] [--output results.json] [--compare baseline.json]\n"
+             "       python benchmark_summarizer.py --check [--sizes N,N,...] [--seed S]")
+    sizes = DEFAULT_SIZES
+    repeat = 1
+    max_rdflib_size = DEFAULT_MAX_RDFLIB_SIZE
+    reports_dir = None
+    seed = 0
+    output_file = None
+    compare_file = None
+    check = False
+
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        value = sys.argv[i + 1] if i + 1 < len(sys.argv) else None
+        if arg in ('-h', '--help'):
+            print(usage)
+            sys.exit(0)
+        if arg == '--check':
+            check = True
+            i += 1
+            continue
+        if value is None:
+            print(f"Error: {arg} requires a value")
+            print(usage)
+            sys.exit(1)
+        if arg == '--sizes':
+            try:
+                sizes = tuple(int(size) for size in value.split(',') if size.strip())
+            except ValueError:
+                print("Error: --sizes requires a comma-separated list of numbers")
+                sys.exit(1)
+        elif arg in ('--repeat', '--max-rdflib-size', '--seed'):
+            if not value.isdigit():
+                print(f"Error: {arg} requires a number")
+                sys.exit(1)
+            if arg == '--repeat':
+                repeat = max(1, int(value))
+            elif arg == '--max-rdflib-size':
+                max_rdflib_size = int(value)
+            else:
+                seed = int(value)
+        elif arg == '--keep-reports':
+            reports_dir = value
+        elif arg == '--output':
+            output_file = value
+        elif arg == '--compare':
+            compare_file = value
+        else:
+            print(f"Error: Unknown argument: {arg}")
+            print(usage)
+            sys.exit(1)
+        i += 2
+
+    if check:
+        print(f"{'Size':>9} {'Layout':<19} Result")
+        mismatches = check_parsers(sizes if sizes != DEFAULT_SIZES else (1000,), seed)
+        sys.exit(1 if mismatches else 0)
+
+    baseline = None
+    if compare_file:
+        try:
+            with open(compare_file, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error: Failed to read baseline '{compare_file}': {e}")
+            sys.exit(1)
+
+    print(f"{'Size':>9} {'Operation':<10} {'Wall':>11} {'Throughput':>14} {'Peak RSS':>12}")
+    results = run_benchmark(sizes, repeat, max_rdflib_size, reports_dir, seed)
+
+    current = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'summarizer_sha256': summarizer.report_content_hash(summarizer.__file__),
+        'seed': seed,
+        'results': results,
+    }
+    if output_file is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output_file = os.path.join(RESULTS_DIR, f"benchmark-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(current, f, indent=2)
+        f.write("\n")
+    print(f"Results written to: {output_file}")
+
+    if baseline is not None:
+        compare_results(baseline, current)
+
+if __name__ == '__main__':
+    main()
@@ -11,29 +11,199 @@ import sys
 import warnings
 import os
 import json
-from collections import defaultdict
-from rdflib import Graph, Namespace
-from rdflib.namespace import RDF
+import hashlib
+import pickle
+import csv
+import time
+from array import array
+from bisect import insort
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from functools import lru_cache
 import re
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
 # Define SHACL namespace
-SH = Namespace("http://www.w3.org/ns/shacl#")
+SH = "http://www.w3.org/ns/shacl#"
+SH_VALIDATION_RESULT = SH + "ValidationResult"
 
-def extract_node_type(source_shape):
+# Map of sh:ValidationResult predicates to the keys used in violation dictionaries
+# (in the order the keys appear in each violation dictionary)
+RESULT_FIELDS = {
+    SH + 'focusNode': 'focusNode',
+    SH + 'resultMessage': 'resultMessage',
+    SH + 'resultPath': 'resultPath',
+    SH + 'sourceShape': 'sourceShape',
+    SH + 'sourceConstraintComponent': 'constraintComponent',
+    SH + 'resultSeverity': 'severity',
+    SH + 'value': 'value',
+}
+
+# Number of characters read from the report at a time in streaming mode
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Number of recently closed result subjects remembered by the streaming reader to
+# detect reports whose result triples are not grouped (see _assemble_violations)
+CLOSED_SUBJECT_WINDOW = 4096
+
+# On-disk cache of parsed reports (see load_violations)
+PARSED_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsed-cache')
+PARSED_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Bump when the cached format or the parsing results change
+PARSED_CACHE_VERSION = 3
+
+# Summary output formats (see write_summary_outputs)
+SUMMARY_FORMATS = ('text', 'jsonl', 'csv', 'parquet')
+# Columns of the aggregate counts written as CSV / Parquet
+COUNT_COLUMNS = ('constraint_type', 'property', 'node_type', 'count')
+# Marker for "no group written yet" in write_summary (None is a valid path / message)
+_NO_GROUP = object()
+
+def peak_rss_mb():
+    """Return the peak resident set size of this process in MB, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KB elsewhere
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+class StageProfiler:
     """
-    Extract node type from sourceShape.
-    Pattern: csh:NodeType_property_PropertyShape -> NodeType
-    Also handles full URIs.
+    Records wall time, CPU time, peak RSS and item counts per stage of the summarizer
+    (see --profile). Stages are recorded in the order they finish; nested stages are
+    allowed. Peak RSS is the process peak at the end of the stage.
+    
+    Usage:
+        with profiler.stage('parse') as stage:
+            ...
+            stage['items'] = number_of_triples
     """
-    if not source_shape:
-        return "Unknown"
+
+    def __init__(self):
+        self.stages = []
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    @contextmanager
+    def stage(self, name, items=None):
+        record = {'stage': name, 'items': items}
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] = round(time.perf_counter() - wall_start, 6)
+            record['cpu_seconds'] = round(time.process_time() - cpu_start, 6)
+            record['peak_rss_mb'] = peak_rss_mb()
+            self.stages.append(record)
+
+    def to_dict(self):
+        return {
+            'stages': self.stages,
+            'total': {
+                'wall_seconds': round(time.perf_counter() - self._wall_start, 6),
+                'cpu_seconds': round(time.process_time() - self._cpu_start, 6),
+                'peak_rss_mb': peak_rss_mb(),
+            },
+            'classification_cache': classification_cache_info(),
+        }
+
+    def write(self, output_file, **info):
+        """Write the recorded stages (plus any extra info) as JSON."""
+        data = dict(info)
+        data.update(self.to_dict())
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        print(f"Profile written to: {output_file}")
+
+class NullProfiler:
+    """StageProfiler stand-in that records nothing (the default when not profiling)."""
+
+    @contextmanager
+    def stage(self, name, items=None):
+        yield {}
+
+NULL_PROFILER = NullProfiler()
+
+# Classification layer
+# Reports repeat the same few hundred distinct messages, shapes and paths many
+# times, so each classification helper below works on the raw string through a
+# bounded memo cache (see classification_cache_info for hit/miss counters), and
+# all regular expressions are compiled once.
+
+# Maximum number of distinct strings remembered by each classification cache
+CLASSIFICATION_CACHE_SIZE = 8192
+
+_NODE_TYPE_RE = re.compile(r':([A-Za-z][A-Za-z0-9]*)_')
+_DATATYPE_MESSAGE_RE = re.compile(r'(DatatypeConstraint\[[^\]]+\]:\s*Expected\s+[^:]+)')
+_CLASS_MESSAGE_RE = re.compile(r'(ClassConstraint\[[^\]]+\]:\s*Expected\s+class\s*:[^:]+)')
+_CARDINALITY_MESSAGE_RE = re.compile(r'((?:min|max)Count\[\d+\]:\s*Invalid\s+cardinality:\s*expected\s+(?:min|max)\s+\d+)')
+_NODE_KIND_MESSAGE_RE = re.compile(r'(NodeKindConstraint[^:]+:\s*Expected[^:]+)')
+
+def _truncate_with(pattern):
+    """Build a message normalizer that keeps the first match of a pattern."""
+    def truncate(msg_str):
+        match = pattern.search(msg_str)
+        return match.group(1) if match else None
+    return truncate
+
+def _truncate_class_message(msg_str):
+    # Pattern: "ClassConstraint[...]: Expected class :<URI> for <actual_value>"
+    # We want to keep up to the expected URI, removing " for <actual_value>"
+    if ' for ' in msg_str:
+        return msg_str.split(' for ')[0]
+    # Fallback if no "for" pattern
+    match = _CLASS_MESSAGE_RE.search(msg_str)
+    return match.group(1) if match else None
+
+# Dispatch table on the constraint prefix of a resultMessage:
+# prefix -> (constraint type, normalizer returning the truncated message or None)
+_MESSAGE_CLASSIFIERS = {
+    "DatatypeConstraint": ("DatatypeConstraint", _truncate_with(_DATATYPE_MESSAGE_RE)),
+    "ClassConstraint": ("ClassConstraint", _truncate_class_message),
+    "minCount": ("MinCountConstraint", _truncate_with(_CARDINALITY_MESSAGE_RE)),
+    "maxCount": ("MaxCountConstraint", _truncate_with(_CARDINALITY_MESSAGE_RE)),
+    "NodeKindConstraint": ("NodeKindConstraint", _truncate_with(_NODE_KIND_MESSAGE_RE)),
+    "InConstraint": ("InConstraint", None),
+    "HasValueConstraint": ("HasValueConstraint", None),
+}
+_MESSAGE_PREFIX_RE = re.compile('|'.join(re.escape(prefix) for prefix in _MESSAGE_CLASSIFIERS))
+
+# Markers after which the actual value part of other messages starts
+_MESSAGE_VALUE_MARKERS = (': Actual', ': Got', ': Node')
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_message(msg_str):
+    """Return (constraint type, normalized message) for a non-empty message string."""
+    constraint_type = "Other"
+    match = _MESSAGE_PREFIX_RE.match(msg_str)
+    if match:
+        constraint_type, truncate = _MESSAGE_CLASSIFIERS[match.group()]
+        if truncate is not None:
+            normalized = truncate(msg_str)
+            if normalized is not None:
+                return constraint_type, normalized
     
-    # Convert to string
-    shape_str = str(source_shape)
+    # For other types, try to truncate at common patterns
+    # Look for patterns like ": Actual" or ": Got" or ": Node"
+    for marker in _MESSAGE_VALUE_MARKERS:
+        if marker in msg_str:
+            return constraint_type, msg_str.split(marker)[0]
     
+    # If no pattern matches, return the full message
+    return constraint_type, msg_str
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _node_type_from_shape(shape_str):
     # Pattern 1: prefix:NodeType_property_PropertyShape (e.g., csh:IndicatorReport_endedAtTime_PropertyShape)
     # Extract the part between the colon/prefix and the first underscore
-    match = re.search(r':([A-Za-z][A-Za-z0-9]*)_', shape_str)
+    match = _NODE_TYPE_RE.search(shape_str)
     if match:
         return match.group(1)
     
@@ -54,6 +224,79 @@ def extract_node_type(source_shape):
     
     return "Unknown"
 
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _property_name_from_uri(prop_str):
+    # Handle prefixed names (e.g., "cids:forOrganization")
+    if ':' in prop_str and not prop_str.startswith('http'):
+        return prop_str.split(':')[-1]
+    
+    # Handle full URIs with # fragment (e.g., "https://example.org/ns#propertyName")
+    if '#' in prop_str:
+        return prop_str.split('#')[-1]
+    
+    # Handle full URIs with / path (e.g., "http://example.org/ns/propertyName")
+    if '/' in prop_str and prop_str.startswith('http'):
+        return prop_str.split('/')[-1]
+    
+    # Already a local name
+    return prop_str
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _severity_name_from_uri(uri_str):
+    # Extract the local name from SHACL namespace URIs
+    if 'shacl#Violation' in uri_str or uri_str.endswith('#Violation'):
+        return "Violation"
+    elif 'shacl#Warning' in uri_str or uri_str.endswith('#Warning'):
+        return "Warning"
+    elif 'shacl#Info' in uri_str or uri_str.endswith('#Info'):
+        return "Info"
+    
+    # Try to extract the fragment/name part
+    if '#' in uri_str:
+        return uri_str.split('#')[-1]
+    elif '/' in uri_str:
+        return uri_str.split('/')[-1]
+    
+    return uri_str
+
+_CLASSIFICATION_CACHES = {
+    'message': _classify_message,
+    'node_type': _node_type_from_shape,
+    'property_name': _property_name_from_uri,
+    'severity_name': _severity_name_from_uri,
+}
+
+def classification_cache_info():
+    """
+    Return hit/miss counters of the classification memo caches.
+    
+    Returns:
+        Dictionary mapping cache name ('message', 'node_type', 'property_name',
+        'severity_name') to a dictionary with 'hits', 'misses', 'size' and 'maxsize'
+    """
+    info = {}
+    for name, cached in _CLASSIFICATION_CACHES.items():
+        stats = cached.cache_info()
+        info[name] = {'hits': stats.hits, 'misses': stats.misses,
+                      'size': stats.currsize, 'maxsize': stats.maxsize}
+    return info
+
+def clear_classification_caches():
+    """Empty the classification memo caches and reset their counters."""
+    for cached in _CLASSIFICATION_CACHES.values():
+        cached.cache_clear()
+
+def extract_node_type(source_shape):
+    """
+    Extract node type from sourceShape.
+    Pattern: csh:NodeType_property_PropertyShape -> NodeType
+    Also handles full URIs.
+    """
+    if not source_shape:
+        return "Unknown"
+    
+    return _node_type_from_shape(str(source_shape))
+
 def extract_property_name(property_uri):
     """
     Extract the local name from a property URI.
@@ -68,22 +311,20 @@ def extract_property_name(property_uri):
     if not property_uri:
         return "Unknown"
     
-    prop_str = str(property_uri)
-    
-    # Handle prefixed names (e.g., "cids:forOrganization")
-    if ':' in prop_str and not prop_str.startswith('http'):
-        return prop_str.split(':')[-1]
-    
-    # Handle full URIs with # fragment (e.g., "https://example.org/ns#propertyName")
-    if '#' in prop_str:
-        return prop_str.split('#')[-1]
+    return _property_name_from_uri(str(property_uri))
+
+def classify_message(result_message):
+    """
+    Classify a resultMessage in one cached lookup.
     
-    # Handle full URIs with / path (e.g., "http://example.org/ns/propertyName")
-    if '/' in prop_str and prop_str.startswith('http'):
-        return prop_str.split('/')[-1]
+    Returns:
+        Tuple of (constraint type, normalized message), as returned by
+        extract_constraint_type and normalize_error_message
+    """
+    if not result_message:
+        return "Unknown", "Unknown"
     
-    # Already a local name
-    return prop_str
+    return _classify_message(str(result_message))
 
 def normalize_error_message(result_message):
     """
@@ -96,48 +337,7 @@ def normalize_error_message(result_message):
     - "ClassConstraint[...]: Expected class :..." -> "ClassConstraint[...]: Expected class"
     - "minCount[1]: Invalid cardinality: expected min 1: Got count = 0" -> "minCount[1]: Invalid cardinality: expected min 1"
     """
-    if not result_message:
-        return "Unknown"
-    
-    msg_str = str(result_message)
-    
-    # DatatypeConstraint: truncate after "Expected <type>"
-    if msg_str.startswith("DatatypeConstraint"):
-        match = re.search(r'(DatatypeConstraint\[[^\]]+\]:\s*Expected\s+[^:]+)', msg_str)
-        if match:
-            return match.group(1)
-    
-    # ClassConstraint: truncate after the expected class URI (before "for")
-    elif msg_str.startswith("ClassConstraint"):
-        # Pattern: "ClassConstraint[...]: Expected class :<URI> for <actual_value>"
-        # We want to keep up to the expected URI, removing " for <actual_value>"
-        if ' for ' in msg_str:
-            return msg_str.split(' for ')[0]
-        # Fallback if no "for" pattern
-        match = re.search(r'(ClassConstraint\[[^\]]+\]:\s*Expected\s+class\s*:[^:]+)', msg_str)
-        if match:
-            return match.group(1)
-    
-    # minCount/maxCount: truncate after "expected min/max <number>"
-    elif msg_str.startswith("minCount") or msg_str.startswith("maxCount"):
-        match = re.search(r'((?:min|max)Count\[\d+\]:\s*Invalid\s+cardinality:\s*expected\s+(?:min|max)\s+\d+)', msg_str)
-        if match:
-            return match.group(1)
-    
-    # NodeKindConstraint: truncate after "Expected"
-    elif msg_str.startswith("NodeKindConstraint"):
-        match = re.search(r'(NodeKindConstraint[^:]+:\s*Expected[^:]+)', msg_str)
-        if match:
-            return match.group(1)
-    
-    # For other types, try to truncate at common patterns
-    # Look for patterns like ": Actual" or ": Got" or ": Node"
-    for pattern in [': Actual', ': Got', ': Node']:
-        if pattern in msg_str:
-            return msg_str.split(pattern)[0]
-    
-    # If no pattern matches, return the full message
-    return msg_str
+    return classify_message(result_message)[1]
 
 def extract_constraint_type(result_message):
     """
@@ -147,29 +347,7 @@ def extract_constraint_type(result_message):
     - "ClassConstraint[...]: ..." -> "ClassConstraint"
     - "minCount[1]: ..." -> "MinCountConstraint"
     """
-    if not result_message:
-        return "Unknown"
-    
-    msg_str = str(result_message)
-    
-    # Check for explicit constraint types
-    if msg_str.startswith("DatatypeConstraint"):
-        return "DatatypeConstraint"
-    elif msg_str.startswith("ClassConstraint"):
-        return "ClassConstraint"
-    elif msg_str.startswith("minCount"):
-        return "MinCountConstraint"
-    elif msg_str.startswith("maxCount"):
-        return "MaxCountConstraint"
-    elif msg_str.startswith("NodeKindConstraint"):
-        return "NodeKindConstraint"
-    elif msg_str.startswith("InConstraint"):
-        return "InConstraint"
-    elif msg_str.startswith("HasValueConstraint"):
-        return "HasValueConstraint"
-    
-    # Try to extract from sourceConstraintComponent if available
-    return "Other"
+    return classify_message(result_message)[0]
 
 def normalize_value(value):
     """
@@ -211,223 +389,1387 @@ def extract_severity_name(severity_uri):
     if not severity_uri:
         return None
     
-    uri_str = str(severity_uri)
-    
-    # Extract the local name from SHACL namespace URIs
-    if 'shacl#Violation' in uri_str or uri_str.endswith('#Violation'):
-        return "Violation"
-    elif 'shacl#Warning' in uri_str or uri_str.endswith('#Warning'):
-        return "Warning"
-    elif 'shacl#Info' in uri_str or uri_str.endswith('#Info'):
-        return "Info"
+    return _severity_name_from_uri(str(severity_uri))
+
+# Authorities (optionally followed by a path) of imported codelists (see --codelist-domains)
+CODELIST_DOMAINS = (
+    'codelist.commonapproach.org',
+    'metadata.un.org',  # SDG metadata
+)
+
+@lru_cache(maxsize=None)
+def compile_codelist_matcher(domains):
+    """
+    Compile codelist domains into a single prefix matcher for IRIs.
     
-    # Try to extract the fragment/name part
-    if '#' in uri_str:
-        return uri_str.split('#')[-1]
-    elif '/' in uri_str:
-        return uri_str.split('/')[-1]
+    A domain matches IRIs whose authority is the domain or one of its
+    subdomains (with any scheme, user info or port); a domain with a path
+    (e.g. 'example.org/codes') also requires the path to start with it.
     
-    return uri_str
+    Args:
+        domains: Tuple of domains
+        
+    Returns:
+        Function returning a truthy value for IRIs that belong to a codelist
+    """
+    if not domains:
+        return lambda uri: None
+    alternatives = '|'.join(re.escape(domain.strip().strip('/')) for domain in domains)
+    pattern = re.compile(
+        r'[A-Za-z][A-Za-z0-9+.-]*://(?:[^/?#@]*@)?(?:[^/?#:@]*\.)?(?:' + alternatives + r')(?=[:/?#]|$)',
+        re.IGNORECASE)
+    return pattern.match
 
-def is_codelist_node(focus_node_uri):
+def is_codelist_node(focus_node_uri, domains=CODELIST_DOMAINS):
     """
     Check if a focus node URI belongs to an imported codelist.
-    Codelists are typically identified by their domain patterns.
+    Codelists are identified by their domains (see compile_codelist_matcher).
     
     Args:
         focus_node_uri: The focus node URI string
+        domains: Codelist domains (default: CODELIST_DOMAINS)
         
     Returns:
         True if the node belongs to a codelist, False otherwise
     """
     if not focus_node_uri:
         return False
+    return compile_codelist_matcher(tuple(domains))(str(focus_node_uri)) is not None
+
+class CodelistFilter:
+    """
+    Drops violations on codelist focus nodes while a report is parsed, so that
+    excluded violations are counted but never stored (see load_violations).
+    """
+
+    def __init__(self, domains=CODELIST_DOMAINS):
+        self.domains = tuple(domains)
+        self.matches = compile_codelist_matcher(self.domains)
+        self.excluded = 0
+
+    def cache_key(self):
+        """Short digest of the domain list, used in parsed-report cache keys."""
+        return hashlib.sha256('\n'.join(sorted(self.domains)).encode('utf-8')).hexdigest()[:12]
+
+    def is_codelist(self, focus_node):
+        return bool(focus_node) and self.matches(focus_node) is not None
+
+    def filter(self, violations):
+        """Yield the violations that are not on codelist focus nodes, counting the others."""
+        matches = self.matches
+        for violation in violations:
+            focus_node = violation.get('focusNode')
+            if focus_node and matches(focus_node) is not None:
+                self.excluded += 1
+                continue
+            yield violation
+
+class ReportSyntaxError(ValueError):
+    """Raised when the streaming reader cannot parse a validation report."""
+
+
+_TURTLE_TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+|\#[^\n]*(?:\n|$))
+  | (?P<iri><[^<>"{}|^`\\\s]*>)
+  | (?P<long_string>"""(?:[^"\\]|\\.|"(?!""))*"""|\'\'\'(?:[^'\\]|\\.|'(?!''))*\'\'\')
+  | (?P<string>"(?:[^"\\\n\r]|\\.)*"|'(?:[^'\\\n\r]|\\.)*')
+  | (?P<bnode>_:[A-Za-z0-9_](?:[\w.-]*[\w-])?)
+  | (?P<pname>(?:[A-Za-z](?:[\w.-]*[\w-])?)?:(?:(?:[\w:%-]|\\.)(?:(?:[\w.:%-]|\\.)*(?:[\w:%-]|\\.))?)?)
+  | (?P<number>[+-]?(?:\d+\.\d*[eE][+-]?\d+|\.?\d+[eE][+-]?\d+|\d*\.\d+|\d+))
+  | (?P<at>@[A-Za-z]+(?:-[A-Za-z0-9]+)*)
+  | (?P<datatype>\^\^)
+  | (?P<keyword>[A-Za-z]+)
+  | (?P<punct>[\[\]();,.])
+''', re.VERBOSE)
+
+_NT_LINE_RE = re.compile(
+    r'\s*(<[^>]*>|_:\S+)\s+<([^>]*)>\s+'
+    r'(<[^>]*>|_:\S+|"(?:[^"\\]|\\.)*"(?:@[A-Za-z0-9-]+|\^\^<[^>]*>)?)\s*\.\s*(?:#.*)?$'
+)
+
+# Minimum amount of buffered text kept ahead of the tokenizer
+_TOKEN_LOOKAHEAD = 4096
+
+_STRING_ESCAPE_RE = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))', re.DOTALL)
+_PNAME_ESCAPE_RE = re.compile(r'\\(.)')
+_STRING_ESCAPES = {'t': '\t', 'b': '\b', 'n': '\n', 'r': '\r', 'f': '\f'}
+
+RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+RDF_FIRST = "http://www.w3.org/1999/02/22-rdf-syntax-ns#first"
+RDF_REST = "http://www.w3.org/1999/02/22-rdf-syntax-ns#rest"
+RDF_NIL = "http://www.w3.org/1999/02/22-rdf-syntax-ns#nil"
+
+def _unescape(text):
+    """Decode Turtle/N-Triples string and IRI escape sequences."""
+    if '\\' not in text:
+        return text
+
+    def replace(match):
+        code = match.group(1) or match.group(2)
+        if code:
+            return chr(int(code, 16))
+        char = match.group(3)
+        return _STRING_ESCAPES.get(char, char)
+
+    return _STRING_ESCAPE_RE.sub(replace, text)
+
+def _iter_turtle_tokens(stream, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Tokenize a Turtle document read from a text stream, one chunk at a time.
+    Whitespace and comments are dropped. More input is read before matching
+    whenever the buffered text runs short, a token touches the end of the
+    buffer, or a long string has not been closed yet, so tokens that straddle
+    a chunk boundary are never split.
     
-    uri_str = str(focus_node_uri)
+    Yields:
+        (kind, text) tuples, where kind is the name of the matching token group
+    """
+    buf = ''
+    pos = 0
+    eof = False
+    while True:
+        match = _TURTLE_TOKEN_RE.match(buf, pos)
+        needs_input = (
+            match is None
+            or match.end() == len(buf)
+            or len(buf) - pos < _TOKEN_LOOKAHEAD
+            or (match.lastgroup != 'long_string' and buf.startswith(('"""', "'''"), pos))
+        )
+        if needs_input and not eof:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                eof = True
+            buf = buf[pos:] + chunk
+            pos = 0
+            continue
+        if match is None:
+            if pos >= len(buf):
+                return
+            raise ReportSyntaxError(f"Unexpected input near: {buf[pos:pos + 40]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind != 'ws':
+            yield kind, match.group()
+
+class _TurtleEventReader:
+    """
+    Minimal streaming Turtle reader for SHACL validation reports.
+    Produces ('triple', s, p, o) events as statements are read, and a
+    ('close', s) event once the description of a subject can no longer grow
+    (at the closing ']' of a blank node, or the '.' ending a statement).
+    All terms are returned as plain strings: expanded IRIs, literal lexical
+    forms and blank node labels.
+    """
+
+    def __init__(self, stream, chunk_size=STREAM_CHUNK_SIZE):
+        self._tokens = _iter_turtle_tokens(stream, chunk_size)
+        self._lookahead = None
+        self._prefixes = {}
+        self._base = ''
+        self._bnode_count = 0
+
+    def _peek(self):
+        if self._lookahead is None:
+            self._lookahead = next(self._tokens, (None, None))
+        return self._lookahead
+
+    def _next(self):
+        token = self._peek()
+        self._lookahead = None
+        return token
+
+    def _expect(self, text):
+        kind, value = self._next()
+        if value != text:
+            raise ReportSyntaxError(f"Expected '{text}' but found {value!r}")
+
+    def _new_bnode(self):
+        self._bnode_count += 1
+        return f"stream-b{self._bnode_count}"
+
+    def _iri(self, kind, value):
+        if kind == 'iri':
+            iri = _unescape(value[1:-1])
+            if self._base and ':' not in iri:
+                iri = self._base + iri
+            return iri
+        if kind == 'pname':
+            prefix, _, local = value.partition(':')
+            if prefix not in self._prefixes:
+                raise ReportSyntaxError(f"Undefined prefix: {prefix!r}")
+            if '\\' in local:
+                local = _PNAME_ESCAPE_RE.sub(r'\1', local)
+            return self._prefixes[prefix] + local
+        return None
+
+    def events(self):
+        """Yield triple and close events for the whole document."""
+        while True:
+            kind, value = self._peek()
+            if kind is None:
+                return
+            if kind == 'at' or (kind == 'keyword' and value.upper() in ('PREFIX', 'BASE')):
+                self._directive()
+                continue
+            subject, events = self._subject()
+            yield from events
+            if self._peek()[1] != '.':
+                yield from self._predicate_object_list(subject)
+            self._expect('.')
+            yield ('close', subject)
+
+    def _directive(self):
+        kind, value = self._next()
+        sparql_style = kind == 'keyword'
+        name = value.lstrip('@').lower()
+        if name == 'prefix':
+            prefix_kind, prefix = self._next()
+            if prefix_kind != 'pname' or not prefix.endswith(':'):
+                raise ReportSyntaxError(f"Invalid prefix declaration: {prefix!r}")
+            iri_kind, iri = self._next()
+            self._prefixes[prefix[:-1]] = self._iri(iri_kind, iri)
+        elif name == 'base':
+            iri_kind, iri = self._next()
+            self._base = self._iri(iri_kind, iri)
+        else:
+            raise ReportSyntaxError(f"Unknown directive: {value!r}")
+        if not sparql_style:
+            self._expect('.')
+
+    def _subject(self):
+        """Read a statement subject; returns (term, events produced while reading it)."""
+        kind, value = self._next()
+        if kind in ('iri', 'pname'):
+            return self._iri(kind, value), ()
+        if kind == 'bnode':
+            return value[2:], ()
+        if value == '[':
+            node = self._new_bnode()
+            return node, self._blank_node_property_list(node, nested=False)
+        if value == '(':
+            node, events = self._collection()
+            return node, list(events)
+        raise ReportSyntaxError(f"Unexpected subject: {value!r}")
+
+    def _blank_node_property_list(self, node, nested=True):
+        if self._peek()[1] != ']':
+            yield from self._predicate_object_list(node)
+        self._expect(']')
+        if nested:
+            yield ('close', node)
+
+    def _predicate_object_list(self, subject):
+        while True:
+            kind, value = self._next()
+            if kind == 'keyword' and value == 'a':
+                predicate = RDF_TYPE
+            else:
+                predicate = self._iri(kind, value)
+                if predicate is None:
+                    raise ReportSyntaxError(f"Unexpected predicate: {value!r}")
+            while True:
+                obj, events = self._object()
+                yield from events
+                yield ('triple', subject, predicate, obj)
+                if self._peek()[1] != ',':
+                    break
+                self._next()
+            # Consume ';' separators (repeated ones are allowed)
+            if self._peek()[1] != ';':
+                return
+            while self._peek()[1] == ';':
+                self._next()
+            if self._peek()[1] in ('.', ']'):
+                return
+
+    def _object(self):
+        """Read an object term; returns (term, events produced while reading it)."""
+        kind, value = self._next()
+        if kind in ('iri', 'pname'):
+            return self._iri(kind, value), ()
+        if kind == 'bnode':
+            return value[2:], ()
+        if kind in ('string', 'long_string'):
+            quote = 3 if kind == 'long_string' else 1
+            lexical = _unescape(value[quote:-quote])
+            next_kind, next_value = self._peek()
+            if next_kind == 'at':
+                self._next()
+            elif next_kind == 'datatype':
+                self._next()
+                self._iri(*self._next())
+            return lexical, ()
+        if kind == 'number' or (kind == 'keyword' and value in ('true', 'false')):
+            return value, ()
+        if value == '[':
+            node = self._new_bnode()
+            return node, self._blank_node_property_list(node)
+        if value == '(':
+            return self._collection()
+        raise ReportSyntaxError(f"Unexpected object: {value!r}")
+
+    def _collection(self):
+        events = []
+        head = RDF_NIL
+        previous = None
+        while self._peek()[1] != ')':
+            obj, obj_events = self._object()
+            events.extend(obj_events)
+            node = self._new_bnode()
+            if previous is None:
+                head = node
+            else:
+                events.append(('triple', previous, RDF_REST, node))
+            events.append(('triple', node, RDF_FIRST, obj))
+            previous = node
+        self._expect(')')
+        if previous is not None:
+            events.append(('triple', previous, RDF_REST, RDF_NIL))
+        return head, events
+
+def _nt_term(term):
+    """Convert an N-Triples term to the plain string used for violation fields."""
+    if term.startswith('<'):
+        return _unescape(term[1:-1])
+    if term.startswith('_:'):
+        return term[2:]
+    return _unescape(term[1:term.rindex('"')])
+
+def _iter_ntriples_events(stream):
+    """
+    Read an N-Triples document line by line.
+    Emits a ('close', s) event whenever the subject changes, since Jena writes
+    all triples of a validation result next to each other. Documents that are
+    not grouped by subject are rejected by _assemble_violations.
+    """
+    current_subject = None
+    for line_number, line in enumerate(stream, 1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        match = _NT_LINE_RE.match(line)
+        if match is None:
+            raise ReportSyntaxError(f"Invalid N-Triples line {line_number}: {stripped[:80]!r}")
+        subject = _nt_term(match.group(1))
+        if subject != current_subject:
+            if current_subject is not None:
+                yield ('close', current_subject)
+            current_subject = subject
+        yield ('triple', subject, _unescape(match.group(2)), _nt_term(match.group(3)))
+    if current_subject is not None:
+        yield ('close', current_subject)
+
+def detect_report_format(file_path):
+    """Return 'nt' for N-Triples reports (by extension) and 'turtle' otherwise."""
+    return 'nt' if file_path.lower().endswith('.nt') else 'turtle'
+
+def _build_violation(fields):
+    """Build a violation dictionary with the same keys as parse_validation_report."""
+    return {key: fields.get(key) for key in RESULT_FIELDS.values()}
+
+def iter_validation_results(file_path, report_format=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Stream violations from a SHACL validation report without loading it into a graph.
     
-    # Common codelist domain patterns
-    codelist_patterns = [
-        'codelist.commonapproach.org',
-        'metadata.un.org',  # SDG metadata
-        # Add other codelist domains as needed
-    ]
+    The report is read chunk by chunk as N-Triples or Turtle. Result fields are
+    collected per subject as triples arrive, and each sh:ValidationResult is
+    yielded as soon as its description is complete, so only the results that
+    are still open are kept in memory.
     
-    for pattern in codelist_patterns:
-        if pattern in uri_str:
-            return True
+    Args:
+        file_path: Path to the validation report
+        report_format: 'nt' or 'turtle' (default: detected from the file extension)
+        chunk_size: Number of characters to read at a time for Turtle input
+        
+    Yields:
+        Violation dictionaries with the same keys as parse_validation_report
+        
+    Raises:
+        ReportSyntaxError: If the report uses syntax the streaming reader does not
+            support, or the triples of a result are not next to each other
+    """
+    if report_format is None:
+        report_format = detect_report_format(file_path)
     
-    return False
+    with open(file_path, 'r', encoding='utf-8') as stream:
+        if report_format == 'nt':
+            events = _iter_ntriples_events(stream)
+        else:
+            events = _TurtleEventReader(stream, chunk_size).events()
+        yield from _assemble_violations(events)
 
-def parse_validation_report(file_path):
-    """Parse the SHACL validation report and extract all violations."""
+def _assemble_violations(events, closed=None):
+    """
+    Assemble violation dictionaries from ('triple', s, p, o) / ('close', s) events.
+    Fields are collected per subject and a violation is yielded when the
+    subject of a sh:ValidationResult is closed.
+    
+    The triples of a result must arrive together. A result split into several
+    parts is detected without remembering every result: the parts without the
+    rdf:type triple have result fields but no type when they are closed, and
+    a subject that reappears shortly after it was closed is caught by a
+    window of the last CLOSED_SUBJECT_WINDOW closed subjects.
+    
+    Args:
+        events: Iterable of events (see _iter_ntriples_events)
+        closed: Set filled with all subjects whose result fields were consumed,
+            and checked like the window (optional; used by group_report_sharded)
+    
+    Raises:
+        ReportSyntaxError: If the triples of a result are not next to each other
+            (N-Triples not grouped by subject, or a result split over several
+            Turtle statements)
+    """
+    validation_result = SH_VALIDATION_RESULT
+    pending = {}
+    # Subjects whose result fields were consumed most recently
+    recent = deque()
+    recent_set = set()
+    
+    for event in events:
+        if event[0] == 'close':
+            subject = event[1]
+            fields = pending.pop(subject, None)
+            if fields is None:
+                continue
+            if not fields.get(RDF_TYPE):
+                raise ReportSyntaxError(f"Result {subject!r} is incomplete (its triples are not grouped together)")
+            if closed is not None:
+                closed.add(subject)
+            recent.append(subject)
+            recent_set.add(subject)
+            if len(recent) > CLOSED_SUBJECT_WINDOW:
+                recent_set.discard(recent.popleft())
+            yield _build_violation(fields)
+            continue
+        
+        _, subject, predicate, obj = event
+        field = RESULT_FIELDS.get(predicate)
+        if field is None:
+            if predicate != RDF_TYPE or obj != validation_result:
+                continue
+            field = RDF_TYPE
+        fields = pending.get(subject)
+        if fields is None:
+            if subject in recent_set or (closed is not None and subject in closed):
+                raise ReportSyntaxError(f"Triples of result {subject!r} are not grouped together")
+            fields = pending[subject] = {}
+        # Keep the first value seen, like the graph-based parser
+        fields.setdefault(field, obj)
+    
+    # Results whose subject was never closed (e.g. truncated report)
+    for fields in pending.values():
+        if fields.get(RDF_TYPE):
+            yield _build_violation(fields)
+
+def extract_result_fields(g):
+    """
+    Collect the fields of every sh:ValidationResult in a graph in a single pass.
+    
+    Every triple of the graph is visited once and dispatched on its predicate
+    into a per-subject field dictionary, instead of probing the graph once per
+    field for every result. The first object seen for a field wins.
+    
+    Args:
+        g: rdflib Graph containing a SHACL validation report
+        
+    Returns:
+        List of dictionaries (one per sh:ValidationResult) mapping violation keys
+        (see RESULT_FIELDS) to rdflib terms; missing fields are absent
+    """
+    from rdflib import URIRef
+    
+    field_keys = {URIRef(predicate): key for predicate, key in RESULT_FIELDS.items()}
+    rdf_type = URIRef(RDF_TYPE)
+    validation_result = URIRef(SH_VALIDATION_RESULT)
+    
+    by_subject = {}
+    results = []
+    for subject, predicate, obj in g.triples((None, None, None)):
+        key = field_keys.get(predicate)
+        if key is None:
+            if predicate == rdf_type and obj == validation_result:
+                results.append(subject)
+            continue
+        fields = by_subject.get(subject)
+        if fields is None:
+            fields = by_subject[subject] = {}
+        fields.setdefault(key, obj)
+    
+    return [by_subject.get(result, {}) for result in results]
+
+class StringPool:
+    """
+    Interns strings as small integer IDs so each distinct focus node, message,
+    path, etc. is stored once. ID 0 is reserved for None (missing values).
+    """
+
+    def __init__(self):
+        self.strings = [None]
+        self._ids = {}
+
+    def intern(self, value):
+        """Return the ID of a string, adding it to the pool if needed."""
+        if value is None:
+            return 0
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(value)
+            self._ids[value] = string_id
+        return string_id
+
+    def __getitem__(self, string_id):
+        return self.strings[string_id]
+
+    def __len__(self):
+        return len(self.strings)
+
+class ViolationStore:
+    """
+    Compact columnar store for the violations of a report.
+    Each violation field (see RESULT_FIELDS) is one typed array of string IDs
+    from a shared StringPool, i.e. 4 bytes per field per violation instead of
+    a dictionary per violation. Iterating the store yields violation
+    dictionaries, so it can be used wherever a list of violations was expected.
+    """
+
+    FIELDS = tuple(RESULT_FIELDS.values())
+
+    def __init__(self, pool=None):
+        self.pool = pool if pool is not None else StringPool()
+        self.columns = {field: array('I') for field in self.FIELDS}
+        # Violations on codelist focus nodes dropped while parsing (see CodelistFilter)
+        self.excluded_codelist_count = 0
+
+    @classmethod
+    def from_violations(cls, violations):
+        """Build a store from an iterable of violation dictionaries."""
+        store = cls()
+        store.extend(violations)
+        return store
+
+    def append(self, violation):
+        """Add one violation dictionary (missing keys are stored as None)."""
+        intern = self.pool.intern
+        for field, column in self.columns.items():
+            column.append(intern(violation.get(field)))
+
+    def extend(self, violations):
+        for violation in violations:
+            self.append(violation)
+
+    def __len__(self):
+        return len(self.columns[self.FIELDS[0]])
+
+    def rows(self):
+        """Yield one tuple of string IDs per violation, in FIELDS order."""
+        return zip(*(self.columns[field] for field in self.FIELDS))
+
+    def __iter__(self):
+        strings = self.pool.strings
+        for row in self.rows():
+            yield {field: strings[string_id] for field, string_id in zip(self.FIELDS, row)}
+
+    def save(self, file_path):
+        """Write the store to a binary file (written atomically via a temporary file)."""
+        payload = {
+            'version': PARSED_CACHE_VERSION,
+            'strings': self.pool.strings,
+            'columns': {field: column.tobytes() for field, column in self.columns.items()},
+            'excluded_codelist_count': self.excluded_codelist_count,
+        }
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, file_path)
+
+    @classmethod
+    def load(cls, file_path):
+        """Read a store written by save(); raises ValueError if the format is outdated."""
+        with open(file_path, 'rb') as f:
+            payload = pickle.load(f)
+        if payload.get('version') != PARSED_CACHE_VERSION:
+            raise ValueError(f"Unsupported parsed report cache version: {payload.get('version')}")
+        store = cls()
+        store.pool.strings = payload['strings']
+        store.pool._ids = {value: string_id for string_id, value in enumerate(payload['strings']) if string_id}
+        for field in cls.FIELDS:
+            store.columns[field].frombytes(payload['columns'][field])
+        store.excluded_codelist_count = payload['excluded_codelist_count']
+        return store
+
+def parse_validation_report(file_path, profiler=NULL_PROFILER, codelist_filter=None):
+    """
+    Parse the SHACL validation report and extract all violations.
+    
+    Args:
+        file_path: Path to the validation report
+        profiler: StageProfiler recording the 'parse' and 'extract' stages (optional)
+        codelist_filter: CodelistFilter dropping codelist violations during extraction (optional)
+    
+    Returns:
+        ViolationStore holding one entry per sh:ValidationResult
+    """
+    # rdflib is slow to import, so it is only loaded when a report is parsed with it
+    from rdflib import Graph
+    
     g = Graph()
     
-    # Suppress rdflib warnings and error messages about invalid literals
-    # These are printed to stderr but don't stop parsing
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore")
-        # Redirect stderr temporarily to suppress rdflib's error tracebacks
-        # Save original stderr
-        original_stderr = sys.stderr
+    with profiler.stage('parse') as stage:
+        # Suppress rdflib warnings and error messages about invalid literals
+        # These are printed to stderr but don't stop parsing
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            # Redirect stderr temporarily to suppress rdflib's error tracebacks
+            # Save original stderr
+            original_stderr = sys.stderr
+            try:
+                # Redirect stderr to devnull to suppress rdflib's ValueError tracebacks
+                with open(os.devnull, 'w') as devnull:
+                    sys.stderr = devnull
+                    try:
+                        g.parse(file_path, format="turtle")
+                    except Exception as e:
+                        # Restore stderr before printing our error
+                        sys.stderr = original_stderr
+                        print(f"Warning: Error parsing RDF file: {e}", file=sys.stderr)
+                        print("Attempting to continue with partial parse...", file=sys.stderr)
+                        # Try to continue - rdflib may have parsed some triples before the error
+                    finally:
+                        # Always restore stderr
+                        sys.stderr = original_stderr
+            except Exception as e:
+                # Restore stderr in case of outer exception
+                sys.stderr = original_stderr
+                print(f"Warning: Error parsing RDF file: {e}", file=sys.stderr)
+        
+        stage['items'] = len(g)
+    
+    violations = ViolationStore()
+    
+    with profiler.stage('extract') as stage:
         try:
-            # Redirect stderr to devnull to suppress rdflib's ValueError tracebacks
-            with open(os.devnull, 'w') as devnull:
-                sys.stderr = devnull
+            result_fields = extract_result_fields(g)
+        except Exception as e:
+            print(f"Error: Failed to extract violations from validation report: {e}", file=sys.stderr)
+            print("Returning empty violations list.", file=sys.stderr)
+            return violations
+        
+        for fields in result_fields:
+            if codelist_filter is not None:
+                focus_node = fields.get('focusNode')
+                if codelist_filter.is_codelist(str(focus_node) if focus_node is not None else None):
+                    codelist_filter.excluded += 1
+                    continue
+            violation = {}
+            for key in RESULT_FIELDS.values():
+                term = fields.get(key)
                 try:
-                    g.parse(file_path, format="turtle")
+                    violation[key] = str(term) if term is not None else None
+                except (ValueError, TypeError) as e:
+                    if key == 'value':
+                        # Invalid literal (e.g., empty string with xsd:dateTime type)
+                        violation[key] = f"<invalid_literal: {type(term).__name__}>"
+                    else:
+                        violation[key] = None
+                        print(f"Warning: Error extracting {key}: {e}", file=sys.stderr)
                 except Exception as e:
-                    # Restore stderr before printing our error
-                    sys.stderr = original_stderr
-                    print(f"Warning: Error parsing RDF file: {e}", file=sys.stderr)
-                    print("Attempting to continue with partial parse...", file=sys.stderr)
-                    # Try to continue - rdflib may have parsed some triples before the error
-                finally:
-                    # Always restore stderr
-                    sys.stderr = original_stderr
-        except Exception as e:
-            # Restore stderr in case of outer exception
-            sys.stderr = original_stderr
-            print(f"Warning: Error parsing RDF file: {e}", file=sys.stderr)
-    
-    violations = []
+                    violation[key] = None
+                    print(f"Warning: Error extracting {key}: {e}", file=sys.stderr)
+            violations.append(violation)
+        
+        if codelist_filter is not None:
+            violations.excluded_codelist_count = codelist_filter.excluded
+        stage['items'] = len(violations)
     
-    # Find all ValidationResult instances
-    try:
-        for result in g.subjects(RDF.type, SH.ValidationResult):
-            violation = {}
-            
-            try:
-                # Extract focusNode
-                focus_nodes = list(g.objects(result, SH.focusNode))
-                violation['focusNode'] = str(focus_nodes[0]) if focus_nodes else None
-            except Exception as e:
-                violation['focusNode'] = None
-                print(f"Warning: Error extracting focusNode: {e}", file=sys.stderr)
-            
-            try:
-                # Extract resultMessage
-                messages = list(g.objects(result, SH.resultMessage))
-                violation['resultMessage'] = str(messages[0]) if messages else None
-            except Exception as e:
-                violation['resultMessage'] = None
-                print(f"Warning: Error extracting resultMessage: {e}", file=sys.stderr)
-            
-            try:
-                # Extract resultPath
-                paths = list(g.objects(result, SH.resultPath))
-                violation['resultPath'] = str(paths[0]) if paths else None
-            except Exception as e:
-                violation['resultPath'] = None
-                print(f"Warning: Error extracting resultPath: {e}", file=sys.stderr)
-            
-            try:
-                # Extract sourceShape
-                shapes = list(g.objects(result, SH.sourceShape))
-                violation['sourceShape'] = str(shapes[0]) if shapes else None
-            except Exception as e:
-                violation['sourceShape'] = None
-                print(f"Warning: Error extracting sourceShape: {e}", file=sys.stderr)
-            
-            try:
-                # Extract sourceConstraintComponent
-                components = list(g.objects(result, SH.sourceConstraintComponent))
-                violation['constraintComponent'] = str(components[0]) if components else None
-            except Exception as e:
-                violation['constraintComponent'] = None
-                print(f"Warning: Error extracting constraintComponent: {e}", file=sys.stderr)
-            
+    return violations
+
+def report_content_hash(file_path):
+    """Return the SHA-256 hex digest of a report file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _evict_parsed_cache(cache_dir, max_bytes):
+    """Delete the least recently used cache entries until the cache fits in max_bytes."""
+    entries = []
+    total = 0
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith('.pickle'):
             try:
-                # Extract resultSeverity
-                severities = list(g.objects(result, SH.resultSeverity))
-                violation['severity'] = str(severities[0]) if severities else None
-            except Exception as e:
-                violation['severity'] = None
-                print(f"Warning: Error extracting severity: {e}", file=sys.stderr)
-            
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+def _parse_native(input_file, profiler, codelist_filter=None):
+    """Parse a report with the native streaming reader (see iter_validation_results)."""
+    print(f"Streaming validation report: {input_file}")
+    # Streaming parses and extracts in a single pass
+    with profiler.stage('parse+extract') as stage:
+        results = iter_validation_results(input_file)
+        if codelist_filter is not None:
+            results = codelist_filter.filter(results)
+        violations = ViolationStore.from_violations(results)
+        if codelist_filter is not None:
+            violations.excluded_codelist_count = codelist_filter.excluded
+        stage['items'] = len(violations)
+    return violations
+
+def load_violations(input_file, parser='auto', cache_dir=None, cache_max_bytes=PARSED_CACHE_MAX_BYTES,
+                    profiler=NULL_PROFILER, codelist_filter=None):
+    """
+    Load the violations of a report, going through the parsed-report cache if enabled.
+    
+    Cache entries are keyed by the SHA-256 of the report contents (and the parser
+    and codelist filter used), so an unchanged report is loaded from the binary cache instead of
+    being parsed again. Entries are evicted least-recently-used first once the
+    cache grows beyond cache_max_bytes.
+    
+    Args:
+        input_file: Path to the validation report
+        parser: Report parser:
+            'auto': the native streaming reader (iter_validation_results), falling
+                back to rdflib if the report uses syntax it does not support or
+                the triples of a result are not next to each other
+            'native': the native streaming reader only
+            'rdflib': parse_validation_report (rdflib graph)
+        cache_dir: Cache directory, or None to bypass the cache
+        cache_max_bytes: Maximum total size of the cache directory
+        profiler: StageProfiler (optional)
+        codelist_filter: CodelistFilter applied while parsing, or None to keep codelist
+            violations; excluded violations are only counted (see ViolationStore)
+        
+    Returns:
+        ViolationStore
+    """
+    cache_file = None
+    if cache_dir:
+        digest = report_content_hash(input_file)
+        if codelist_filter is not None:
+            digest += f"-cl{codelist_filter.cache_key()}"
+        # In auto mode, a 'graph' entry means the native reader failed on this report before
+        modes = {'auto': ('stream', 'graph'), 'native': ('stream',), 'rdflib': ('graph',)}[parser]
+        for mode in modes:
+            cache_file = os.path.join(cache_dir, f"{digest}-{mode}.pickle")
             try:
-                # Extract value (if present) - this is where invalid literals often cause issues
-                values = list(g.objects(result, SH.value))
-                if values:
-                    # Try to convert to string, but handle errors gracefully
-                    try:
-                        violation['value'] = str(values[0])
-                    except (ValueError, TypeError) as e:
-                        # Invalid literal (e.g., empty string with xsd:dateTime type)
-                        violation['value'] = f"<invalid_literal: {type(values[0]).__name__}>"
-                else:
-                    violation['value'] = None
+                with profiler.stage('load-cache') as stage:
+                    violations = ViolationStore.load(cache_file)
+                    stage['items'] = len(violations)
+            except FileNotFoundError:
+                continue
             except Exception as e:
-                violation['value'] = None
-                print(f"Warning: Error extracting value: {e}", file=sys.stderr)
-            
-            violations.append(violation)
-    except Exception as e:
-        print(f"Error: Failed to extract violations from validation report: {e}", file=sys.stderr)
-        print("Returning empty violations list.", file=sys.stderr)
+                print(f"Warning: Ignoring unreadable parsed report cache entry '{cache_file}': {e}", file=sys.stderr)
+                continue
+            # Mark the entry as recently used for eviction
+            os.utime(cache_file)
+            print(f"Loaded {len(violations)} violations from cache: {input_file}")
+            return violations
+    
+    mode = 'graph'
+    if parser == 'rdflib':
+        print(f"Parsing validation report: {input_file}")
+        violations = parse_validation_report(input_file, profiler, codelist_filter)
+    elif parser == 'native':
+        violations = _parse_native(input_file, profiler, codelist_filter)
+        mode = 'stream'
+    else:
+        try:
+            violations = _parse_native(input_file, profiler, codelist_filter)
+            mode = 'stream'
+        except (ReportSyntaxError, UnicodeDecodeError) as e:
+            print(f"Warning: Native reader cannot parse '{input_file}' ({e}); falling back to rdflib",
+                  file=sys.stderr)
+            if codelist_filter is not None:
+                codelist_filter.excluded = 0
+            violations = parse_validation_report(input_file, profiler, codelist_filter)
+    print(f"Found {len(violations) + violations.excluded_codelist_count} violations")
     
+    if cache_dir:
+        cache_file = os.path.join(cache_dir, f"{digest}-{mode}.pickle")
+        try:
+            with profiler.stage('save-cache'):
+                os.makedirs(cache_dir, exist_ok=True)
+                violations.save(cache_file)
+                _evict_parsed_cache(cache_dir, cache_max_bytes)
+        except OSError as e:
+            print(f"Warning: Failed to write parsed report cache: {e}", file=sys.stderr)
     return violations
 
-def generate_summary(violations, output_file, include_codelist_violations=False, command=None, node_type_counts=None):
-    """Generate and write the summary report.
+class _BoundedNode:
+    """Focus node kept by a BoundedGroup: its exact violation count and its smallest values."""
+    __slots__ = ('violations', 'value_counts', 'sorted_values', 'hidden_values', 'values_truncated')
+
+    def __init__(self):
+        self.violations = 0
+        self.value_counts = {}
+        self.sorted_values = []
+        self.hidden_values = 0
+        self.values_truncated = False
+
+    def add_value(self, value, occurrences, max_values):
+        """Count occurrences of a value, keeping only the max_values smallest distinct values."""
+        if value in self.value_counts:
+            self.value_counts[value] += occurrences
+            return
+        if len(self.sorted_values) >= max_values:
+            self.values_truncated = True
+            if value > self.sorted_values[-1]:
+                self.hidden_values += occurrences
+                return
+            evicted = self.sorted_values.pop()
+            self.hidden_values += self.value_counts.pop(evicted)
+        insort(self.sorted_values, value)
+        self.value_counts[value] = occurrences
+
+class BoundedGroup:
+    """
+    Group of violations for the bounded summary mode (see generate_summary).
     
-    Args:
-        violations: List of violation dictionaries
-        output_file: Path to output file
-        include_codelist_violations: If True, include violations from codelists; if False, exclude them (default)
-        command: Original command line string (optional)
-        node_type_counts: Dictionary of node type counts from source data file (optional)
+    Counts are exact, but only the max_nodes lexicographically smallest focus
+    nodes, and for each of them the max_nodes smallest values, are kept. The
+    listing is therefore a prefix of the full one, memory per group is
+    bounded, and the violations on focus nodes that are not kept are counted
+    for the "more not shown" marker. Because the kept set only ever moves
+    towards smaller nodes, the counts of kept nodes and values are exact, and
+    partial groups (e.g. from shards) can be merged without losing exactness.
     """
+
+    def __init__(self, max_nodes):
+        self.max_nodes = max_nodes
+        self.count = 0
+        self.severities = set()
+        self.nodes = {}
+        self.sorted_nodes = []
+        # Violations on focus nodes that are not kept
+        self.hidden_violations = 0
+        self.nodes_truncated = False
+
+    def _node(self, focus_node, violations):
+        """Return the entry of a focus node, or None if the node is not kept."""
+        node = self.nodes.get(focus_node)
+        if node is not None:
+            return node
+        if len(self.sorted_nodes) >= self.max_nodes:
+            self.nodes_truncated = True
+            if focus_node > self.sorted_nodes[-1]:
+                self.hidden_violations += violations
+                return None
+            evicted = self.sorted_nodes.pop()
+            self.hidden_violations += self.nodes.pop(evicted).violations
+        insort(self.sorted_nodes, focus_node)
+        node = self.nodes[focus_node] = _BoundedNode()
+        return node
+
+    def add(self, focus_node, value, severity):
+        """Add one violation (given as strings)."""
+        self.count += 1
+        if severity is not None:
+            self.severities.add(severity)
+        if focus_node is None:
+            return
+        node = self._node(focus_node, 1)
+        if node is None:
+            return
+        node.violations += 1
+        if value is not None:
+            node.add_value(value, 1, self.max_nodes)
+
+    def merge(self, other):
+        """Add the counts and kept nodes of another BoundedGroup with the same limit."""
+        self.count += other.count
+        self.severities.update(other.severities)
+        self.hidden_violations += other.hidden_violations
+        self.nodes_truncated = self.nodes_truncated or other.nodes_truncated
+        for focus_node in other.sorted_nodes:
+            other_node = other.nodes[focus_node]
+            node = self._node(focus_node, other_node.violations)
+            if node is None:
+                continue
+            node.violations += other_node.violations
+            for value in other_node.sorted_values:
+                node.add_value(value, other_node.value_counts[value], self.max_nodes)
+            node.hidden_values += other_node.hidden_values
+            node.values_truncated = node.values_truncated or other_node.values_truncated
+
+class ViolationGroups:
+    """
+    Grouped violations and counters written by generate_summary.
+    Groups are keyed by (resultPath ID, normalized message, node type); each
+    group holds typed arrays of focus node, value and severity string IDs from
+    the shared StringPool, plus the set of full message IDs. With max_nodes
+    set (bounded mode), each group is a BoundedGroup instead.
+    """
+
+    def __init__(self, pool, max_nodes=None):
+        self.pool = pool
+        self.max_nodes = max_nodes
+        self.groups = {}
+        # Constraint component type of each normalized message
+        self.constraint_types = {}
+        # Count by constraint component (total)
+        self.component_counts = Counter()
+        # Count by (constraint component, property) (for subtotals)
+        self.component_counts_by_property = Counter()
+        self.total_violations = 0
+        self.codelist_violations_count = 0
+
+    def add(self, path_id, normalized_message, node_type, focus_id, value_id, severity_id, message_id):
+        """Add one violation (given as string IDs) to its group."""
+        key = (path_id, normalized_message, node_type)
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = (array('I'), array('I'), array('I'), set())
+        group[0].append(focus_id)
+        group[1].append(value_id)
+        group[2].append(severity_id)
+        group[3].add(message_id)
+
+    def add_bounded(self, path_id, normalized_message, node_type, focus_node, value, severity):
+        """Add one violation (focus node, value and severity given as strings) to its BoundedGroup."""
+        key = (path_id, normalized_message, node_type)
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = BoundedGroup(self.max_nodes)
+        group.add(focus_node, value, severity)
+
+    def merge(self, other):
+        """
+        Add the groups and counters of another ViolationGroups (e.g. from another
+        shard of the same report). String IDs of the other pool are re-interned.
+        """
+        remap = [self.pool.intern(value) for value in other.pool.strings]
+        for (path_id, normalized_message, node_type), group in other.groups.items():
+            key = (remap[path_id], normalized_message, node_type)
+            target = self.groups.get(key)
+            if isinstance(group, BoundedGroup):
+                if target is None:
+                    target = self.groups[key] = BoundedGroup(self.max_nodes)
+                target.merge(group)
+                continue
+            if target is None:
+                target = self.groups[key] = (array('I'), array('I'), array('I'), set())
+            for target_ids, ids in zip(target[:3], group[:3]):
+                target_ids.extend(remap[string_id] for string_id in ids)
+            target[3].update(remap[string_id] for string_id in group[3])
+        for normalized_message, constraint_type in other.constraint_types.items():
+            self.constraint_types.setdefault(normalized_message, constraint_type)
+        self.component_counts.update(other.component_counts)
+        self.component_counts_by_property.update(other.component_counts_by_property)
+        self.total_violations += other.total_violations
+        self.codelist_violations_count += other.codelist_violations_count
+
+    def nested(self):
+        """Return the groups as {resultPath: {normalized message: {node type: group}}}."""
+        strings = self.pool.strings
+        nested = defaultdict(lambda: defaultdict(dict))
+        for (path_id, normalized_message, node_type), group in self.groups.items():
+            nested[strings[path_id]][normalized_message][node_type] = group
+        return nested
+
+def group_violations(violations, include_codelist_violations=False, max_nodes=None, codelist_domains=CODELIST_DOMAINS):
+    """
+    Filter and group violations for the summary.
     
-    # Filter out violations that belong to imported codelists (unless flag is set)
-    filtered_violations = []
-    codelist_violations_count = 0
+    Works directly on the columns of a ViolationStore: each distinct focus node,
+    message, path, shape and value is classified once per string ID rather than
+    once per violation.
     
-    for v in violations:
-        focus_node = v.get('focusNode')
-        is_codelist = is_codelist_node(focus_node)
+    Args:
+        violations: ViolationStore, or an iterable of violation dictionaries
+        include_codelist_violations: If True, keep violations from codelists
+        max_nodes: If set, keep at most this many focus nodes (and values per
+            focus node) per group (see BoundedGroup)
+        codelist_domains: Domains of imported codelists (see compile_codelist_matcher)
         
+    Returns:
+        ViolationGroups
+    """
+    if max_nodes is not None:
+        return _group_violations_bounded(violations, include_codelist_violations, max_nodes, codelist_domains)
+    
+    if not isinstance(violations, ViolationStore):
+        if include_codelist_violations:
+            violations = ViolationStore.from_violations(violations)
+        else:
+            # Drop codelist violations before they are stored
+            codelist_filter = CodelistFilter(codelist_domains)
+            violations = ViolationStore.from_violations(codelist_filter.filter(violations))
+            violations.excluded_codelist_count = codelist_filter.excluded
+    elif include_codelist_violations and violations.excluded_codelist_count:
+        print(f"Warning: {violations.excluded_codelist_count} codelist violation(s) were excluded while parsing "
+              f"and cannot be included", file=sys.stderr)
+    
+    pool = violations.pool
+    strings = pool.strings
+    groups = ViolationGroups(pool)
+    groups.codelist_violations_count = violations.excluded_codelist_count
+    codelist_match = compile_codelist_matcher(tuple(codelist_domains))
+    
+    # Per-ID classification results
+    codelist_ids = {}
+    message_info = {}
+    node_types = {}
+    property_names = {}
+    normalized_value_ids = {}
+    
+    columns = violations.columns
+    for focus_id, message_id, path_id, shape_id, severity_id, value_id in zip(
+            columns['focusNode'], columns['resultMessage'], columns['resultPath'],
+            columns['sourceShape'], columns['severity'], columns['value']):
+        # Filter out violations that belong to imported codelists (unless flag is set)
+        is_codelist = codelist_ids.get(focus_id)
+        if is_codelist is None:
+            focus_node = strings[focus_id]
+            is_codelist = codelist_ids[focus_id] = bool(focus_node) and codelist_match(focus_node) is not None
         if is_codelist:
-            codelist_violations_count += 1
+            groups.codelist_violations_count += 1
             if not include_codelist_violations:
                 continue  # Skip codelist violations when excluding them
-        filtered_violations.append(v)
+        groups.total_violations += 1
+        
+        info = message_info.get(message_id)
+        if info is None:
+            info = message_info[message_id] = classify_message(strings[message_id])
+            groups.constraint_types.setdefault(info[1], info[0])
+        constraint_type, normalized_message = info
+        
+        node_type = node_types.get(shape_id)
+        if node_type is None:
+            node_type = node_types[shape_id] = extract_node_type(strings[shape_id])
+        
+        # Normalize value to replace file:// URIs
+        normalized_value_id = normalized_value_ids.get(value_id)
+        if normalized_value_id is None:
+            normalized_value_id = normalized_value_ids[value_id] = pool.intern(normalize_value(strings[value_id]))
+        
+        # Group by normalized message, but store full message for reference
+        groups.add(path_id, normalized_message, node_type, focus_id, normalized_value_id, severity_id, message_id)
+        
+        property_name = property_names.get(path_id)
+        if property_name is None:
+            property_name = property_names[path_id] = extract_property_name(strings[path_id])
+        
+        groups.component_counts[constraint_type] += 1
+        groups.component_counts_by_property[(constraint_type, property_name)] += 1
+    
+    return groups
+
+def _group_violations_bounded(violations, include_codelist_violations, max_nodes, codelist_domains):
+    """
+    Bounded variant of group_violations. A ViolationStore is read column by column,
+    classifying each string ID once as group_violations does; any other iterable is
+    consumed one violation at a time (see group_report_streaming), so memory grows
+    with the number of groups rather than the number of violations.
+    """
+    codelist_match = compile_codelist_matcher(tuple(codelist_domains))
+    if not isinstance(violations, ViolationStore):
+        groups = ViolationGroups(StringPool(), max_nodes)
+        pool = groups.pool
+        for violation in violations:
+            focus_node = violation.get('focusNode')
+            # Filter out violations that belong to imported codelists (unless flag is set)
+            if focus_node and codelist_match(focus_node) is not None:
+                groups.codelist_violations_count += 1
+                if not include_codelist_violations:
+                    continue
+            groups.total_violations += 1
+            
+            constraint_type, normalized_message = classify_message(violation.get('resultMessage'))
+            groups.constraint_types.setdefault(normalized_message, constraint_type)
+            node_type = extract_node_type(violation.get('sourceShape'))
+            result_path = violation.get('resultPath')
+            groups.add_bounded(pool.intern(result_path), normalized_message, node_type, focus_node,
+                               normalize_value(violation.get('value')), violation.get('severity'))
+            
+            property_name = extract_property_name(result_path)
+            groups.component_counts[constraint_type] += 1
+            groups.component_counts_by_property[(constraint_type, property_name)] += 1
+        return groups
     
-    # Use filtered violations for summary generation
-    violations = filtered_violations
+    if include_codelist_violations and violations.excluded_codelist_count:
+        print(f"Warning: {violations.excluded_codelist_count} codelist violation(s) were excluded while parsing "
+              f"and cannot be included", file=sys.stderr)
+    strings = violations.pool.strings
+    groups = ViolationGroups(violations.pool, max_nodes)
+    groups.codelist_violations_count = violations.excluded_codelist_count
     
-    # Group violations by resultPath -> normalizedErrorMessage -> nodeType
-    # Store both normalized message (for grouping) and full messages (for examples)
-    # Also store values, severities, and their associated focus nodes
-    grouped = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: {'focus_nodes': [], 'values': [], 'severities': [], 'full_messages': set()})))
+    # Per-ID classification results
+    codelist_ids = {}
+    message_info = {}
+    node_types = {}
+    property_names = {}
+    normalized_values = {}
     
-    # Count by constraint component (total)
-    component_counts = defaultdict(int)
+    columns = violations.columns
+    for focus_id, message_id, path_id, shape_id, severity_id, value_id in zip(
+            columns['focusNode'], columns['resultMessage'], columns['resultPath'],
+            columns['sourceShape'], columns['severity'], columns['value']):
+        # Filter out violations that belong to imported codelists (unless flag is set)
+        is_codelist = codelist_ids.get(focus_id)
+        if is_codelist is None:
+            focus_node = strings[focus_id]
+            is_codelist = codelist_ids[focus_id] = bool(focus_node) and codelist_match(focus_node) is not None
+        if is_codelist:
+            groups.codelist_violations_count += 1
+            if not include_codelist_violations:
+                continue
+        groups.total_violations += 1
+        
+        info = message_info.get(message_id)
+        if info is None:
+            info = message_info[message_id] = classify_message(strings[message_id])
+            groups.constraint_types.setdefault(info[1], info[0])
+        constraint_type, normalized_message = info
+        
+        node_type = node_types.get(shape_id)
+        if node_type is None:
+            node_type = node_types[shape_id] = extract_node_type(strings[shape_id])
+        
+        value = normalized_values.get(value_id)
+        if value is None:
+            value = normalized_values[value_id] = normalize_value(strings[value_id])
+        
+        groups.add_bounded(path_id, normalized_message, node_type, strings[focus_id], value, strings[severity_id])
+        
+        property_name = property_names.get(path_id)
+        if property_name is None:
+            property_name = property_names[path_id] = extract_property_name(strings[path_id])
+        
+        groups.component_counts[constraint_type] += 1
+        groups.component_counts_by_property[(constraint_type, property_name)] += 1
     
-    # Count by constraint component and property (for subtotals)
-    component_counts_by_property = defaultdict(lambda: defaultdict(int))
+    return groups
+
+def group_report_streaming(input_file, include_codelist_violations=False, max_nodes=None, profiler=NULL_PROFILER,
+                           codelist_domains=CODELIST_DOMAINS):
+    """
+    Group a report in bounded summary mode while the native streaming reader reads it,
+    without storing its violations (see _group_violations_bounded).
     
-    # Extract node types and group
-    for v in violations:
-        node_type = extract_node_type(v.get('sourceShape'))
-        result_path = v.get('resultPath', 'Unknown')
-        result_message = v.get('resultMessage', 'Unknown')
-        normalized_message = normalize_error_message(result_message)
-        constraint_type = extract_constraint_type(result_message)
-        value = normalize_value(v.get('value'))  # Normalize value to replace file:// URIs
-        severity = v.get('severity')
+    Args:
+        input_file: Path to the validation report
+        include_codelist_violations: If True, keep violations from codelists
+        max_nodes: Bounded summary mode limit (see BoundedGroup)
+        profiler: StageProfiler (optional)
+        codelist_domains: Domains of imported codelists (see compile_codelist_matcher)
         
-        # Group by normalized message, but store full message for reference
-        grouped[result_path][normalized_message][node_type]['focus_nodes'].append(v.get('focusNode'))
-        grouped[result_path][normalized_message][node_type]['values'].append(value)
-        grouped[result_path][normalized_message][node_type]['severities'].append(severity)
-        grouped[result_path][normalized_message][node_type]['full_messages'].add(result_message)
+    Returns:
+        ViolationGroups
         
-        # Count by constraint type (total)
-        component_counts[constraint_type] += 1
+    Raises:
+        ReportSyntaxError: If the native reader cannot parse the report
+    """
+    print(f"Streaming validation report: {input_file}")
+    with profiler.stage('parse+group') as stage:
+        groups = _group_violations_bounded(iter_validation_results(input_file), include_codelist_violations,
+                                           max_nodes, codelist_domains)
+        stage['items'] = groups.total_violations + groups.codelist_violations_count
+        stage['kept'] = groups.total_violations
+        stage['groups'] = len(groups.groups)
+    print(f"Found {groups.total_violations + groups.codelist_violations_count} violations")
+    return groups
+
+def _ntriples_subject(line):
+    """Return the subject term of an N-Triples line (bytes), or None for blank/comment lines."""
+    stripped = line.strip()
+    if not stripped or stripped.startswith(b'#'):
+        return None
+    return stripped.split(None, 1)[0]
+
+def ntriples_shard_offsets(file_path, shards):
+    """
+    Split an N-Triples file into byte ranges for parallel parsing.
+    
+    Each boundary is moved forward to the start of a line, and then past any
+    lines that share the subject of that line, so that all triples of a
+    validation result (which Jena writes on consecutive lines) fall in the
+    same shard. Files that are not grouped by subject are detected by
+    group_report_sharded.
+    
+    Args:
+        file_path: Path to the N-Triples report
+        shards: Requested number of shards
         
-        # Count by constraint type and property (for subtotals)
-        property_name = extract_property_name(result_path)
-        component_counts_by_property[constraint_type][property_name] += 1
+    Returns:
+        Sorted list of offsets [0, ..., file size]; shard i is offsets[i]:offsets[i + 1]
+    """
+    size = os.path.getsize(file_path)
+    offsets = [0]
+    with open(file_path, 'rb') as f:
+        for shard in range(1, shards):
+            target = max(size * shard // shards, offsets[-1])
+            if target >= size:
+                break
+            f.seek(target)
+            if target > 0:
+                f.seek(target - 1)
+                if f.read(1) != b'\n':
+                    f.readline()  # Skip the rest of a partial line
+            offset = f.tell()
+            first_subject = None
+            while True:
+                line = f.readline()
+                if not line:
+                    offset = size
+                    break
+                subject = _ntriples_subject(line)
+                if subject is not None:
+                    if first_subject is None:
+                        first_subject = subject
+                    elif subject != first_subject:
+                        break
+                offset = f.tell()
+            if offset > offsets[-1] and offset < size:
+                offsets.append(offset)
+    offsets.append(size)
+    return offsets
+
+def _iter_byte_range_lines(f, start, end):
+    f.seek(start)
+    position = start
+    while position < end:
+        line = f.readline()
+        if not line:
+            break
+        position += len(line)
+        yield line.decode('utf-8')
+
+def _subject_digest(subject):
+    """Return a 64-bit digest of a subject, stable across processes (unlike hash())."""
+    return int.from_bytes(hashlib.blake2b(subject.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def _group_ntriples_shard(args):
+    """
+    Process pool entry point (map step): parse one byte range and group its violations.
+    Returns (ViolationGroups, digests of the result subjects seen in the shard).
+    """
+    file_path, start, end, include_codelist_violations, max_nodes, codelist_domains = args
+    closed = set()
+    with open(file_path, 'rb') as f:
+        events = _iter_ntriples_events(_iter_byte_range_lines(f, start, end))
+        groups = group_violations(_assemble_violations(events, closed), include_codelist_violations, max_nodes,
+                                  codelist_domains)
+    return groups, {_subject_digest(subject) for subject in closed}
+
+def group_report_sharded(file_path, shards, include_codelist_violations=False, max_nodes=None,
+                         profiler=NULL_PROFILER, codelist_domains=CODELIST_DOMAINS):
+    """
+    Map-reduce parsing of a large N-Triples report across worker processes.
+    
+    The file is split at subject boundaries into byte-range shards (see
+    ntriples_shard_offsets). Each worker parses its shard and builds partial
+    ViolationGroups (groups plus the constraint component and property
+    counters); the partial results are then merged. The summary written from
+    the merged groups is identical to the single-process one.
+    
+    This relies on the triples of each result being on consecutive lines. Each
+    shard rejects a subject that reappears after it was closed, and the shards
+    report the subjects they saw, so a result split across shards is detected
+    as well; the report is then not grouped at all.
+    
+    Args:
+        file_path: Path to the N-Triples report
+        shards: Number of shards (and worker processes)
+        include_codelist_violations: If True, keep violations from codelists
+        max_nodes: Bounded mode limit (see group_violations)
+        profiler: StageProfiler recording the 'parse+group' (map) and 'merge' (reduce) stages (optional)
+        codelist_domains: Domains of imported codelists (see compile_codelist_matcher)
+        
+    Returns:
+        ViolationGroups
+        
+    Raises:
+        ReportSyntaxError: If the triples of a result are not on consecutive lines
+            (the caller falls back to single-process parsing)
+    """
+    offsets = ntriples_shard_offsets(file_path, shards)
+    shard_args = [(file_path, start, end, include_codelist_violations, max_nodes, tuple(codelist_domains))
+                  for start, end in zip(offsets, offsets[1:])]
+    print(f"Parsing validation report in {len(shard_args)} shard(s): {file_path}")
+    
+    with profiler.stage('parse+group', len(shard_args)):
+        if len(shard_args) == 1:
+            partials = list(map(_group_ntriples_shard, shard_args))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=len(shard_args)) as executor:
+                partials = list(executor.map(_group_ntriples_shard, shard_args))
+    
+    # A result whose triples ended up in several shards was counted more than once
+    seen = set()
+    for _, subjects in partials:
+        if not seen.isdisjoint(subjects):
+            raise ReportSyntaxError("Triples of a result are split across shards (not grouped by subject)")
+        seen |= subjects
+    
+    # Reduce step
+    with profiler.stage('merge') as stage:
+        groups = ViolationGroups(StringPool(), max_nodes)
+        for partial, _ in partials:
+            groups.merge(partial)
+        stage['items'] = len(groups.groups)
+    found = groups.total_violations
+    if not include_codelist_violations:
+        found += groups.codelist_violations_count
+    print(f"Found {found} violations")
+    return groups
+
+def generate_summary(violations, output_file, include_codelist_violations=False, command=None, node_type_counts=None,
+                     max_nodes=None, formats=('text',), profiler=NULL_PROFILER, codelist_domains=CODELIST_DOMAINS):
+    """Generate and write the summary report.
+    
+    Args:
+        violations: ViolationStore, or an iterable of violation dictionaries (a list or a generator)
+        output_file: Path to output file
+        include_codelist_violations: If True, include violations from codelists; if False, exclude them (default)
+        command: Original command line string (optional)
+        node_type_counts: Dictionary of node type counts from source data file (optional)
+        max_nodes: If set, list at most this many focus nodes per group, and at most this
+            many values per focus node; counts stay exact and the omitted entries are
+            reported as "... N more ... not shown" (default: list everything)
+        formats: Output formats to write (see write_summary_outputs)
+        profiler: StageProfiler recording the 'filter+group', 'sort' and 'write' stages (optional)
+        codelist_domains: Domains of imported codelists (see compile_codelist_matcher)
+    """
+    # Filtering out codelist violations and grouping happen in the same pass
+    with profiler.stage('filter+group') as stage:
+        groups = group_violations(violations, include_codelist_violations, max_nodes, codelist_domains)
+        stage['items'] = groups.total_violations
+        if not include_codelist_violations:
+            stage['items'] += groups.codelist_violations_count
+        stage['kept'] = groups.total_violations
+        stage['groups'] = len(groups.groups)
+    write_summary_outputs(groups, output_file, formats, include_codelist_violations, command, node_type_counts,
+                          profiler)
+
+def write_summary(groups, output_file, include_codelist_violations=False, command=None, node_type_counts=None,
+                  ordered_groups=None):
+    """
+    Write the plain text summary for grouped violations (see generate_summary).
+    ordered_groups is the result of sort_groups(groups), computed if not given.
+    """
+    if ordered_groups is None:
+        ordered_groups = sort_groups(groups)
+    strings = groups.pool.strings
+    total_violations = groups.total_violations
+    codelist_violations_count = groups.codelist_violations_count
+    component_counts = groups.component_counts
+    component_counts_by_property = defaultdict(dict)
+    for (comp_type, prop_name), prop_count in groups.component_counts_by_property.items():
+        component_counts_by_property[comp_type][prop_name] = prop_count
     
     # Write summary
     with open(output_file, 'w', encoding='utf-8') as f:
@@ -449,7 +1791,7 @@ def generate_summary(violations, output_file, include_codelist_violations=False,
             f.write("\n")
         
         # Total violations
-        f.write(f"Total Violations: {len(violations)}\n")
+        f.write(f"Total Violations: {total_violations}\n")
         if not include_codelist_violations and codelist_violations_count > 0:
             f.write(f"(Excluded {codelist_violations_count} violation(s) from imported codelists)\n")
         elif include_codelist_violations and codelist_violations_count > 0:
@@ -471,89 +1813,426 @@ def generate_summary(violations, output_file, include_codelist_violations=False,
         f.write("Detailed Violation Breakdown\n")
         f.write("-" * 60 + "\n\n")
         
-        # Sort by resultPath, then by resultMessage, then by nodeType
-        sorted_paths = sorted(grouped.items())
-        
-        for result_path, messages_dict in sorted_paths:
-            property_name = extract_property_name(result_path)
-            f.write(f"Property: {property_name}\n")
-            f.write("=" * 60 + "\n")
-            
-            sorted_messages = sorted(messages_dict.items())
+        # Groups are sorted by resultPath, then by resultMessage, then by nodeType
+        current_path = current_message = _NO_GROUP
+        for result_path, normalized_message, node_type, group in ordered_groups:
+            if result_path != current_path:
+                if current_path is not _NO_GROUP:
+                    f.write("\n")
+                current_path, current_message = result_path, _NO_GROUP
+                property_name = extract_property_name(result_path)
+                f.write(f"Property: {property_name}\n")
+                f.write("=" * 60 + "\n")
             
-            for normalized_message, node_types_dict in sorted_messages:
+            if normalized_message != current_message:
+                current_message = normalized_message
                 f.write(f"\n  Error Message: {normalized_message}\n")
                 f.write("-" * 60 + "\n")
-                
-                sorted_node_types = sorted(node_types_dict.items())
-                
-                for node_type, data in sorted_node_types:
-                    focus_nodes = data['focus_nodes']
-                    values = data['values']
-                    severities = data['severities']
-                    # Filter out None values
-                    valid_nodes = [n for n in focus_nodes if n is not None]
-                    count = len(focus_nodes)
-                    unique_nodes = sorted(set(valid_nodes))
-                    
-                    # Get unique severities for this group and extract clean names
-                    unique_severities = sorted(set([extract_severity_name(s) for s in severities if s is not None]))
-                    severity_display = ", ".join(unique_severities) if unique_severities else "Not specified"
-                    
-                    f.write(f"\n    Node Type: {node_type}\n")
-                    f.write(f"    Count: {count}\n")
-                    f.write(f"    Severity: {severity_display}\n")
-                    f.write(f"    Affected Focus Nodes ({len(unique_nodes)} unique):\n")
-                    
-                    # Create a list of (node, value, severity) tuples for display
-                    node_value_severity_tuples = []
-                    for i, node in enumerate(focus_nodes):
-                        value = values[i] if i < len(values) else None
-                        severity = severities[i] if i < len(severities) else None
-                        node_value_severity_tuples.append((node, value, severity))
-                    
-                    # Group by unique nodes and show their values
-                    node_to_values = {}
-                    for node, value, severity in node_value_severity_tuples:
-                        if node not in node_to_values:
-                            node_to_values[node] = []
-                        if value is not None:
-                            node_to_values[node].append(value)
-                    
-                    for node in unique_nodes:
-                        node_values = node_to_values.get(node, [])
-                        if node_values:
-                            # Show unique values for this node
-                            unique_values = sorted(set(node_values))
-                            if len(unique_values) == 1:
-                                f.write(f"      - {node}\n")
-                                f.write(f"        Value: {unique_values[0]}\n")
-                            else:
-                                f.write(f"      - {node}\n")
-                                f.write(f"        Values ({len(unique_values)} unique):\n")
-                                for val in unique_values:
-                                    f.write(f"          - {val}\n")
-                        else:
-                            f.write(f"      - {node}\n")
-                            f.write(f"        Value: (not specified)\n")
-                    
-                    f.write("\n")
-                
+            
+            if isinstance(group, BoundedGroup):
+                _write_bounded_group(f, node_type, group)
+            else:
+                _write_group(f, node_type, group, strings)
+        if current_path is not _NO_GROUP:
             f.write("\n")
     
     print(f"Summary written to: {output_file}")
 
+def _write_group(f, node_type, group, strings):
+    """Write the details of one node type group of the summary."""
+    focus_ids, value_ids, severity_ids, _ = group
+    focus_nodes = [strings[i] for i in focus_ids]
+    values = [strings[i] for i in value_ids]
+    severities = [strings[i] for i in severity_ids]
+    # Filter out None values
+    valid_nodes = [n for n in focus_nodes if n is not None]
+    count = len(focus_nodes)
+    unique_nodes = sorted(set(valid_nodes))
+    
+    # Get unique severities for this group and extract clean names
+    unique_severities = sorted(set([extract_severity_name(s) for s in severities if s is not None]))
+    severity_display = ", ".join(unique_severities) if unique_severities else "Not specified"
+    
+    f.write(f"\n    Node Type: {node_type}\n")
+    f.write(f"    Count: {count}\n")
+    f.write(f"    Severity: {severity_display}\n")
+    f.write(f"    Affected Focus Nodes ({len(unique_nodes)} unique):\n")
+    
+    # Create a list of (node, value, severity) tuples for display
+    node_value_severity_tuples = []
+    for i, node in enumerate(focus_nodes):
+        value = values[i] if i < len(values) else None
+        severity = severities[i] if i < len(severities) else None
+        node_value_severity_tuples.append((node, value, severity))
+    
+    # Group by unique nodes and show their values
+    node_to_values = {}
+    for node, value, severity in node_value_severity_tuples:
+        if node not in node_to_values:
+            node_to_values[node] = []
+        if value is not None:
+            node_to_values[node].append(value)
+    
+    for node in unique_nodes:
+        node_values = node_to_values.get(node, [])
+        if node_values:
+            # Show unique values for this node
+            unique_values = sorted(set(node_values))
+            if len(unique_values) == 1:
+                f.write(f"      - {node}\n")
+                f.write(f"        Value: {unique_values[0]}\n")
+            else:
+                f.write(f"      - {node}\n")
+                f.write(f"        Values ({len(unique_values)} unique):\n")
+                for val in unique_values:
+                    f.write(f"          - {val}\n")
+        else:
+            f.write(f"      - {node}\n")
+            f.write(f"        Value: (not specified)\n")
+    
+    f.write("\n")
+
+def _write_bounded_group(f, node_type, group):
+    """Write the details of one BoundedGroup (same layout as _write_group, with "not shown" markers)."""
+    unique_severities = sorted(set([extract_severity_name(s) for s in group.severities]))
+    severity_display = ", ".join(unique_severities) if unique_severities else "Not specified"
+    
+    f.write(f"\n    Node Type: {node_type}\n")
+    f.write(f"    Count: {group.count}\n")
+    f.write(f"    Severity: {severity_display}\n")
+    if group.nodes_truncated:
+        f.write(f"    Affected Focus Nodes (showing first {len(group.sorted_nodes)}):\n")
+    else:
+        f.write(f"    Affected Focus Nodes ({len(group.sorted_nodes)} unique):\n")
+    
+    for focus_node in group.sorted_nodes:
+        node = group.nodes[focus_node]
+        values = node.sorted_values
+        f.write(f"      - {focus_node}\n")
+        if not values:
+            f.write(f"        Value: (not specified)\n")
+        elif len(values) == 1 and not node.values_truncated:
+            f.write(f"        Value: {values[0]}\n")
+        else:
+            if node.values_truncated:
+                f.write(f"        Values (showing first {len(values)}):\n")
+            else:
+                f.write(f"        Values ({len(values)} unique):\n")
+            for val in values:
+                f.write(f"          - {val}\n")
+            if node.hidden_values:
+                f.write(f"          ... {node.hidden_values} more value occurrence(s) not shown\n")
+    if group.hidden_violations:
+        f.write(f"      ... {group.hidden_violations} more violation(s) on other focus nodes not shown\n")
+    
+    f.write("\n")
+
+def sort_groups(groups):
+    """Return [(resultPath, normalized message, node type, group), ...] in summary order."""
+    ordered_groups = []
+    for result_path, messages_dict in sorted(groups.nested().items()):
+        for normalized_message, node_types_dict in sorted(messages_dict.items()):
+            for node_type, group in sorted(node_types_dict.items()):
+                ordered_groups.append((result_path, normalized_message, node_type, group))
+    return ordered_groups
+
+def group_record(groups, result_path, normalized_message, node_type, group):
+    """
+    Return one group as a JSON-serializable dictionary (one line of the JSON Lines output).
+    
+    Focus nodes and values are listed as in the text summary. uniqueFocusNodes is
+    None when the listing was cut by the bounded mode; hiddenViolations and
+    hiddenValues count the violations and value occurrences that are not listed.
+    """
+    record = {
+        'property': extract_property_name(result_path),
+        'resultPath': result_path,
+        'constraintType': groups.constraint_types.get(normalized_message),
+        'message': normalized_message,
+        'nodeType': node_type,
+    }
+    if isinstance(group, BoundedGroup):
+        severities = group.severities
+        focus_nodes = [{'node': focus_node,
+                        'values': group.nodes[focus_node].sorted_values,
+                        'hiddenValues': group.nodes[focus_node].hidden_values}
+                       for focus_node in group.sorted_nodes]
+        record['count'] = group.count
+        record['uniqueFocusNodes'] = None if group.nodes_truncated else len(focus_nodes)
+        record['hiddenViolations'] = group.hidden_violations
+    else:
+        strings = groups.pool.strings
+        focus_ids, value_ids, severity_ids, _ = group
+        severities = set(strings[i] for i in severity_ids if i)
+        node_to_values = defaultdict(set)
+        for focus_id, value_id in zip(focus_ids, value_ids):
+            if focus_id:
+                values = node_to_values[strings[focus_id]]
+                if value_id:
+                    values.add(strings[value_id])
+        focus_nodes = [{'node': focus_node, 'values': sorted(node_to_values[focus_node]), 'hiddenValues': 0}
+                       for focus_node in sorted(node_to_values)]
+        record['count'] = len(focus_ids)
+        record['uniqueFocusNodes'] = len(focus_nodes)
+        record['hiddenViolations'] = 0
+    record['severities'] = sorted(set(extract_severity_name(s) for s in severities))
+    record['focusNodes'] = focus_nodes
+    return record
+
+def aggregate_counts(groups):
+    """Return sorted (constraint type, property, node type, count) rows for the grouped violations."""
+    counts = Counter()
+    strings = groups.pool.strings
+    for (path_id, normalized_message, node_type), group in groups.groups.items():
+        count = group.count if isinstance(group, BoundedGroup) else len(group[0])
+        constraint_type = groups.constraint_types.get(normalized_message)
+        counts[(constraint_type, extract_property_name(strings[path_id]), node_type)] += count
+    return [key + (count,) for key, count in sorted(counts.items(), key=lambda x: tuple(str(k) for k in x[0]))]
+
+def write_summary_jsonl(groups, output_file, ordered_groups=None):
+    """Write one JSON object per group (see group_record), one group at a time."""
+    if ordered_groups is None:
+        ordered_groups = sort_groups(groups)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for result_path, normalized_message, node_type, group in ordered_groups:
+            record = group_record(groups, result_path, normalized_message, node_type, group)
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    print(f"JSON Lines summary written to: {output_file}")
+
+def write_summary_csv(groups, output_file):
+    """Write the aggregate counts by constraint type, property and node type as CSV."""
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(COUNT_COLUMNS)
+        writer.writerows(aggregate_counts(groups))
+    print(f"CSV counts written to: {output_file}")
+
+def write_summary_parquet(groups, output_file):
+    """Write the aggregate counts as Parquet. Requires pyarrow (optional); skipped with a warning without it."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("Warning: pyarrow is not installed; skipping Parquet output (pip install pyarrow)", file=sys.stderr)
+        return
+    rows = aggregate_counts(groups)
+    table = pa.table({column: [row[i] for row in rows] for i, column in enumerate(COUNT_COLUMNS)})
+    pq.write_table(table, output_file)
+    print(f"Parquet counts written to: {output_file}")
+
+def summary_output_path(output_file, output_format):
+    """
+    Return the path of a summary output format, derived from the text summary path:
+    x_summary.txt -> x_summary.txt / x_summary.jsonl / x_summary_counts.csv / x_summary_counts.parquet
+    """
+    if output_format == 'text':
+        return output_file
+    base = os.path.splitext(output_file)[0]
+    if output_format == 'jsonl':
+        return base + '.jsonl'
+    return f"{base}_counts.{output_format}"
+
+def write_summary_outputs(groups, output_file, formats=('text',), include_codelist_violations=False,
+                          command=None, node_type_counts=None, profiler=NULL_PROFILER):
+    """
+    Write the grouped violations in each requested format (see SUMMARY_FORMATS).
+    The text summary is written to output_file; the other formats next to it
+    (see summary_output_path).
+    """
+    ordered_groups = None
+    if 'text' in formats or 'jsonl' in formats:
+        with profiler.stage('sort', len(groups.groups)):
+            ordered_groups = sort_groups(groups)
+    
+    for output_format in formats:
+        path = summary_output_path(output_file, output_format)
+        with profiler.stage(f'write-{output_format}', len(groups.groups)):
+            if output_format == 'text':
+                write_summary(groups, path, include_codelist_violations, command, node_type_counts, ordered_groups)
+            elif output_format == 'jsonl':
+                write_summary_jsonl(groups, path, ordered_groups)
+            elif output_format == 'csv':
+                write_summary_csv(groups, path)
+            elif output_format == 'parquet':
+                write_summary_parquet(groups, path)
+            else:
+                print(f"Warning: Unknown summary format: {output_format}", file=sys.stderr)
+
+def default_summary_path(report_file):
+    """Return the default summary path for a report: report-x.ttl -> report-x_summary.txt"""
+    base, ext = os.path.splitext(report_file)
+    if ext.lower() in ('.ttl', '.nt'):
+        return base + '_summary.txt'
+    return report_file + '_summary.txt'
+
+def summarize_report(input_file, output_file=None, include_codelist_violations=False, command=None,
+                     node_type_counts=None, parser='auto', cache_dir=None,
+                     cache_max_bytes=PARSED_CACHE_MAX_BYTES, shards=1, max_nodes=None, formats=('text',),
+                     profile=False, codelist_domains=CODELIST_DOMAINS):
+    """
+    Parse one validation report and write its summary.
+    
+    Args:
+        input_file: Path to the validation report
+        output_file: Path to the summary file (default: see default_summary_path)
+        include_codelist_violations: If True, include violations from codelists in the summary
+        command: Original command line string (optional)
+        node_type_counts: Dictionary of node type counts from source data file (optional)
+        parser: Report parser: 'auto', 'native' or 'rdflib' (see load_violations)
+        cache_dir: Parsed-report cache directory, or None to bypass the cache (see load_violations)
+        cache_max_bytes: Maximum total size of the parsed-report cache
+        shards: Number of worker processes used to parse N-Triples reports
+            (see group_report_sharded); sharded parsing does not use the cache
+        max_nodes: Bounded summary mode limit (see generate_summary); without the cache,
+            the native reader's results are grouped as they are read (see group_report_streaming)
+        formats: Summary output formats (see write_summary_outputs)
+        profile: If True, record per-stage timings and memory (see StageProfiler) and
+            write them to <summary>_profile.json
+        codelist_domains: Domains of imported codelists (see compile_codelist_matcher); unless
+            include_codelist_violations is set, their violations are dropped while parsing
+        
+    Returns:
+        Path to the summary file
+    """
+    if output_file is None:
+        output_file = default_summary_path(input_file)
+    profiler = StageProfiler() if profile else NULL_PROFILER
+    
+    groups = None
+    if shards > 1 and detect_report_format(input_file) == 'nt':
+        try:
+            groups = group_report_sharded(input_file, shards, include_codelist_violations, max_nodes, profiler,
+                                          codelist_domains)
+        except ReportSyntaxError as e:
+            print(f"Warning: Cannot parse '{input_file}' in shards ({e}); parsing it in a single process",
+                  file=sys.stderr)
+    load_parser = parser
+    if groups is None and max_nodes is not None and not cache_dir and parser != 'rdflib':
+        # A bounded summary does not need the stored violations: group them as they are read
+        try:
+            groups = group_report_streaming(input_file, include_codelist_violations, max_nodes, profiler,
+                                            codelist_domains)
+        except (ReportSyntaxError, UnicodeDecodeError) as e:
+            if parser == 'native':
+                raise
+            print(f"Warning: Native reader cannot parse '{input_file}' ({e}); falling back to rdflib",
+                  file=sys.stderr)
+            load_parser = 'rdflib'
+    if groups is not None:
+        print(f"Generating summary...")
+        write_summary_outputs(groups, output_file, formats, include_codelist_violations, command, node_type_counts,
+                              profiler)
+    else:
+        codelist_filter = None if include_codelist_violations else CodelistFilter(codelist_domains)
+        violations = load_violations(input_file, load_parser, cache_dir, cache_max_bytes, profiler, codelist_filter)
+        
+        print(f"Generating summary...")
+        generate_summary(violations, output_file, include_codelist_violations, command, node_type_counts, max_nodes,
+                         formats, profiler, codelist_domains)
+    
+    if profile:
+        profiler.write(os.path.splitext(output_file)[0] + '_profile.json',
+                       report=input_file,
+                       report_bytes=os.path.getsize(input_file),
+                       options={'parser': parser, 'shards': shards, 'cache': cache_dir is not None,
+                                'max_nodes': max_nodes, 'formats': list(formats),
+                                'include_codelist_violations': include_codelist_violations,
+                                'codelist_domains': list(codelist_domains)})
+    return output_file
+
+def find_report_files(paths):
+    """
+    Expand a list of report files and directories into report file paths.
+    Directories (e.g. the validations folder) are searched recursively for
+    Jena reports named report-*.ttl or report-*.nt.
+    
+    Args:
+        paths: List of file and/or directory paths
+        
+    Returns:
+        Sorted list of report file paths (without duplicates)
+    """
+    report_files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, _, file_names in os.walk(path):
+                for file_name in file_names:
+                    if file_name.startswith('report-') and file_name.endswith(('.ttl', '.nt')):
+                        report_files.add(os.path.join(dir_path, file_name))
+        elif os.path.isfile(path):
+            report_files.add(path)
+        else:
+            print(f"Warning: Report file not found: {path}", file=sys.stderr)
+    return sorted(report_files)
+
+def _summarize_report_job(args):
+    """Process pool entry point: summarize one report and report errors instead of raising."""
+    input_file, options = args
+    try:
+        return input_file, summarize_report(input_file, **options), None
+    except Exception as e:
+        return input_file, None, str(e)
+
+def summarize_reports_batch(report_files, jobs=None, **options):
+    """
+    Summarize many reports in one Python process, in parallel across a process pool.
+    Each report gets its own summary file next to it (see default_summary_path).
+    
+    Args:
+        report_files: List of report file paths
+        jobs: Number of worker processes (default: number of CPUs)
+        **options: Keyword arguments passed to summarize_report for every report
+            (include_codelist_violations, command, node_type_counts, parser, ...)
+        
+    Returns:
+        Number of reports that failed
+    """
+    job_args = [(report_file, options) for report_file in report_files]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(job_args)))
+    
+    if jobs == 1:
+        results = map(_summarize_report_job, job_args)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        results = executor.map(_summarize_report_job, job_args)
+    
+    failures = 0
+    try:
+        for input_file, output_file, error in results:
+            if error is not None:
+                failures += 1
+                print(f"Error: Failed to summarize '{input_file}': {error}", file=sys.stderr)
+    finally:
+        if jobs > 1:
+            executor.shutdown()
+    
+    print(f"Summarized {len(job_args) - failures} of {len(job_args)} report(s) using {jobs} worker(s)")
+    return failures
+
 def main():
+    usage = ("Usage: python summarize_shacl_violations.py [--code-violations] [--codelist-domains LIST] [--stream | --rdflib] [--no-cache] "
+             "[--cache-dir DIR] [--cache-size MB] [--shards N] [--max-nodes K] [--formats LIST] [--profile] [--command CMD] <validation_report.ttl> [output.txt]\n"
+             "       python summarize_shacl_violations.py --batch [--jobs N] [options] <report_or_folder>...")
     if len(sys.argv) < 2:
-        print("Usage: python summarize_shacl_violations.py [--code-violations] <validation_report.ttl> [output.txt]")
+        print(usage)
         sys.exit(1)
     
     # Parse command-line arguments
     include_codelist_violations = False
+    parser = 'auto'
+    batch = False
+    jobs = None
+    cache_dir = PARSED_CACHE_DIR
+    cache_max_bytes = PARSED_CACHE_MAX_BYTES
+    shards = 1
+    max_nodes = None
+    formats = ('text',)
+    profile = False
+    codelist_domains = CODELIST_DOMAINS
     command = None
     node_type_counts_str = None
-    input_file = None
-    output_file = None
+    positional = []
     
     i = 1
     while i < len(sys.argv):
@@ -561,6 +2240,74 @@ def main():
         if arg == '--code-violations':
             include_codelist_violations = True
             i += 1
+        elif arg == '--codelist-domains':
+            if i + 1 < len(sys.argv):
+                codelist_domains = tuple(domain.strip() for domain in sys.argv[i + 1].split(',') if domain.strip())
+                i += 2
+            else:
+                print("Error: --codelist-domains requires a value")
+                sys.exit(1)
+        elif arg == '--stream':
+            parser = 'native'
+            i += 1
+        elif arg == '--rdflib':
+            parser = 'rdflib'
+            i += 1
+        elif arg == '--profile':
+            profile = True
+            i += 1
+        elif arg == '--batch':
+            batch = True
+            i += 1
+        elif arg == '--jobs':
+            if i + 1 < len(sys.argv) and sys.argv[i + 1].isdigit() and int(sys.argv[i + 1]) > 0:
+                jobs = int(sys.argv[i + 1])
+                i += 2
+            else:
+                print("Error: --jobs requires a positive number")
+                sys.exit(1)
+        elif arg == '--shards':
+            if i + 1 < len(sys.argv) and sys.argv[i + 1].isdigit() and int(sys.argv[i + 1]) > 0:
+                shards = int(sys.argv[i + 1])
+                i += 2
+            else:
+                print("Error: --shards requires a positive number")
+                sys.exit(1)
+        elif arg == '--max-nodes':
+            if i + 1 < len(sys.argv) and sys.argv[i + 1].isdigit() and int(sys.argv[i + 1]) > 0:
+                max_nodes = int(sys.argv[i + 1])
+                i += 2
+            else:
+                print("Error: --max-nodes requires a positive number")
+                sys.exit(1)
+        elif arg == '--formats':
+            if i + 1 < len(sys.argv):
+                formats = tuple(fmt.strip().lower() for fmt in sys.argv[i + 1].split(',') if fmt.strip())
+                unknown = [fmt for fmt in formats if fmt not in SUMMARY_FORMATS]
+                if not formats or unknown:
+                    print(f"Error: --formats must be a comma-separated list of: {', '.join(SUMMARY_FORMATS)}")
+                    sys.exit(1)
+                i += 2
+            else:
+                print("Error: --formats requires a value")
+                sys.exit(1)
+        elif arg == '--no-cache':
+            cache_dir = None
+            i += 1
+        elif arg == '--cache-dir':
+            if i + 1 < len(sys.argv):
+                cache_dir = sys.argv[i + 1]
+                i += 2
+            else:
+                print("Error: --cache-dir requires a value")
+                sys.exit(1)
+        elif arg == '--cache-size':
+            if i + 1 < len(sys.argv) and sys.argv[i + 1].isdigit():
+                cache_max_bytes = int(sys.argv[i + 1]) * 1024 * 1024
+                i += 2
+            else:
+                print("Error: --cache-size requires a size in MB")
+                sys.exit(1)
         elif arg == '--command':
             if i + 1 < len(sys.argv):
                 command = sys.argv[i + 1]
@@ -575,23 +2322,18 @@ def main():
             else:
                 print("Error: --node-types requires a value")
                 sys.exit(1)
-        elif input_file is None:
-            input_file = arg
-            i += 1
-        elif output_file is None:
-            output_file = arg
-            i += 1
         else:
-            print(f"Warning: Unexpected argument: {arg}")
+            positional.append(arg)
             i += 1
     
-    if input_file is None:
+    if not positional:
         print("Error: Validation report file is required")
-        print("Usage: python summarize_shacl_violations.py [--code-violations] [--command CMD] <validation_report.ttl> [output.txt]")
+        print(usage)
         sys.exit(1)
     
-    if output_file is None:
-        output_file = input_file.replace('.ttl', '_summary.txt')
+    if not batch and len(positional) > 2:
+        for arg in positional[2:]:
+            print(f"Warning: Unexpected argument: {arg}")
     
     # Parse node type counts if provided
     node_type_counts = None
@@ -602,14 +2344,38 @@ def main():
             print(f"Warning: Failed to parse node type counts: {node_type_counts_str}")
             node_type_counts = None
     
-    print(f"Parsing validation report: {input_file}")
-    violations = parse_validation_report(input_file)
-    print(f"Found {len(violations)} violations")
+    options = {
+        'include_codelist_violations': include_codelist_violations,
+        'command': command,
+        'node_type_counts': node_type_counts,
+        'parser': parser,
+        'cache_dir': cache_dir,
+        'cache_max_bytes': cache_max_bytes,
+        'shards': shards,
+        'max_nodes': max_nodes,
+        'formats': formats,
+        'profile': profile,
+        'codelist_domains': codelist_domains,
+    }
     
-    print(f"Generating summary...")
-    generate_summary(violations, output_file, include_codelist_violations, command, node_type_counts)
+    if batch:
+        report_files = find_report_files(positional)
+        if not report_files:
+            print("Error: No validation reports found")
+            sys.exit(1)
+        failures = summarize_reports_batch(report_files, jobs, **options)
+        if failures:
+            sys.exit(1)
+    else:
+        input_file = positional[0]
+        output_file = positional[1] if len(positional) > 1 else None
+        try:
+            summarize_report(input_file, output_file, **options)
+        except ReportSyntaxError as e:
+            print(f"Error: Native reader cannot parse '{input_file}': {e}")
+            print("Run without --stream to fall back to RDFLib, or use --rdflib.")
+            sys.exit(1)
     print("Done!")
 
 if __name__ == '__main__':
     main()
-